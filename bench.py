@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Free State Party — Build Benchmarks
+
+Times the hot paths of build.py against generated fixtures instead of the
+live API: normalize_event(), render_api_event_cards(), _paragraphs_to_html()
+(on up to 1 MB of markdown), build_page(), and, fed by a local stand-in for
+the events API, the streamed fetch_api_events() (at every size, 100000
+included), a full build() and minify_html() over the pages it built (with
+their total size before and after).
+
+Each case runs in its own process, so peak RSS is that case's alone. A case
+is timed untraced (best of up to --repeat runs), then run once more under
+tracemalloc for its peak traced memory and the number of blocks it still
+holds when it returns (its result included).
+
+Runs are compared against a baseline (bench/baseline.json, checked in, by
+default); a case slower, or with a higher peak, than the baseline by more
+than --threshold is flagged and the exit status is 1. After a change that
+is meant to move the numbers, refresh the baseline on an otherwise idle
+machine with `python3 bench.py --save-baseline` and commit it with the
+change. Cases left out with --cases or --sizes keep their old entries.
+
+Usage: python3 bench.py [--sizes 10,1000,100000] [--cases NAME,...] [--repeat N]
+                        [--build-max N] [--baseline FILE] [--save-baseline] [--threshold F]
+"""
+
+import argparse
+import contextlib
+import gc
+import http.server
+import json
+import os
+import random
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import zlib
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+import build
+
+DEFAULT_SIZES = (10, 1000, 100000)
+EVENT_VARIANTS = ('posters', 'no-posters')
+MARKDOWN_VARIANTS = ('about', 'business')
+MARKDOWN_SECTIONS = 200
+# _paragraphs_to_html() also runs on a business.md grown to 1 MB
+LARGE_MARKDOWN = 'business-1mb'
+LARGE_MARKDOWN_BYTES = 1024 * 1024
+BUILD_PAGE_CALLS = 100
+# A full build renders a detail page and an .ics per event; past this many
+# events it is skipped unless --build-max is raised.
+BUILD_MAX_EVENTS = 1000
+# Distinct posters shared across events, as the real API reuses a few
+POSTER_COUNT = 4
+POSTER_SIZE = (600, 900)
+# Fast cases repeat until their timed runs add up to MIN_TIME seconds (at
+# most MAX_RUNS runs); slow ones stop short of --repeat after TIME_BUDGET.
+MIN_TIME = 0.5
+MAX_RUNS = 10000
+TIME_BUDGET = 2.0
+DEFAULT_BASELINE = os.path.join(build.SCRIPT_DIR, 'bench', 'baseline.json')
+DEFAULT_THRESHOLD = 0.15
+
+
+# --- Fixtures ---
+
+_WORDS = ('liberty', 'granite', 'state', 'party', 'saturday', 'dinner', 'build', 'future', 'ambition',
+          'family', 'business', 'culture', 'rocket', 'frontier', 'mountain', 'harbor', 'winter',
+          'election', 'community', 'members', 'tonight', 'together', 'Manchester', 'Concord', 'Keene')
+_EVENT_KINDS = ('Free State Saturday', 'Dinner Talk', 'Members Mixer', 'Porcupine Social', 'Book Club')
+
+
+def _sentence(rng, words=12):
+    text = ' '.join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _png(width, height, rgb):
+    """A solid-colour RGB PNG, without needing Pillow."""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    row = b'\x00' + bytes(rgb) * width
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height, 9))
+            + chunk(b'IEND', b''))
+
+
+def fixture_events(size, posters, seed=0):
+    """size raw API event dicts, half past and half upcoming, every few hours.
+    Titles repeat, so slugs need suffixes; some fields are empty or absent."""
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) - timedelta(hours=5 * (size // 2))
+    events = []
+    for i in range(size):
+        starts_at = start + timedelta(hours=5 * i)
+        event = {
+            'title': f'{_EVENT_KINDS[i % len(_EVENT_KINDS)]} #{i % 500}',
+            'description': '\n\n'.join(_sentence(rng) for _ in range(i % 4)),
+            'startsAt': starts_at.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            'endsAt': (starts_at + timedelta(hours=3)).strftime('%Y-%m-%dT%H:%M:%S.000Z') if i % 7 else '',
+            'location': f'{100 + i % 900} Elm Street, {rng.choice(_WORDS[-3:])} NH' if i % 3 else '',
+            'rsvpUrl': f'/rsvp/event-{i}' if i % 2 else f'https://app.freestate.party/rsvp/event-{i}',
+            'updatedAt': starts_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        }
+        if posters:
+            event['posterUrl'] = f'/api/uploads/posters/poster-{i % POSTER_COUNT}.png'
+        events.append(event)
+    return events
+
+
+def fixture_markdown(kind, sections=MARKDOWN_SECTIONS, seed=0, min_bytes=0):
+    """A content/<kind>.md with metadata and many H2 sections, more than
+    sections if needed to reach min_bytes. business sections also carry
+    links, emphasis and escapes."""
+    rng = random.Random(seed)
+    lines = [f'title: {kind.title()} — Free State Party', f'description: {_sentence(rng)}', f'h1: {kind.title()}']
+    if kind == 'business':
+        lines.append('noindex: true')
+    size = 0
+    n = 0
+    while n < sections or size < min_bytes:
+        section = ['', f'## {_sentence(rng, 4)[:-1]} {n}']
+        for _ in range(rng.randint(2, 6)):
+            paragraph = _sentence(rng, rng.randint(10, 60))
+            if kind == 'business':
+                paragraph += (f' Reach **{rng.choice(_WORDS)}** via [@freestatepty](https://x.com/freestatepty)'
+                              f' — *{rng.choice(_WORDS)}* \\*not\\* ***{rng.choice(_WORDS)}***.')
+            section += ['', paragraph]
+        lines += section
+        size += sum(len(line.encode('utf-8')) + 1 for line in section)
+        n += 1
+    return '\n'.join(lines) + '\n'
+
+
+def write_fixtures(root, sizes):
+    """Write everything the cases read under root:
+    api/events-<size>-<variant>.json, api/posters/, content/ (the real
+    content with large about.md and business.md, plus LARGE_MARKDOWN) and
+    site/img (the source images)."""
+    api_dir = os.path.join(root, 'api')
+    os.makedirs(os.path.join(api_dir, 'posters'))
+    for size in sizes:
+        for variant in EVENT_VARIANTS:
+            with open(os.path.join(api_dir, f'events-{size}-{variant}.json'), 'w', encoding='utf-8') as f:
+                json.dump(fixture_events(size, variant == 'posters'), f)
+    for n in range(POSTER_COUNT):
+        with open(os.path.join(api_dir, 'posters', f'poster-{n}.png'), 'wb') as f:
+            f.write(_png(*POSTER_SIZE, (40 * n, 160, 23)))
+
+    shutil.copytree(build.CONTENT_DIR, os.path.join(root, 'content'))
+    for kind in MARKDOWN_VARIANTS:
+        with open(os.path.join(root, 'content', f'{kind}.md'), 'w', encoding='utf-8') as f:
+            f.write(fixture_markdown(kind))
+    with open(os.path.join(root, 'content', f'{LARGE_MARKDOWN}.md'), 'w', encoding='utf-8') as f:
+        f.write(fixture_markdown('business', min_bytes=LARGE_MARKDOWN_BYTES))
+    shutil.copytree(os.path.join(build.SITE_DIR, 'img'), os.path.join(root, 'site-src', 'img'),
+                    ignore=lambda directory, names: [
+                        name for name in names
+                        if os.path.relpath(os.path.join(directory, name), build.SITE_DIR).replace(os.sep, '/')
+                        in (build.IMAGE_VARIANT_DIR, build.POSTER_DIR)])
+
+
+def load_fixture_events(root, size, variant):
+    with open(os.path.join(root, 'api', f'events-{size}-{variant}.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_fixture_markdown(root, kind):
+    with open(os.path.join(root, 'content', f'{kind}.md'), encoding='utf-8') as f:
+        return f.read()
+
+
+# --- Stand-in API ---
+
+class _APIHandler(http.server.BaseHTTPRequestHandler):
+    """Serves /api/public/events from one fixture file and the fixture
+    posters, with ETags so conditional requests get a 304."""
+
+    routes = {}
+
+    def do_GET(self):
+        path = self.routes.get(self.path.split('?', 1)[0])
+        if path is None:
+            self.send_error(404)
+            return
+        with open(path, 'rb') as f:
+            body = f.read()
+        etag = f'"{zlib.crc32(body):08x}-{len(body)}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json' if path.endswith('.json') else 'image/png')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def stand_in_api(root, size, variant):
+    """Serve the fixture API on a free local port and point build.API_BASE at it."""
+    routes = {'/api/public/events': os.path.join(root, 'api', f'events-{size}-{variant}.json')}
+    for n in range(POSTER_COUNT):
+        routes[f'/api/uploads/posters/poster-{n}.png'] = os.path.join(root, 'api', 'posters', f'poster-{n}.png')
+    handler = type('Handler', (_APIHandler,), {'routes': routes})
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = build.API_BASE
+    build.API_BASE = f'http://127.0.0.1:{server.server_address[1]}'
+    try:
+        yield
+    finally:
+        build.API_BASE = api_base
+        server.shutdown()
+        server.server_close()
+
+
+# --- Cases ---
+# Each case is prepared once per process: prepare(root, size, variant)
+# returns (setup, run, units, unit), plus a dict of figures for the report
+# if it has any. setup() runs untimed before every run; run(setup()) is
+# what gets measured.
+
+def _prepare_normalize_event(root, size, variant):
+    raw = load_fixture_events(root, size, variant)
+    return (lambda: raw), (lambda raw: [build.normalize_event(event) for event in raw]), size, 'events'
+
+
+def _prepare_render_api_event_cards(root, size, variant):
+    events = build.normalize_events(load_fixture_events(root, size, variant))
+    if variant == 'posters':
+        events = tuple(event._replace(poster_path=f'{build.POSTER_DIR}/poster.png') for event in events)
+    return (lambda: events), build.render_api_event_cards, size, 'events'
+
+
+def _prepare_paragraphs_to_html(root, size, variant):
+    text = read_fixture_markdown(root, variant)
+    return (lambda: text), build._paragraphs_to_html, len(text.encode('utf-8')), 'bytes'
+
+
+def _prepare_build_page(root, size, variant):
+    doc = build.parse_content(read_fixture_markdown(root, variant))
+    template = build.load_template(os.path.join(build.TEMPLATE_DIR, 'base.html'))
+    content = ''.join(f'<section><h2>{title}</h2>{body}</section>' for title, body in doc.sections)
+
+    def run(content):
+        for _ in range(BUILD_PAGE_CALLS):
+            html = build.build_page(template, doc.meta['title'], doc.meta['description'], doc.meta['title'],
+                                    content, active_nav='about', is_subdir=True, og_url=f'{build.BASE_URL}/about/')
+        return html
+
+    return (lambda: content), run, BUILD_PAGE_CALLS, 'pages'
+
+
+def _prepare_fetch_api_events(root, size, variant):
+    """A cold fetch: the events stream from the stand-in API into an empty
+    HTTP cache and through normalize_events()."""
+    def setup():
+        build.CACHE_DIR = os.path.join(root, 'cache')
+        shutil.rmtree(build.CACHE_DIR, ignore_errors=True)
+
+    def run(_):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return build.fetch_api_events()[0]
+
+    return setup, run, size, 'events'
+
+
+def _use_fixture_tree(root, site_dir):
+    build.SITE_DIR = site_dir
+    build.CACHE_DIR = os.path.join(root, 'cache')
+    build.CONTENT_DIR = os.path.join(root, 'content')
+
+
+def _fresh_tree(root):
+    site_dir = os.path.join(root, 'site')
+    shutil.rmtree(site_dir, ignore_errors=True)
+    shutil.rmtree(os.path.join(root, 'cache'), ignore_errors=True)
+    shutil.copytree(os.path.join(root, 'site-src'), site_dir)
+    return site_dir
+
+
+def _quiet_build(jobs):
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return build.build(jobs=jobs)
+
+
+def _prepare_build(root, size, variant, jobs=1):
+    """A cold build: empty HTTP cache, no manifest, only source images in site/."""
+    def setup():
+        _use_fixture_tree(root, _fresh_tree(root))
+    return setup, lambda _: _quiet_build(jobs), size, 'events'
+
+
+def _prepare_rebuild(root, size, variant, jobs=1):
+    """A no-op build straight after a cold one: the API answers 304 and
+    every page is skipped."""
+    _use_fixture_tree(root, _fresh_tree(root))
+    _quiet_build(jobs)
+    return (lambda: None), lambda _: _quiet_build(jobs), size, 'events'
+
+
+def _prepare_minify_html(root, size, variant, jobs=1):
+    """minify_html() over every page of an unminified build."""
+    _use_fixture_tree(root, _fresh_tree(root))
+    _quiet_build(jobs)
+    pages = []
+    for directory, _, names in os.walk(build.SITE_DIR):
+        pages += [build.read_file(os.path.join(directory, name)) for name in sorted(names) if name.endswith('.html')]
+
+    def run(pages):
+        return [build.minify_html(html) for html in pages]
+
+    before = sum(len(html.encode('utf-8')) for html in pages)
+    after = sum(len(html.encode('utf-8')) for html in run(pages))
+    return (lambda: pages), run, before, 'bytes', {'pages': len(pages), 'bytes_before': before, 'bytes_after': after}
+
+
+# api: the case runs against the stand-in API. full_build: it runs (or
+# first needs) a whole build(), so is skipped past --build-max events.
+Case = namedtuple('Case', ['name', 'prepare', 'variants', 'sized', 'api', 'full_build'])
+
+CASES = [
+    Case('normalize_event', _prepare_normalize_event, EVENT_VARIANTS, True, False, False),
+    Case('render_api_event_cards', _prepare_render_api_event_cards, EVENT_VARIANTS, True, False, False),
+    Case('_paragraphs_to_html', _prepare_paragraphs_to_html, MARKDOWN_VARIANTS + (LARGE_MARKDOWN,), False, False, False),
+    Case('build_page', _prepare_build_page, MARKDOWN_VARIANTS, False, False, False),
+    Case('fetch_api_events', _prepare_fetch_api_events, EVENT_VARIANTS, True, True, False),
+    Case('build', _prepare_build, EVENT_VARIANTS, True, True, True),
+    Case('rebuild', _prepare_rebuild, EVENT_VARIANTS, True, True, True),
+    Case('minify_html', _prepare_minify_html, EVENT_VARIANTS, True, True, True),
+]
+CASES_BY_NAME = {case.name: case for case in CASES}
+
+
+def measure(setup, run, repeat, collect=False):
+    """Best wall time of repeat runs (more for fast cases, fewer once
+    TIME_BUDGET is spent), then one traced run. As timeit does, the timed
+    runs have the garbage collector off unless collect is true.
+    Returns a dict of seconds, runs, tracemalloc_peak (bytes) and blocks."""
+    best = None
+    spent = 0.0
+    runs = 0
+    gc.collect()
+    if not collect:
+        gc.disable()
+    try:
+        while (runs == 0 or (runs < repeat and spent < TIME_BUDGET)
+               or (spent < MIN_TIME and runs < MAX_RUNS)):
+            arg = setup()
+            started = time.perf_counter()
+            run(arg)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+            spent += elapsed
+            runs += 1
+    finally:
+        gc.enable()
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return {'seconds': best, 'runs': runs, 'tracemalloc_peak': peak, 'blocks': blocks}
+
+
+def run_case(root, name, size, variant, repeat, jobs):
+    """Measure one case in this process. Returns its result record."""
+    case = CASES_BY_NAME[name]
+    kwargs = {'jobs': jobs} if case.full_build else {}
+    if case.api:
+        with stand_in_api(root, size, variant):
+            setup, run, units, unit, *extra = case.prepare(root, size, variant, **kwargs)
+            # Cases that hit the API are timed as they really run, collector included
+            result = measure(setup, run, repeat, collect=True)
+    else:
+        setup, run, units, unit, *extra = case.prepare(root, size, variant)
+        result = measure(setup, run, repeat)
+    for figures in extra:
+        result.update(figures)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result.update(units=units, unit=unit, peak_rss=rss if sys.platform == 'darwin' else rss * 1024)
+    return result
+
+
+def case_key(name, size, variant):
+    return f'{name}/{size}/{variant}' if size is not None else f'{name}/{variant}'
+
+
+def plan(case_names, sizes, build_max):
+    """(name, size, variant) for every case to run, in CASES order."""
+    runs = []
+    for case in CASES:
+        if case.name not in case_names:
+            continue
+        for size in (sizes if case.sized else (None,)):
+            if case.full_build and size > build_max:
+                continue
+            for variant in case.variants:
+                runs.append((case.name, size, variant))
+    return runs
+
+
+def run_in_subprocess(root, name, size, variant, repeat, jobs):
+    """Run one case in a fresh interpreter, so its peak RSS is its own."""
+    command = [sys.executable, os.path.abspath(__file__), '--run-case', root, name,
+               str(size if size is not None else 0), variant, '--repeat', str(repeat), '--jobs', str(jobs)]
+    # A fixed hash seed keeps dict and set layouts the same from run to run
+    env = {**os.environ, 'PYTHONHASHSEED': '0'}
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE, text=True, env=env).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+# --- Report ---
+
+def _bytes(n):
+    return f'{n / (1024 * 1024):.1f} MB'
+
+
+def _rate(units, seconds, unit):
+    rate = units / seconds if seconds else float('inf')
+    if unit == 'bytes':
+        return f'{rate / (1024 * 1024):,.1f} MB/s'
+    return f'{rate:,.0f} {unit}/s'
+
+
+def compare(result, base, threshold):
+    """Regressions of result against base: [(metric, ratio)] for each of
+    seconds, peak_rss and tracemalloc_peak that grew by more than threshold."""
+    regressions = []
+    for metric in ('seconds', 'peak_rss', 'tracemalloc_peak'):
+        if base.get(metric) and result[metric] > base[metric] * (1 + threshold):
+            regressions.append((metric, result[metric] / base[metric]))
+    return regressions
+
+
+def print_report(results, baseline, threshold):
+    """Print the results table; returns the number of regressed cases."""
+    width = max([len(key) for key in results] + [4])
+    print(f"\n  {'case':<{width}}  {'ms':>10}  {'throughput':>16}  {'peak RSS':>10}  {'traced':>10}  "
+          f"{'blocks':>9}  {'vs baseline':>11}")
+    regressed = 0
+    for key, r in results.items():
+        base = baseline.get(key)
+        if base is None:
+            delta = '-'
+        else:
+            delta = f"{r['seconds'] / base['seconds'] - 1:+.0%}" if base.get('seconds') else '-'
+        regressions = compare(r, base, threshold) if base else []
+        print(f"  {key:<{width}}  {r['seconds'] * 1000:>10.2f}  {_rate(r['units'], r['seconds'], r['unit']):>16}  "
+              f"{_bytes(r['peak_rss']):>10}  {_bytes(r['tracemalloc_peak']):>10}  {r['blocks']:>9}  {delta:>11}"
+              + ('  REGRESSION: ' + ', '.join(f'{metric} x{ratio:.2f}' for metric, ratio in regressions)
+                 if regressions else ''))
+        regressed += bool(regressions)
+    sized = {key: r for key, r in results.items() if 'bytes_before' in r}
+    if sized:
+        print()
+    for key, r in sized.items():
+        print(f"  {key}: {r['pages']} pages, {r['bytes_before']:,} -> {r['bytes_after']:,} bytes "
+              f"({r['bytes_after'] / r['bytes_before'] - 1:+.1%}) in {r['seconds'] * 1000:.2f} ms")
+    return regressed
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get('results', {}) if isinstance(data, dict) else {}
+
+
+def save_baseline(path, results):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    build.atomic_write(path, json.dumps({
+        'generated_at': datetime.now(build.EASTERN).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'results': results,
+    }, indent=2) + '\n')
+
+
+def _size_list(value):
+    sizes = []
+    for part in value.split(','):
+        part = part.strip().lower()
+        scale = {'k': 1000, 'm': 1000000}.get(part[-1:], 1)
+        sizes.append(int(part[:-1] if scale > 1 else part) * scale)
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark build.py against generated fixtures.')
+    parser.add_argument('--sizes', type=_size_list, default=list(DEFAULT_SIZES),
+                        help='comma-separated event counts, e.g. 10,1k,100k (default: 10,1k,100k)')
+    parser.add_argument('--cases', default=','.join(case.name for case in CASES),
+                        help='comma-separated cases to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case; fast cases run more, slow ones may run fewer (default 5)')
+    parser.add_argument('--build-max', type=int, default=BUILD_MAX_EVENTS, metavar='N',
+                        help=f'largest size to run the full build cases at (default {BUILD_MAX_EVENTS})')
+    parser.add_argument('--jobs', type=int, default=1, help='build() worker processes for the build cases (default 1)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline file to compare against / save to')
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'fractional slowdown or memory growth flagged as a regression (default {DEFAULT_THRESHOLD})')
+    parser.add_argument('--run-case', nargs=4, metavar=('ROOT', 'CASE', 'SIZE', 'VARIANT'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        root, name, size, variant = args.run_case
+        print(json.dumps(run_case(root, name, int(size), variant, args.repeat, args.jobs)))
+        return 0
+
+    case_names = [name.strip() for name in args.cases.split(',') if name.strip()]
+    unknown = [name for name in case_names if name not in CASES_BY_NAME]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    runs = plan(set(case_names), args.sizes, args.build_max)
+    baseline = load_baseline(args.baseline)
+
+    root = tempfile.mkdtemp(prefix='fsp-bench-')
+    try:
+        print(f"Generating fixtures for {', '.join(map(str, args.sizes))} events...")
+        write_fixtures(root, args.sizes)
+        results = {}
+        for name, size, variant in runs:
+            key = case_key(name, size, variant)
+            print(f"  {key}", flush=True)
+            results[key] = run_in_subprocess(root, name, size, variant, args.repeat, args.jobs)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    regressed = print_report(results, baseline, args.threshold)
+    if args.save_baseline:
+        save_baseline(args.baseline, {**baseline, **results})
+        print(f"\n  Saved baseline: {args.baseline}")
+    elif baseline and regressed:
+        print(f"\n  {regressed} case(s) regressed more than {args.threshold:.0%} against {args.baseline}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
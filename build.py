@@ -7,27 +7,72 @@ Reads content/*.md files + templates/base.html, generates multi-page site.
 Output:
   site/index.html  — Home (hero + video)
   site/about.html  — About (pitch + what this is)
-  site/events.html — Events
+  site/events/     — Events (paginated), past/ archive, <slug>/ detail pages
+  site/events.ics, events.atom, events.json — Event feeds (plus events/<slug>.ics)
   site/join.html   — Come Meet Us (concierge form)
 
-Usage: python3 build.py
+Usage: python3 build.py [--watch | --serve [--port N]] [--force] [--minify] [--profile] [--cprofile FILE] [--jobs N]
+       python3 build.py [--fingerprint] [--next-rebuild]
 """
 
+import argparse
+import asyncio
+import bisect
+import calendar
+import codecs
+import concurrent.futures
+import contextlib
+import cProfile
+import ctypes
+import ctypes.util
+import functools
+import gzip
+import io
 import hashlib
 import json
+import mimetypes
 import os
+import posixpath
 import re
+import select
 import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import unicodedata
+import urllib.error
+import urllib.parse
 import urllib.request
-from datetime import datetime
-from html import escape
+from collections import namedtuple
+from datetime import date, datetime
+from html import escape, unescape
 from zoneinfo import ZoneInfo
 
+try:
+    from PIL import Image, ImageOps
+    from PIL import features as pil_features
+except ImportError:  # Optional: without Pillow, images ship as-is
+    Image = None
+
+try:
+    import brotli
+except ImportError:  # Optional: without Brotli, only .gz siblings are written
+    brotli = None
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:  # Optional: without fontTools, fonts load from Google Fonts
+    font_subset = None
+
 # Paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONTENT_DIR = os.path.join(SCRIPT_DIR, 'content')
 TEMPLATE_DIR = os.path.join(SCRIPT_DIR, 'templates')
 SITE_DIR = os.path.join(SCRIPT_DIR, 'site')
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
 
 
 def read_file(path):
@@ -52,123 +97,522 @@ def extract_meta(text):
     return meta
 
 
-def _paragraphs_to_html(text):
-    """Convert plain text to HTML paragraph tags."""
+# Inline markdown: backslash escapes, [text](url) links, runs of * for
+# em/strong, and an em dash followed by a space. One scan per paragraph.
+_INLINE_TOKEN_RE = re.compile(
+    r'\\([!-/:-@\[-`{-~])'
+    r'|\[([^\]\n]+)\]\(([^)\n]+)\)'
+    r'|(\*+)'
+    r'|— '
+)
+_META_LINE_RE = re.compile(r'[a-z_]+:')
+
+LINK_CLASS = 'text-gold-500 hover:text-gold-400 transition-colors'
+_EMPHASIS_TAGS = {1: ('<em>', '</em>'), 2: ('<strong class="text-dark-50">', '</strong>')}
+
+
+def _iter_paragraphs(text):
+    """Yield the blank-line-separated paragraphs of text, in one pass over its lines."""
+    lines = []
+    for line in text.split('\n'):
+        if line.strip():
+            lines.append(line)
+        elif lines:
+            yield '\n'.join(lines)
+            lines = []
+    if lines:
+        yield '\n'.join(lines)
+
+
+def _inline_to_html(text):
+    """Convert inline markdown to HTML in a single left-to-right scan.
+
+    Emphasis uses a delimiter stack, so nested runs such as **a *b* c** and
+    ***x*** close in the right order; unmatched delimiters stay literal.
+    Inline HTML passes through untouched."""
+    out = []
+    openers = []  # (run length, index in out of its placeholder)
+    pos = 0
+    for m in _INLINE_TOKEN_RE.finditer(text):
+        out.append(text[pos:m.start()])
+        pos = m.end()
+        escaped, link_text, link_url, stars = m.group(1, 2, 3, 4)
+        if escaped is not None:
+            out.append(escaped)
+        elif link_text is not None:
+            out.append(f'<a href="{link_url}" class="{LINK_CLASS}">{_inline_to_html(link_text)}</a>')
+        elif stars is not None:
+            remaining = len(stars)
+            if remaining > 3:
+                out.append(stars)
+                continue
+            before = text[m.start() - 1] if m.start() else ' '
+            after = text[m.end()] if m.end() < len(text) else ' '
+            # Close the innermost matching openers first
+            if not before.isspace():
+                while remaining and openers and openers[-1][0] <= remaining:
+                    size, index = openers.pop()
+                    open_tag, close_tag = _EMPHASIS_TAGS[size]
+                    out[index] = open_tag
+                    out.append(close_tag)
+                    remaining -= size
+            if not remaining:
+                continue
+            if after.isspace():
+                out.append('*' * remaining)
+                continue
+            # Open; a run of three opens strong outside em
+            for size in ((2, 1) if remaining == 3 else (remaining,)):
+                openers.append((size, len(out)))
+                out.append('*' * size)
+        else:
+            out.append('&mdash; ')
+    out.append(text[pos:])
+    return ''.join(out)
+
+
+def _render_paragraphs(paragraphs):
     html_parts = []
-    for p in re.split(r'\n\s*\n', text.strip()):
+    for p in paragraphs:
         p = p.strip()
-        if not p:
-            continue
-        p = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2" class="text-gold-500 hover:text-gold-400 transition-colors">\1</a>', p)
-        p = re.sub(r'\*\*(.+?)\*\*', r'<strong class="text-dark-50">\1</strong>', p)
-        p = re.sub(r'\*(.+?)\*', r'<em>\1</em>', p)
-        p = p.replace(' — ', ' &mdash; ')
-        p = p.replace('— ', '&mdash; ')
-        html_parts.append(f'<p>{p}</p>')
+        if p:
+            html_parts.append(f'<p>{_inline_to_html(p)}</p>')
     return '\n                '.join(html_parts)
 
 
-def md_to_html(text):
-    """Convert simple markdown to HTML. Returns (h2_title, body_html)."""
-    lines = text.strip().split('\n')
+def _paragraphs_to_html(text):
+    """Convert plain text to HTML paragraph tags."""
+    return _render_paragraphs(_iter_paragraphs(text))
+
+
+class ContentDocument(namedtuple('ContentDocument', ['text', 'meta', 'h1', 'h2_title', 'sections', 'body_html'])):
+    """A content/*.md file parsed once.
+
+    meta: top-level key: value pairs (see extract_meta)
+    h1: text of the first '# ' heading, or ''
+    h2_title: text of the last '## ' heading, or ''
+    sections: tuple of (h2 title, body_html) for each H2 section
+    body_html: every non-heading, non-metadata paragraph as HTML"""
+    __slots__ = ()
+
+
+def parse_content(text):
+    """Parse a content file's text into a ContentDocument in one pass over its lines."""
+    text = text.strip()
+    meta = {}
+    h1 = ''
     h2_title = ''
+    sections = []
+    current_title = None
+    current_lines = []
     body_lines = []
     skip_blank = False
 
-    for line in lines:
+    for line in text.split('\n'):
+        # Metadata: non-indented, non-heading, non-list key: value lines
+        if not line.startswith((' ', '\t', '-', '#')) and ':' in line:
+            key, val = line.split(':', 1)
+            if key.strip().isidentifier():
+                meta[key.strip()] = val.strip()
+
         stripped = line.strip()
-        if stripped.startswith('# ') and not stripped.startswith('## '):
+        if stripped.startswith('# '):
+            h1 = h1 or stripped[2:].strip()
             skip_blank = True
             continue
         if stripped.startswith('## '):
-            h2_title = stripped[3:].strip()
+            if current_title is not None:
+                sections.append((current_title, _paragraphs_to_html('\n'.join(current_lines))))
+            current_title = h2_title = stripped[3:].strip()
+            current_lines = []
             skip_blank = True
             continue
+        if current_title is not None:
+            current_lines.append(line)
+        # The body drops the blank line directly after a heading
         if skip_blank and stripped == '':
             skip_blank = False
             continue
         skip_blank = False
         body_lines.append(line)
 
-    body_text = '\n'.join(body_lines).strip()
+    if current_title is not None:
+        sections.append((current_title, _paragraphs_to_html('\n'.join(current_lines))))
+
     # Skip metadata-only paragraphs
-    filtered = []
-    for p in re.split(r'\n\s*\n', body_text):
-        if not all(re.match(r'^[a-z_]+:', line) for line in p.split('\n') if line.strip()):
-            filtered.append(p)
-    return h2_title, _paragraphs_to_html('\n\n'.join(filtered))
+    paragraphs = (
+        p for p in _iter_paragraphs('\n'.join(body_lines))
+        if not all(_META_LINE_RE.match(line) for line in p.split('\n'))
+    )
+    return ContentDocument(text, meta, h1, h2_title, tuple(sections), _render_paragraphs(paragraphs))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_content_cached(path, mtime_ns, size):
+    return parse_content(read_file(path))
+
+
+def load_content(name):
+    """Parsed ContentDocument for content/<name>. Memoized by path, mtime and
+    size, so watch-mode rebuilds reuse documents whose files haven't changed."""
+    path = os.path.join(CONTENT_DIR, name)
+    st = os.stat(path)
+    return _load_content_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def md_to_html(text):
+    """Convert simple markdown to HTML. Returns (h2_title, body_html)."""
+    doc = parse_content(text)
+    return doc.h2_title, doc.body_html
 
 
 def parse_sections(text):
     """Parse a markdown file with metadata + multiple H2 sections.
     Returns (meta_dict, [(section_title, body_html), ...])."""
-    meta = extract_meta(text)
-    sections = []
-    current_title = None
-    current_lines = []
-    past_meta = False
+    doc = parse_content(text)
+    return doc.meta, list(doc.sections)
 
-    for line in text.strip().split('\n'):
-        stripped = line.strip()
-        if stripped.startswith('# ') and not stripped.startswith('## '):
-            past_meta = True
-            continue
-        if stripped.startswith('## '):
-            if current_title is not None:
-                sections.append((current_title, _paragraphs_to_html('\n'.join(current_lines))))
-            current_title = stripped[3:].strip()
-            current_lines = []
-            past_meta = True
-            continue
-        if past_meta and current_title is not None:
-            current_lines.append(line)
 
-    if current_title is not None:
-        sections.append((current_title, _paragraphs_to_html('\n'.join(current_lines))))
+API_BASE = 'https://app.freestate.party'
+EASTERN = ZoneInfo('America/New_York')
 
-    return meta, sections
 
+def _http_cache_paths(url, cache='http'):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+    stem = os.path.join(CACHE_DIR, cache, key)
+    return stem + '.body', stem + '.json'
+
+
+def prune_http_cache(cache, urls):
+    """Delete every entry in .cache/<cache> that isn't for one of urls.
+    Returns the number of entries removed."""
+    directory = os.path.join(CACHE_DIR, cache)
+    keep = {os.path.basename(path) for url in urls for path in _http_cache_paths(url, cache)}
+    removed = set()
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name not in keep:
+                os.unlink(os.path.join(directory, name))
+                removed.add(name.rsplit('.', 1)[0])
+    return len(removed)
+
+
+def load_http_cache(url, cache='http'):
+    """Return (body, meta) for the last good response to url, or (None, {})."""
+    body_path, meta_path = _http_cache_paths(url, cache)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, {}
+    if not isinstance(meta, dict) or meta.get('url') != url:
+        return None, {}
+    return body, meta
+
+
+def _http_cache_meta(url, body_digest, headers):
+    return {
+        'url': url,
+        'etag': headers.get('ETag', ''),
+        'last_modified': headers.get('Last-Modified', ''),
+        'sha256': body_digest,
+        'fetched_at': datetime.now(EASTERN).isoformat(timespec='seconds'),
+    }
+
+
+def save_http_cache(url, body, headers, cache='http'):
+    body_path, meta_path = _http_cache_paths(url, cache)
+    meta = _http_cache_meta(url, hashlib.sha256(body).hexdigest(), headers)
+    atomic_write(body_path, body)
+    atomic_write(meta_path, json.dumps(meta, indent=2) + '\n')
+
+
+def _conditional_headers(headers, meta):
+    request_headers = dict(headers or {})
+    if meta.get('etag'):
+        request_headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        request_headers['If-Modified-Since'] = meta['last_modified']
+    return request_headers
+
+
+def cached_fetch(url, headers=None, timeout=10, validate=None, cache='http'):
+    """GET url as a conditional request against the on-disk HTTP cache
+    (the .cache/<cache> directory).
+
+    Sends If-None-Match / If-Modified-Since from the last good response; a
+    304 reuses the cached body. A fresh body is passed to validate (which
+    should raise if it is unusable) before it replaces the cached copy. On any
+    network or validation error the cached body is returned instead.
+    Returns (body, source) with source 'network', 'not-modified' or 'stale'.
+    Raises the original error when nothing is cached."""
+    cached_body, meta = load_http_cache(url, cache)
+    request_headers = _conditional_headers(headers, meta if cached_body is not None else {})
+
+    try:
+        req = urllib.request.Request(url, headers=request_headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                body = resp.read()
+                resp_headers = resp.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached_body is not None:
+                return cached_body, 'not-modified'
+            raise
+        if validate is not None:
+            validate(body)
+    except Exception as e:
+        if cached_body is None:
+            raise
+        print(f"  WARNING: Fetch of {url} failed ({e}); using cached copy from {meta.get('fetched_at', '?')}")
+        return cached_body, 'stale'
+
+    save_http_cache(url, body, resp_headers, cache)
+    return body, 'network'
+
+
+# Responses are streamed to disk in chunks of this size; larger ones are
+# refused (and the cached copy used) rather than filling the disk.
+FETCH_CHUNK_SIZE = 64 * 1024
+API_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _download(resp, directory, max_bytes):
+    """Copy an HTTP response body into a temp file in directory, hashing it
+    on the way. Returns (temp path, SHA-256 hex). Raises ValueError once the
+    body is longer than max_bytes."""
+    length = resp.headers.get('Content-Length')
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise ValueError(f'response is {int(length)} bytes, over the {max_bytes} byte limit')
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in iter(lambda: resp.read(FETCH_CHUNK_SIZE), b''):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f'response is over the {max_bytes} byte limit')
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path, digest.hexdigest()
+
+
+def _process_file(path, process):
+    with open(path, 'rb') as f:
+        return process(f)
+
+
+def streamed_fetch(url, process, headers=None, timeout=10, max_bytes=API_MAX_BYTES):
+    """cached_fetch() for large bodies, which are never held in memory.
+
+    The body streams into a temp file beside its cache entry (hashed as it
+    arrives, refused past max_bytes) and process(binary file) consumes it
+    from disk. Only a body that process accepts replaces the cached copy; on
+    a 304, or any network, size or processing error, process runs on the
+    cached body instead.
+    Returns (process result, SHA-256 hex of the body, source) with source
+    'network', 'not-modified' or 'stale'. Raises the original error when
+    nothing is cached."""
+    body_path, meta_path = _http_cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if not isinstance(meta, dict) or meta.get('url') != url or not os.path.isfile(body_path):
+            meta = {}
+    except (OSError, ValueError):
+        meta = {}
+
+    tmp_path = None
+    try:
+        req = urllib.request.Request(url, headers=_conditional_headers(headers, meta))
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
+                tmp_path, digest = _download(resp, os.path.dirname(body_path), max_bytes)
+                resp_headers = resp.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and meta:
+                return _process_file(body_path, process), meta.get('sha256') or file_digest(body_path), 'not-modified'
+            raise
+        result = _process_file(tmp_path, process)
+    except Exception as e:
+        if tmp_path is not None:
+            os.unlink(tmp_path)
+        if not meta:
+            raise
+        print(f"  WARNING: Fetch of {url} failed ({e}); using cached copy from {meta.get('fetched_at', '?')}")
+        return _process_file(body_path, process), meta.get('sha256') or file_digest(body_path), 'stale'
+
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, body_path)
+    atomic_write(meta_path, json.dumps(_http_cache_meta(url, digest, resp_headers), indent=2) + '\n')
+    return result, digest, 'network'
+
+
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_json_array(f, chunk_size=FETCH_CHUNK_SIZE):
+    """Yield the elements of the JSON array in binary file f one at a time,
+    reading it in chunks, so memory holds one element (plus a chunk) rather
+    than the whole document. Raises ValueError if f is not a JSON array."""
+    decoder = json.JSONDecoder()
+    reader = codecs.getreader('utf-8')(f)
+    buf, pos, eof = '', 0, False
+    expect = '['  # then 'value', ',' (comma or end) or 'value or end'
+
+    def more(size):
+        nonlocal buf, pos, eof
+        chunk = reader.read(size)
+        buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+
+    while True:
+        pos = _JSON_WS_RE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                if expect is None:
+                    return
+                raise ValueError('unexpected end of JSON array')
+            more(chunk_size)
+            continue
+        char = buf[pos]
+        if expect is None:
+            raise ValueError(f'unexpected data after JSON array at offset {pos}')
+        if expect == '[':
+            if char != '[':
+                raise ValueError('expected a JSON array of events')
+            pos += 1
+            expect = 'value or end'
+        elif char == ']' and expect != 'value':
+            pos += 1
+            expect = None
+        elif expect == ',':
+            if char != ',':
+                raise ValueError(f"expected ',' or ']' in JSON array, got {char!r}")
+            pos += 1
+            expect = 'value'
+        else:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # An element split across chunks; read enough to finish it
+                more(max(chunk_size, len(buf) - pos))
+                continue
+            if not eof and (end == len(buf) or buf[end] not in ' \t\n\r,]'):
+                # A number cut short by the chunk boundary ('-2' of '-2.5')
+                more(chunk_size)
+                continue
+            yield value
+            pos = end
+            expect = ','
 
-API_BASE = 'https://app.freestate.party'
-EASTERN = ZoneInfo('America/New_York')
 
+def _normalize_stream(f, timer=None):
+    """normalize_events(iter_json_array(f)). With a timer, the time spent in
+    normalize_events() alone (not in parsing) is its 'normalize' phase."""
+    if timer is None:
+        return normalize_events(iter_json_array(f))
+    parse = [0.0, 0.0]
 
-def fetch_api_events():
-    """Fetch events from the API. Returns (events_list, raw_bytes).
-    raw_bytes is the unmodified API response, used for change-detection hashing.
-    On failure, returns ([], b'')."""
+    def parsed():
+        items = iter_json_array(f)
+        while True:
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                value = next(items)
+            except StopIteration:
+                return
+            finally:
+                parse[0] += time.perf_counter() - wall
+                parse[1] += time.process_time() - cpu
+            yield value
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    events = normalize_events(parsed())
+    timer.add('normalize', time.perf_counter() - wall - parse[0], time.process_time() - cpu - parse[1])
+    return events
+
+
+class FetchError(Exception):
+    """The events API failed and there is no last good copy to fall back on.
+    Building would publish a site with no events, so the build stops."""
+
+
+def fetch_api_events(timer=None):
+    """Stream events from the API straight into normalize_events().
+    Returns (tuple of Event, source) with source as for streamed_fetch():
+    'network', 'not-modified' or, when the API is unreachable, too large or
+    returns garbage, 'stale' for the last good cached response. With no
+    cached copy, raises FetchError. Given a PhaseTimer, normalizing is also
+    timed on its own, as the 'normalize' phase."""
     url = f'{API_BASE}/api/public/events'
     try:
-        req = urllib.request.Request(url, headers={'Accept': 'application/json'})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            raw = resp.read()
-            data = json.loads(raw.decode('utf-8'))
-            return (data if isinstance(data, list) else [], raw)
+        events, _, source = streamed_fetch(
+            url, functools.partial(_normalize_stream, timer=timer),
+            headers={'Accept': 'application/json'}, max_bytes=API_MAX_BYTES)
     except Exception as e:
-        print(f"  WARNING: Failed to fetch events from API: {e}")
-        return ([], b'')
+        raise FetchError(f"Failed to fetch events from {url} and no cached copy: {e}") from e
+    if source == 'not-modified':
+        print("  API events not modified, using cached copy")
+    return events, source
 
 
-def format_event_datetime(starts_at, ends_at):
-    """Convert ISO 8601 UTC timestamps to human-readable Eastern time.
-    Returns (date_str, time_str) e.g. ('Saturday, April 11, 2026', '5:00 PM – 10:00 PM')."""
-    start = datetime.fromisoformat(starts_at.replace('Z', '+00:00')).astimezone(EASTERN)
+def parse_api_datetime(value):
+    """Parse an API ISO 8601 timestamp (UTC, 'Z' suffix) into Eastern time."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone(EASTERN)
+
+
+def _format_event_times(start, end):
     date_str = start.strftime('%A, %B %-d, %Y')
 
     def fmt_time(dt):
         return dt.strftime('%-I:%M %p')
 
     time_str = fmt_time(start)
-    if ends_at:
-        end = datetime.fromisoformat(ends_at.replace('Z', '+00:00')).astimezone(EASTERN)
+    if end is not None:
         time_str = f'{fmt_time(start)} – {fmt_time(end)}'
 
     return date_str, time_str
 
 
+def format_event_datetime(starts_at, ends_at):
+    """Convert ISO 8601 UTC timestamps to human-readable Eastern time.
+    Returns (date_str, time_str) e.g. ('Saturday, April 11, 2026', '5:00 PM – 10:00 PM')."""
+    start = parse_api_datetime(starts_at)
+    end = parse_api_datetime(ends_at) if ends_at else None
+    return _format_event_times(start, end)
+
+
+class Event(namedtuple('Event', [
+        'title', 'description', 'location', 'date_str', 'time_str',
+        'starts_at', 'ends_at', 'starts_at_raw', 'ends_at_raw',
+        'poster_url', 'rsvp_url',
+        'title_raw', 'description_raw', 'location_raw', 'rsvp_url_raw', 'poster_url_raw',
+        'updated_at', 'poster_path', 'slug'], defaults=(None, '', ''))):
+    """An API event, normalized once per build and shared by every renderer.
+
+    title, description, location, poster_url and rsvp_url are HTML-escaped
+    and display-ready; the *_raw fields keep the original text for JSON-LD,
+    feeds and URLs. starts_at / ends_at / updated_at are Eastern-time
+    datetimes (ends_at and updated_at may be None). poster_path is the
+    site-relative path of the locally mirrored poster, or '' when only the
+    remote poster_url is available. slug names the event's detail page,
+    /events/<slug>/, and is unique within a build."""
+    __slots__ = ()
+
+
 def normalize_event(event):
     """Extract, validate, and HTML-escape fields from a raw API event dict.
-    Returns a clean dict with display-ready fields, or None if critical fields are invalid."""
+    Returns an Event, or None if critical fields are invalid.
+    May raise on malformed timestamps."""
     title = event.get('title', '')
     starts_at = event.get('startsAt', '')
 
@@ -183,6 +627,7 @@ def normalize_event(event):
     ends_at = event.get('endsAt', '')
     poster_url = event.get('posterUrl', '')
     rsvp_url = event.get('rsvpUrl', '')
+    updated_at = event.get('updatedAt', '')
 
     # Validate non-critical fields are strings, default to empty
     if not isinstance(description, str):
@@ -202,8 +647,15 @@ def normalize_event(event):
     if rsvp_url and not rsvp_url.startswith(('https://', 'http://')):
         rsvp_url = ''
 
-    # Format datetime (may raise on malformed timestamps)
-    date_str, time_str = format_event_datetime(starts_at, ends_at)
+    # Parse and format datetimes (may raise on malformed timestamps)
+    start = parse_api_datetime(starts_at)
+    end = parse_api_datetime(ends_at) if ends_at else None
+    date_str, time_str = _format_event_times(start, end)
+    # Only feeds use the modification time, so a bad one isn't fatal
+    try:
+        updated = parse_api_datetime(updated_at) if isinstance(updated_at, str) and updated_at else None
+    except ValueError:
+        updated = None
 
     if poster_url and poster_url.startswith(('https://', 'http://')):
         full_poster_url = poster_url
@@ -212,19 +664,85 @@ def normalize_event(event):
     else:
         full_poster_url = ''
 
-    return {
-        'title': escape(title),
-        'description': escape(description),
-        'location': escape(location),
-        'date_str': date_str,
-        'time_str': time_str,
-        'starts_at_raw': starts_at,
-        'ends_at_raw': ends_at,
-        'poster_url': escape(full_poster_url) if full_poster_url else '',
-        'location_raw': location,
-        'rsvp_url': escape(rsvp_url),
-        'rsvp_url_raw': rsvp_url,
-    }
+    return Event(
+        title=escape(title),
+        description=escape(description),
+        location=escape(location),
+        date_str=date_str,
+        time_str=time_str,
+        starts_at=start,
+        ends_at=end,
+        starts_at_raw=starts_at,
+        ends_at_raw=ends_at,
+        poster_url=escape(full_poster_url) if full_poster_url else '',
+        rsvp_url=escape(rsvp_url),
+        title_raw=title,
+        description_raw=description,
+        location_raw=location,
+        rsvp_url_raw=rsvp_url,
+        poster_url_raw=full_poster_url,
+        updated_at=updated,
+    )
+
+
+def normalize_events(api_events):
+    """Normalize every raw API event once, in API order. api_events may be
+    any iterable (fetch_api_events() passes a streaming parser). Events that
+    fail validation are dropped and reported in a single summary line.
+    Returns a tuple of Event."""
+    events = []
+    invalid = []
+    failed = []
+    total = 0
+    for total, event in enumerate(api_events, 1):
+        if not isinstance(event, dict):
+            invalid.append('<not an object>')
+            continue
+        try:
+            normed = normalize_event(event)
+        except Exception as e:
+            failed.append(f"{event.get('title', '<no title>')} ({e})")
+            continue
+        if normed is None:
+            invalid.append(str(event.get('title') or '<no title>'))
+            continue
+        events.append(normed)
+
+    if invalid or failed:
+        details = '; '.join(
+            part for part in (
+                f"{len(invalid)} invalid: {', '.join(invalid)}" if invalid else '',
+                f"{len(failed)} unparseable: {', '.join(failed)}" if failed else '',
+            ) if part
+        )
+        print(f"  WARNING: Dropped {len(invalid) + len(failed)} of {total} API events ({details})")
+    return assign_slugs(events)
+
+
+def slugify(text):
+    """Lowercase ASCII words of text joined by hyphens."""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def assign_slugs(events):
+    """Give each Event a slug of its start date and title
+    ('2026-04-11-free-state-saturday'); repeats get -2, -3, ... in API
+    order. Returns a tuple of Event."""
+    seen = set()
+    next_suffix = {}
+    slugged = []
+    for event in events:
+        stem = f"{event.starts_at.date().isoformat()}-{slugify(event.title_raw)}".rstrip('-')
+        n = next_suffix.get(stem, 1)
+        slug = stem if n == 1 else f'{stem}-{n}'
+        while slug in seen:
+            n += 1
+            slug = f'{stem}-{n}'
+        next_suffix[stem] = n + 1
+        seen.add(slug)
+        slugged.append(event._replace(slug=slug))
+    return tuple(slugged)
 
 
 def parse_schema_address(location):
@@ -265,154 +783,343 @@ def parse_schema_address(location):
     return address
 
 
-def render_api_event_cards(events):
-    """Render API event dicts into HTML cards with prominent poster images."""
+def render_api_event_cards(events, base='..', empty='No upcoming events scheduled. Check back soon!'):
+    """Render normalized Events into HTML cards with prominent poster images,
+    each linking to the event's detail page. base is the relative path to the
+    site root from the page the cards land on; empty is shown when there are
+    no events."""
     if not events:
-        return '<p class="text-dark-300 text-lg">No upcoming events scheduled. Check back soon!</p>'
+        return f'<p class="text-dark-300 text-lg">{empty}</p>'
 
     cards = []
     for event in events:
-        try:
-            normed = normalize_event(event)
-            if normed is None:
-                print(f"  WARNING: Skipping event with invalid critical fields: {event.get('title', '<no title>')}")
-                continue
-        except Exception as e:
-            print(f"  WARNING: Skipping event due to error: {e} (title: {event.get('title', '<no title>')})")
-            continue
-
-        title = normed['title']
-        description = normed['description']
-        location = normed['location']
-        date_str = normed['date_str']
-        time_str = normed['time_str']
-        poster_url = normed['poster_url']
-        rsvp_url = normed['rsvp_url']
+        title = event.title
+        description = event.description
+        date_str = event.date_str
+        poster_url = f'{base}/{event.poster_path}' if event.poster_path else event.poster_url
 
         if poster_url:
-            img_html = f'<img src="{poster_url}" alt="{title}" loading="lazy" class="w-full aspect-[3/4] object-cover rounded-t-lg" onerror="this.onerror=null;this.src=\'{{{{base}}}}/img/logo.svg\';this.classList.add(\'object-contain\',\'bg-dark-800\',\'p-8\');">'
+            img_html = f'<img src="{poster_url}" alt="{title}" loading="lazy" class="w-full aspect-[3/4] object-cover rounded-t-lg" sizes="(min-width: 640px) 360px, 100vw" onerror="this.onerror=null;this.src=\'{base}/img/logo.svg\';this.classList.add(\'object-contain\',\'bg-dark-800\',\'p-8\');">'
         else:
-            img_html = '<img src="{{base}}/img/logo.svg" alt="Free State Party" loading="lazy" class="w-full aspect-[3/4] object-contain rounded-t-lg bg-dark-800 p-8">'
+            img_html = f'<img src="{base}/img/logo.svg" alt="Free State Party" loading="lazy" class="w-full aspect-[3/4] object-contain rounded-t-lg bg-dark-800 p-8">'
 
         desc_html = f'<p class="text-dark-300 text-sm mt-1 line-clamp-2">{description}</p>' if description else ''
 
-        card_inner = f'''{img_html}
+        cards.append(f'''<a href="{base}/events/{event.slug}/" class="bg-dark-900 border border-dark-600 rounded-lg overflow-hidden hover:border-gold-700/50 transition-colors no-underline text-inherit cursor-pointer block focus-visible:ring-2 focus-visible:ring-gold-500 focus-visible:outline-none">
+                    {img_html}
                     <div class="px-4 py-3">
                         <h3 class="font-display text-base font-bold text-dark-50 mb-1">{title}</h3>
                         <p class="text-gold-500 text-sm font-medium">{date_str}</p>
                         {desc_html}
-                    </div>'''
-
-        if rsvp_url:
-            rsvp_label = '<span class="block px-4 pb-3 text-gold-500 text-xs font-semibold tracking-wide uppercase">RSVP &rarr;</span>'
-            card = f'''<a href="{rsvp_url}" target="_blank" rel="noopener noreferrer" class="bg-dark-900 border border-dark-600 rounded-lg overflow-hidden hover:border-gold-700/50 transition-colors no-underline text-inherit cursor-pointer block focus-visible:ring-2 focus-visible:ring-gold-500 focus-visible:outline-none">
-                    {card_inner}
-                    {rsvp_label}
-                </a>'''
-        else:
-            card = f'''<div class="bg-dark-900 border border-dark-600 rounded-lg overflow-hidden hover:border-gold-700/50 transition-colors">
-                    {card_inner}
-                </div>'''
-        cards.append(card)
+                    </div>
+                    <span class="block px-4 pb-3 text-gold-500 text-xs font-semibold tracking-wide uppercase">Details &rarr;</span>
+                </a>''')
 
-    if not cards:
-        return '<p class="text-dark-300 text-lg">No upcoming events scheduled. Check back soon!</p>'
     return '\n                '.join(cards)
 
 
+def event_schema(event):
+    """schema.org Event structured data for a normalized Event."""
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "Event",
+        "name": event.title,
+        "description": event.description,
+        "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
+        "organizer": {
+            "@type": "Organization",
+            "name": "Free State Party",
+            "url": BASE_URL
+        }
+    }
+    if event.starts_at_raw:
+        schema["startDate"] = event.starts_at_raw
+    if event.ends_at_raw:
+        schema["endDate"] = event.ends_at_raw
+    if event.location_raw:
+        schema["location"] = {
+            "@type": "Place",
+            "name": event.location,
+            "address": parse_schema_address(event.location_raw)
+        }
+    if event.poster_path:
+        schema["image"] = f'{BASE_URL}/{event.poster_path}'
+    elif event.poster_url:
+        schema["image"] = event.poster_url
+    if event.rsvp_url_raw:
+        schema["url"] = event.rsvp_url_raw
+    return schema
+
+
+def event_list_schema(events, first_position=1):
+    """schema.org ItemList of a listing page's events, each pointing at its
+    detail page and carrying its Event data."""
+    items = []
+    for position, event in enumerate(events, first_position):
+        item = event_schema(event)
+        del item["@context"]
+        items.append({
+            "@type": "ListItem",
+            "position": position,
+            "url": f'{BASE_URL}/events/{event.slug}/',
+            "item": item
+        })
+    return {"@context": "https://schema.org", "@type": "ItemList", "itemListElement": items}
+
+
+def json_ld_script(data):
+    """A <script type="application/ld+json"> block for data."""
+    json_ld = json.dumps(data, indent=4).replace('</', '<\\/')
+    return f'<script type="application/ld+json">\n    {json_ld}\n    </script>'
+
+
 def parse_words(text):
     return [w.strip() for w in text.strip().split('\n') if w.strip()]
 
 
-def build_page(base, page_title, page_description, og_title, page_content,
+_SLOT_RE = re.compile(r'\{\{(\w+)\}\}')
+
+
+class Template:
+    """base.html compiled once into alternating literal and slot segments.
+
+    Rendering is a single join; injected values are never re-scanned, so a
+    page body containing '{{...}}' is emitted as-is. Escaping policy: slots
+    named in `raw` take trusted HTML and are inserted verbatim, every other
+    slot is HTML-escaped. Slots named in `line_slots` own their line: when
+    the value is empty, the newline and indentation before them are dropped."""
+
+    def __init__(self, source, raw=(), line_slots=()):
+        self.raw = frozenset(raw)
+        self.literals = []
+        self.slots = []
+        pos = 0
+        for m in _SLOT_RE.finditer(source):
+            literal = source[pos:m.start()]
+            name = m.group(1)
+            lead = ''
+            if name in line_slots:
+                nl = literal.rfind('\n')
+                if nl != -1 and not literal[nl + 1:].strip():
+                    literal, lead = literal[:nl], literal[nl:]
+            self.literals.append(literal)
+            self.slots.append((name, lead))
+            pos = m.end()
+        self.literals.append(source[pos:])
+        self.names = frozenset(name for name, _ in self.slots)
+
+    def render(self, values):
+        missing = self.names - values.keys()
+        if missing:
+            raise KeyError(f"Template slots without a value: {', '.join(sorted(missing))}")
+        parts = [self.literals[0]]
+        for (name, lead), literal in zip(self.slots, self.literals[1:]):
+            value = values[name]
+            if name not in self.raw:
+                value = escape(value)
+            if value:
+                parts.append(lead)
+                parts.append(value)
+            parts.append(literal)
+        return ''.join(parts)
+
+
+def load_template(path):
+    """Compile the base page template. Page bodies, scripts and prebuilt tags
+    are trusted HTML; metadata and URLs are escaped."""
+    return Template(
+        read_file(path),
+        raw=('page_content', 'page_scripts', 'og_image_tag', 'noindex_tag', 'head_assets'),
+        line_slots=('noindex_tag',),
+    )
+
+
+def resolve_base(is_subdir=False, base_path=None):
+    """Relative path from a page back to the site root.
+    Explicit base_path overrides is_subdir."""
+    if base_path is not None:
+        return base_path
+    return '..' if is_subdir else '.'
+
+
+def build_page(template, page_title, page_description, og_title, page_content,
                page_scripts='', active_nav=None, is_subdir=False, base_path=None,
                og_url='', og_image='', noindex=False, footer=None):
-    """Inject content into base template and return final HTML."""
-    html = base
-    html = html.replace('{{page_title}}', page_title)
-    html = html.replace('{{page_description}}', page_description)
-    noindex_tag = '\n    <meta name="robots" content="noindex, nofollow">' if noindex else ''
-    html = html.replace('\n    {{noindex_tag}}', noindex_tag)
-    html = html.replace('{{og_title}}', og_title)
-    html = html.replace('{{og_url}}', og_url or BASE_URL)
-    html = html.replace('{{canonical_url}}', og_url or BASE_URL)
-    og_image_tag = f'<meta property="og:image" content="{BASE_URL}{og_image or "/img/og-default.png"}">'
-    html = html.replace('{{og_image_tag}}', og_image_tag)
-    html = html.replace('{{page_content}}', page_content)
-    html = html.replace('{{page_scripts}}', page_scripts)
-
-    # Relative base path: explicit base_path overrides is_subdir
-    if base_path is not None:
-        resolved_base = base_path
-    else:
-        resolved_base = '..' if is_subdir else '.'
-    html = html.replace('{{base}}', resolved_base)
+    """Render the compiled base template and return final HTML.
+    page_content and page_scripts must already have their base paths resolved."""
+    footer = footer or {}
+    values = {
+        'page_title': page_title,
+        'page_description': page_description,
+        'noindex_tag': '<meta name="robots" content="noindex, nofollow">' if noindex else '',
+        'og_title': og_title,
+        'og_url': og_url or BASE_URL,
+        'canonical_url': og_url or BASE_URL,
+        'og_image_tag': f'<meta property="og:image" content="{BASE_URL}{og_image or "/img/og-default.png"}">',
+        'page_content': page_content,
+        'page_scripts': page_scripts,
+        'base': resolve_base(is_subdir, base_path),
+        'head_assets': HEAD_ASSETS_PLACEHOLDER,
+        'footer_name': footer.get('name', 'Free State Party'),
+        'footer_location': footer.get('location', 'New Hampshire'),
+    }
 
     # Nav active states
     for nav in ['about', 'events']:
-        cls = 'nav-active' if active_nav == nav else 'text-dark-200'
-        html = html.replace(f'{{{{nav_{nav}_class}}}}', cls)
+        values[f'nav_{nav}_class'] = 'nav-active' if active_nav == nav else 'text-dark-200'
 
-    # Footer content
-    if footer:
-        html = html.replace('{{footer_name}}', footer.get('name', 'Free State Party'))
-        html = html.replace('{{footer_location}}', footer.get('location', 'New Hampshire'))
+    return template.render(values)
 
-    return html
 
+# Event fields that reach the rendered site. updated_at only stamps the
+# feeds, so an edit that touches nothing else doesn't trigger a deploy.
+FINGERPRINT_FIELDS = ('slug', 'title_raw', 'description_raw', 'location_raw',
+                      'starts_at_raw', 'ends_at_raw', 'rsvp_url_raw', 'poster_url_raw')
 
-def find_saturday_event(events):
-    """Find the first event whose title contains 'saturday' (case-insensitive)."""
-    for event in events:
-        title = event.get('title', '')
-        if isinstance(title, str) and 'saturday' in title.lower():
-            return event
-    return None
 
+def events_fingerprint(events, today):
+    """Canonical SHA-256 of everything the API events contribute to the site
+    as of today: the FINGERPRINT_FIELDS of each normalized Event (in start
+    order, so API key order, whitespace, field additions and reordering
+    don't count), which events are already past, and the Saturday page's
+    fallback date when no Saturday event is listed."""
+    index = index_events(events, today)
+    return value_digest({
+        'events': [{field: getattr(event, field) for field in FINGERPRINT_FIELDS}
+                   for event in index.upcoming + index.past],
+        'past': len(index.past),
+        'saturday_fallback': '' if next_in_series(index, 'saturday') else next_first_saturday(today).isoformat(),
+    })
 
-def next_first_saturday():
-    """Compute the next first Saturday of the month from today."""
-    from calendar import monthrange
-    today = datetime.now(EASTERN).date()
-    # Check this month's first Saturday
-    year, month = today.year, today.month
-    # First day of month, find first Saturday (weekday 5)
-    first_day_weekday = datetime(year, month, 1).weekday()
-    first_sat = 1 + (5 - first_day_weekday) % 7
-    if first_sat >= today.day:
-        return datetime(year, month, first_sat).date()
-    # Move to next month
-    if month == 12:
-        year, month = year + 1, 1
+
+EVENTS_PER_PAGE = 12
+
+
+# Event series by the (case-insensitive) word their titles contain
+EVENT_SERIES = {'saturday': 'saturday'}
+
+
+class EventIndex(namedtuple('EventIndex', ['upcoming', 'past', 'by_slug', 'series', 'today'])):
+    """Normalized events split at the build date (today): upcoming soonest
+    first, past most recent first, and every event by slug. series maps each
+    EVENT_SERIES name to (start times, events) in start order, for bisecting."""
+    __slots__ = ()
+
+
+def index_events(events, today):
+    """Index events by start: those starting on or after today (Eastern) are
+    upcoming, earlier ones past."""
+    ordered = sorted(events, key=lambda event: event.starts_at)
+    split = bisect.bisect_left([event.starts_at for event in ordered], _start_of_day(today))
+    series = {}
+    for name, word in EVENT_SERIES.items():
+        members = tuple(event for event in ordered if word in event.title_raw.lower())
+        series[name] = (tuple(event.starts_at for event in members), members)
+    return EventIndex(
+        upcoming=tuple(ordered[split:]),
+        past=tuple(reversed(ordered[:split])),
+        by_slug={event.slug: event for event in ordered},
+        series=series,
+        today=today,
+    )
+
+
+def _start_of_day(day):
+    return datetime.combine(day, datetime.min.time(), EASTERN)
+
+
+def series_events(index, name, count=None, after=None):
+    """The next count (default: all) events of series name starting on or
+    after the date after (default: the index's build date), soonest first."""
+    starts, events = index.series[name]
+    first = bisect.bisect_left(starts, _start_of_day(after or index.today))
+    return events[first:first + count if count is not None else None]
+
+
+def next_in_series(index, name, after=None):
+    """The next event of series name on or after after (default: the build
+    date), or None."""
+    events = series_events(index, name, 1, after)
+    return events[0] if events else None
+
+
+def first_saturdays(start):
+    """Yield the first Saturday of each month, from the first one on or after
+    the date start."""
+    year, month = start.year, start.month
+    while True:
+        first = date(year, month, 1 + (5 - calendar.weekday(year, month, 1)) % 7)
+        if first >= start:
+            yield first
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def next_first_saturday(today):
+    """The first Saturday of this month if it's today or later, else of next month."""
+    return next(first_saturdays(today))
+
+
+def saturday_details(index):
+    """Resolve the Saturday landing page's date, RSVP link, address and poster
+    from the next Saturday event, falling back to the next first Saturday of
+    the month."""
+    sat_event = next_in_series(index, 'saturday')
+    if sat_event:
+        details = {
+            'date_str': sat_event.date_str,
+            'rsvp_url': sat_event.rsvp_url,
+            'address': sat_event.location,
+            'poster_url': sat_event.poster_url,
+            'poster_path': sat_event.poster_path,
+        }
+        print(f"  Saturday event found: {sat_event.title_raw}")
     else:
-        month += 1
-    first_day_weekday = datetime(year, month, 1).weekday()
-    first_sat = 1 + (5 - first_day_weekday) % 7
-    return datetime(year, month, first_sat).date()
+        nfs = next_first_saturday(index.today)
+        details = {
+            'date_str': nfs.strftime('%A, %B %-d, %Y'),
+            'rsvp_url': '',
+            'address': '',
+            'poster_url': '',
+            'poster_path': '',
+        }
+        print(f"  No upcoming Saturday event in API, using fallback date: {details['date_str']}")
+    return details
 
 
-def build():
-    print("Building Free State Party site...")
+def next_rebuild_at(index):
+    """The earliest future instant (Eastern) at which a build from the same
+    events would render differently. Pages depend on the clock only through
+    the build date: an event moves from upcoming to past at the midnight
+    after the day it starts, and the Saturday fallback date moves on at the
+    midnight after it passes."""
+    days = [next_first_saturday(index.today)] if next_in_series(index, 'saturday') is None else []
+    if index.upcoming:
+        days.append(index.upcoming[0].starts_at.date())
+    return _start_of_day(date.fromordinal(min(days).toordinal() + 1))
 
-    base = read_file(os.path.join(TEMPLATE_DIR, 'base.html'))
 
-    # --- Read content ---
-    hero_text = read_file(os.path.join(CONTENT_DIR, 'hero.md'))
-    hero = extract_meta(hero_text)
+def listing_path(kind, number):
+    """Output path of page number (from 1) of the 'upcoming' or 'past' event listing."""
+    root = 'events/' if kind == 'upcoming' else 'events/past/'
+    return f'{root}index.html' if number == 1 else f'{root}page/{number}/index.html'
 
-    words = parse_words(read_file(os.path.join(CONTENT_DIR, 'words.md')))
 
-    about_text = read_file(os.path.join(CONTENT_DIR, 'about.md'))
-    about_meta, about_sections = parse_sections(about_text)
+def listing_page_count(events):
+    return max(1, -(-len(events) // EVENTS_PER_PAGE))
 
-    api_events, api_raw = fetch_api_events()
-    open_events_html = render_api_event_cards(api_events)
 
-    footer_text = read_file(os.path.join(CONTENT_DIR, 'footer.md'))
-    footer_meta = extract_meta(footer_text)
+# --- Pages ---
+# Each renderer takes the shared build context and returns the page HTML
+# (or None when the page should not be emitted this build).
 
 
-    # --- Page 1: Home (hero + video) ---
+def render_home(ctx):
+    """Page 1: Home (hero + video)."""
+    hero = load_content('hero.md').meta
+    words = parse_words(load_content('words.md').text)
+    print(f"  Words: {words}")
+
+    base = resolve_base()
     home_content = f'''
     <section class="min-h-screen flex flex-col justify-center px-6 pt-20 pb-12 md:py-0">
         <div class="max-w-6xl mx-auto w-full lg:grid lg:grid-cols-2 lg:gap-12 lg:items-center">
@@ -425,14 +1132,14 @@ def build():
                 <p class="text-xl sm:text-2xl lg:text-xl xl:text-2xl text-dark-200 leading-relaxed max-w-2xl mb-10 font-display italic">
                     {hero.get('sub_tagline', 'We have a plan.')}
                 </p>
-                <a href="{{{{base}}}}/events/" class="inline-block bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold text-lg px-10 py-4 rounded-lg transition-colors min-h-[48px]">
+                <a href="{base}/events/" class="inline-block bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold text-lg px-10 py-4 rounded-lg transition-colors min-h-[48px]">
                     Meet Us
                 </a>
             </div>
             <div class="mt-12 lg:mt-0">
                 <div class="video-container shadow-2xl" id="video-wrapper">
                     <video id="hero-video" preload="metadata" playsinline>
-                        <source src="{{{{base}}}}/video/homepage.mp4" type="video/mp4">
+                        <source src="{base}/video/homepage.mp4" type="video/mp4">
                     </video>
                     <button id="video-play" class="video-overlay text-gold-500" aria-label="Play video">
                         <svg width="72" height="72" viewBox="0 0 72 72" fill="none">
@@ -483,8 +1190,8 @@ def build():
         }}
     </script>'''
 
-    home_html = build_page(
-        base,
+    return build_page(
+        ctx['template'],
         page_title=hero['title'],
         page_description=hero['description'],
         og_title=hero.get('og_title', hero['title']),
@@ -492,10 +1199,16 @@ def build():
         page_scripts=home_scripts,
         active_nav=None,
         og_url=BASE_URL,
-        footer=footer_meta
+        footer=ctx['footer']
     )
 
-    # --- Page 2: About ---
+
+def render_about(ctx):
+    """Page 2: About."""
+    about = load_content('about.md')
+    about_meta, about_sections = about.meta, about.sections
+
+    base = resolve_base(is_subdir=True)
     section_styles = ['px-6 pt-32 pb-20 md:pt-40 md:pb-28 bg-dark-800', 'px-6 py-20 md:py-28']
     about_sections_html = ''
     for i, (sec_title, sec_body) in enumerate(about_sections):
@@ -513,16 +1226,16 @@ def build():
 
     about_h1 = about_meta.get('h1', 'About')
     about_content = f'''
-    <h1 class="sr-only">{about_h1}</h1>''' + about_sections_html + '''
+    <h1 class="sr-only">{about_h1}</h1>''' + about_sections_html + f'''
 
     <section class="px-6 pb-20 md:pb-28 text-center">
-        <a href="{{base}}/events/" class="inline-block bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold text-lg px-10 py-4 rounded-lg transition-colors min-h-[48px]">
+        <a href="{base}/events/" class="inline-block bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold text-lg px-10 py-4 rounded-lg transition-colors min-h-[48px]">
             Come Meet Us
         </a>
     </section>'''
 
-    about_html = build_page(
-        base,
+    return build_page(
+        ctx['template'],
         page_title=about_meta['title'],
         page_description=about_meta['description'],
         og_title=about_meta.get('og_title', about_meta['title']),
@@ -530,10 +1243,83 @@ def build():
         active_nav='about',
         is_subdir=True,
         og_url=f'{BASE_URL}/about/',
-        footer=footer_meta
+        footer=ctx['footer']
     )
 
-    # --- Page 3: Events (tabbed: open / closed) ---
+
+def listing_url(kind, number, base):
+    return f"{base}/{listing_path(kind, number)[:-len('index.html')]}"
+
+
+def render_pagination(kind, number, count, base):
+    """Previous / next links between pages of an event listing ('' for a single page)."""
+    if count == 1:
+        return ''
+    link_class = 'text-dark-200 hover:text-gold-500 transition-colors'
+    earlier, later = ('Sooner', 'Later') if kind == 'upcoming' else ('Newer', 'Older')
+    prev_html = (f'<a href="{listing_url(kind, number - 1, base)}" rel="prev" class="{link_class}">&larr; {earlier}</a>'
+                 if number > 1 else '<span></span>')
+    next_html = (f'<a href="{listing_url(kind, number + 1, base)}" rel="next" class="{link_class}">{later} &rarr;</a>'
+                 if number < count else '<span></span>')
+    return f'''
+            <nav class="flex items-center justify-between gap-4 mt-10 text-sm font-medium" aria-label="Pagination">
+                {prev_html}
+                <span class="text-dark-300">Page {number} of {count}</span>
+                {next_html}
+            </nav>'''
+
+
+def render_event_listing(kind, number, ctx):
+    """Events listing page: page number of the upcoming events (tabbed: open /
+    members only) or of the past-events archive."""
+    filepath = listing_path(kind, number)
+    base = relative_base(filepath)
+    index = ctx['event_index']
+    events = index.upcoming if kind == 'upcoming' else index.past
+    count = listing_page_count(events)
+    page_events = events[(number - 1) * EVENTS_PER_PAGE:number * EVENTS_PER_PAGE]
+    pagination_html = render_pagination(kind, number, count, base)
+    page_suffix = f' — Page {number}' if number > 1 else ''
+    # Each event's own page has its full Event data too
+    schema_script = ''
+    if page_events:
+        schema_script = json_ld_script(event_list_schema(page_events, (number - 1) * EVENTS_PER_PAGE + 1))
+
+    if kind == 'past':
+        cards_html = render_api_event_cards(page_events, base=base, empty='No past events yet.')
+        events_h1 = 'Past Events'
+        events_content = f'''
+    <section class="px-6 pt-32 pb-20 md:pt-40 md:pb-28">
+        <div class="max-w-3xl mx-auto">
+            <div class="divider mb-6"></div>
+            <h1 class="font-display text-3xl md:text-4xl font-bold text-dark-50 mb-8">{events_h1}</h1>
+            <div class="grid grid-cols-1 sm:grid-cols-2 gap-6">
+                {cards_html}
+            </div>{pagination_html}
+            <p class="mt-10 text-sm font-medium"><a href="{base}/events/" class="text-gold-500 hover:text-gold-400 transition-colors">&larr; Upcoming events</a></p>
+        </div>
+    </section>'''
+        return build_page(
+            ctx['template'],
+            page_title=f'Past Events{page_suffix} — Free State Party',
+            page_description='Past events from the Free State Party in New Hampshire.',
+            og_title=f'Past Events{page_suffix} — Free State Party',
+            page_content=events_content,
+            page_scripts=schema_script,
+            active_nav='events',
+            base_path=base,
+            og_url=f"{BASE_URL}/{filepath[:-len('index.html')]}",
+            footer=ctx['footer']
+        )
+
+    open_events_html = render_api_event_cards(page_events, base=base)
+    archive_html = ''
+    if index.past:
+        archive_html = f'''
+                <p class="mt-10 text-sm font-medium"><a href="{base}/events/past/" class="text-gold-500 hover:text-gold-400 transition-colors">Past events &rarr;</a></p>'''
+    archive_html += f'''
+                <p class="mt-4 text-sm text-dark-300">Subscribe: <a href="{base}/events.ics" class="{LINK_CLASS}">calendar</a> &middot; <a href="{base}/events.atom" class="{LINK_CLASS}">Atom feed</a> &middot; <a href="{base}/events.json" class="{LINK_CLASS}">JSON</a></p>'''
+
     events_h1 = 'Events'
     events_content = f'''
     <section class="px-6 pt-32 pb-20 md:pt-40 md:pb-28">
@@ -552,8 +1338,10 @@ def build():
             </div>
 
             <!-- Open Events -->
-            <div id="events-open" class="events-panel grid grid-cols-1 sm:grid-cols-2 gap-6" role="tabpanel" aria-labelledby="tab-open">
+            <div id="events-open" class="events-panel" role="tabpanel" aria-labelledby="tab-open">
+                <div class="grid grid-cols-1 sm:grid-cols-2 gap-6">
                 {open_events_html}
+                </div>{pagination_html}{archive_html}
             </div>
 
             <!-- Closed Events -->
@@ -561,7 +1349,7 @@ def build():
                 <div class="border border-dark-700 rounded-lg p-8 md:p-12 text-center max-w-lg mx-auto">
                     <p class="font-display text-xl font-bold text-dark-50 mb-2">Members only.</p>
                     <p class="text-dark-300 mb-6">Private dinners, strategy sessions, and more. Come to an open event first.</p>
-                    <a href="{{{{base}}}}/events/#tab-open" onclick="document.getElementById('tab-open').click();return false;" class="inline-block bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold px-6 py-2.5 rounded-lg transition-colors text-sm">View Open Events</a>
+                    <a href="{base}/events/#tab-open" onclick="document.getElementById('tab-open').click();return false;" class="inline-block bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold px-6 py-2.5 rounded-lg transition-colors text-sm">View Open Events</a>
                 </div>
             </div>
         </div>
@@ -605,86 +1393,105 @@ def build():
         // Set initial tabindex
         tabs.forEach((t, i) => t.setAttribute('tabindex', i === 0 ? '0' : '-1'));
     </script>'''
+    if schema_script:
+        events_scripts += f'\n    {schema_script}'
 
-    # Event structured data (schema.org) — reuse normalized events
-    event_schema_items = []
-    for event in api_events:
-        try:
-            normed = normalize_event(event)
-            if normed is None:
-                continue
-        except Exception:
-            continue
-
-        schema = {
-            "@context": "https://schema.org",
-            "@type": "Event",
-            "name": normed['title'],
-            "description": normed['description'],
-            "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
-            "organizer": {
-                "@type": "Organization",
-                "name": "Free State Party",
-                "url": BASE_URL
-            }
-        }
-        if normed['starts_at_raw']:
-            schema["startDate"] = normed['starts_at_raw']
-        if normed['ends_at_raw']:
-            schema["endDate"] = normed['ends_at_raw']
-        if normed['location_raw']:
-            schema["location"] = {
-                "@type": "Place",
-                "name": normed['location'],
-                "address": parse_schema_address(normed['location_raw'])
-            }
-        if normed['poster_url']:
-            schema["image"] = normed['poster_url']
-        if normed['rsvp_url_raw']:
-            schema["url"] = normed['rsvp_url_raw']
-        event_schema_items.append(schema)
-
-    event_schema_script = ''
-    if event_schema_items:
-        json_ld = json.dumps(event_schema_items, indent=4).replace('</', '<\\/')
-        event_schema_script = f'\n    <script type="application/ld+json">\n    {json_ld}\n    </script>'
-
-    events_scripts_with_schema = events_scripts + event_schema_script
-
-    events_html_page = build_page(
-        base,
-        page_title='Events — Free State Party',
+    return build_page(
+        ctx['template'],
+        page_title=f'Events{page_suffix} — Free State Party',
         page_description='Open and members-only events from the Free State Party in New Hampshire.',
-        og_title='Events — Free State Party',
+        og_title=f'Events{page_suffix} — Free State Party',
         page_content=events_content,
-        page_scripts=events_scripts_with_schema,
+        page_scripts=events_scripts,
         active_nav='events',
-        is_subdir=True,
-        og_url=f'{BASE_URL}/events/',
-        footer=footer_meta
+        base_path=base,
+        og_url=f"{BASE_URL}/{filepath[:-len('index.html')]}",
+        footer=ctx['footer']
     )
 
 
-    # --- Page 5: Saturdays (unlisted landing page, dynamic from API) ---
-    saturdays_text = read_file(os.path.join(CONTENT_DIR, 'saturdays.md'))
-    saturdays_meta = extract_meta(saturdays_text)
-    saturdays_title, saturdays_body = md_to_html(saturdays_text)
-
-    sat_event = find_saturday_event(api_events)
-    if sat_event:
-        normed = normalize_event(sat_event)
-        sat_date_str = normed['date_str'] if normed else ''
-        sat_rsvp_url = normed['rsvp_url'] if normed else ''
-        sat_address = normed['location'] if normed else ''
-        sat_poster_url = normed['poster_url'] if normed else ''
-        print(f"  Saturday event found: {sat_event.get('title', '?')}")
+def render_event_detail(slug, past, ctx):
+    """/events/<slug>/: one event with its poster, details, RSVP link (while
+    upcoming) and structured data."""
+    event = ctx['event_index'].by_slug[slug]
+    filepath = f'events/{slug}/index.html'
+    base = relative_base(filepath)
+    poster_url = f'{base}/{event.poster_path}' if event.poster_path else event.poster_url
+    maps_url = 'https://www.google.com/maps/search/' + event.location.replace(' ', '+') if event.location else ''
+
+    details = [f'<p class="text-gold-500 text-xl font-medium">{event.date_str}</p>',
+               f'<p class="text-dark-200">{event.time_str}</p>']
+    if event.location:
+        details.append(f'<p class="text-dark-200"><a href="{maps_url}" target="_blank" rel="noopener noreferrer" class="{LINK_CLASS}">{event.location}</a></p>')
+    details_html = '\n            '.join(details)
+
+    description_html = ''
+    if event.description:
+        paragraphs = [p.strip().replace('\n', '<br>') for p in re.split(r'\n\s*\n', event.description) if p.strip()]
+        description_html = f'''
+            <div class="space-y-4 text-lg text-dark-200 leading-relaxed mt-8">
+                {''.join(f'<p>{p}</p>' for p in paragraphs)}
+            </div>'''
+
+    if past:
+        action_html = '<p class="text-dark-300 mt-8">This event has passed.</p>'
     else:
-        nfs = next_first_saturday()
-        sat_date_str = nfs.strftime('%A, %B %-d, %Y')
-        sat_rsvp_url = ''
-        sat_address = ''
-        sat_poster_url = ''
-        print(f"  No Saturday event in API, using fallback date: {sat_date_str}")
+        actions = [f'<a href="{base}/events/{slug}.ics" class="inline-flex items-center justify-center bg-dark-700 hover:bg-dark-600 text-dark-100 font-bold text-lg px-10 py-4 rounded-lg transition-colors min-h-[48px]">Add to calendar</a>']
+        if event.rsvp_url:
+            actions.insert(0, f'<a href="{event.rsvp_url}" class="inline-flex items-center justify-center bg-gold-500 hover:bg-gold-400 text-dark-900 font-bold text-lg px-10 py-4 rounded-lg transition-colors min-h-[48px]">RSVP</a>')
+        action_html = f'''<div class="flex flex-col sm:flex-row gap-4 mt-8">
+                {''.join(actions)}
+            </div>'''
+
+    poster_html = ''
+    if poster_url:
+        poster_html = f'''
+            <img src="{poster_url}" alt="{event.title}" sizes="(min-width: 768px) 720px, 100vw"
+                 class="w-full rounded-lg shadow-2xl mt-10 max-h-[80vh] object-contain">'''
+
+    listing = listing_url('past' if past else 'upcoming', 1, base)
+    event_content = f'''
+    <section class="px-6 pt-32 pb-20 md:pt-40 md:pb-28">
+        <div class="max-w-3xl mx-auto">
+            <p class="mb-8 text-sm font-medium"><a href="{listing}" class="text-dark-300 hover:text-gold-500 transition-colors">&larr; {'Past events' if past else 'All events'}</a></p>
+            <div class="divider mb-6"></div>
+            <h1 class="font-display text-3xl md:text-4xl font-bold text-dark-50 mb-4">{event.title}</h1>
+            {details_html}{description_html}
+            {action_html}{poster_html}
+        </div>
+    </section>'''
+
+    event_scripts = json_ld_script(event_schema(event))
+
+    description = ' '.join(event.description_raw.split())
+    if len(description) > 160:
+        description = description[:157].rsplit(' ', 1)[0] + '…'
+    return build_page(
+        ctx['template'],
+        page_title=f'{event.title_raw} — Free State Party',
+        page_description=description or f'{event.date_str}, {event.time_str}. A Free State Party event in New Hampshire.',
+        og_title=event.title_raw,
+        page_content=event_content,
+        page_scripts=event_scripts,
+        active_nav='events',
+        base_path=base,
+        og_url=f'{BASE_URL}/events/{slug}/',
+        og_image=f'/{event.poster_path}' if event.poster_path else '',
+        footer=ctx['footer']
+    )
+
+
+def render_saturday(ctx):
+    """Page 5: Saturdays (unlisted landing page, dynamic from API)."""
+    saturdays = load_content('saturdays.md')
+    saturdays_meta = saturdays.meta
+    saturdays_title, saturdays_body = saturdays.h2_title, saturdays.body_html
+
+    sat = ctx['saturday']
+    sat_date_str = sat['date_str']
+    sat_rsvp_url = sat['rsvp_url']
+    sat_address = sat['address']
+    sat_poster_url = f"../{sat['poster_path']}" if sat['poster_path'] else sat['poster_url']
 
     sat_maps_url = 'https://www.google.com/maps/search/' + sat_address.replace(' ', '+') if sat_address else ''
 
@@ -714,7 +1521,7 @@ def build():
     <section class="px-6 pb-8 md:pb-10">
         <div class="max-w-4xl mx-auto">
             {poster_link_open}
-                <img src="{sat_poster_url}" alt="Free State Saturday — this month's gathering"
+                <img src="{sat_poster_url}" alt="Free State Saturday — this month's gathering" sizes="(min-width: 896px) 896px, 100vw"
                      class="w-full rounded-lg shadow-2xl hover:opacity-90 transition-opacity max-h-[80vh] object-contain">
             {poster_link_close}
         </div>
@@ -742,8 +1549,8 @@ def build():
         </div>
     </section>{buttons_html}{poster_html}{bottom_buttons_html}'''
 
-    saturdays_html = build_page(
-        base,
+    return build_page(
+        ctx['template'],
         page_title=saturdays_meta['title'],
         page_description=saturdays_meta['description'],
         og_title=saturdays_meta.get('og_title', saturdays_meta['title']),
@@ -752,13 +1559,31 @@ def build():
         is_subdir=True,
         og_url=f'{BASE_URL}/saturday/',
         og_image=saturdays_meta.get('og_image', ''),
-        footer=footer_meta
+        footer=ctx['footer']
     )
 
-    # --- Page 6: Business (unlisted, noindex — for Stripe) ---
-    business_text = read_file(os.path.join(CONTENT_DIR, 'business.md'))
-    business_meta = extract_meta(business_text)
-    _, business_sections = parse_sections(business_text)
+
+def render_saturday_rsvp(ctx):
+    """/saturday/rsvp/ redirect (only if we have an RSVP URL)."""
+    sat_rsvp_url = ctx['saturday']['rsvp_url']
+    if not sat_rsvp_url:
+        return None
+    return f'''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<meta http-equiv="refresh" content="0; url={sat_rsvp_url}">
+<title>Redirecting...</title>
+</head>
+<body>
+</body>
+</html>'''
+
+
+def render_business(ctx):
+    """Page 6: Business (unlisted, noindex — for Stripe)."""
+    business = load_content('business.md')
+    business_meta, business_sections = business.meta, business.sections
 
     business_sections_html = ''
     for i, (sec_title, sec_body) in enumerate(business_sections):
@@ -778,8 +1603,8 @@ def build():
     business_content = f'''
     <h1 class="sr-only">{business_h1}</h1>''' + business_sections_html
 
-    business_html = build_page(
-        base,
+    return build_page(
+        ctx['template'],
         page_title=business_meta['title'],
         page_description=business_meta['description'],
         og_title=business_meta.get('og_title', business_meta['title']),
@@ -788,98 +1613,2064 @@ def build():
         is_subdir=True,
         og_url=f'{BASE_URL}/business/',
         noindex=True,
-        footer=footer_meta
+        footer=ctx['footer']
     )
 
-    # --- Write all pages ---
-    # Root page stays as index.html; all others become <name>/index.html for clean URLs
-    pages = {
-        'index.html': home_html,
-        'about/index.html': about_html,
-        'events/index.html': events_html_page,
-        'business/index.html': business_html,
-        'saturday/index.html': saturdays_html,
+
+# Root page stays as index.html; all others become <name>/index.html for clean URLs.
+# Each page: (output path, renderer, inputs beyond COMMON_INPUTS). Inputs are
+# source paths relative to the repo root, or names of build-context values.
+PAGES = [
+    ('index.html', render_home, ('content/hero.md', 'content/words.md')),
+    ('about/index.html', render_about, ('content/about.md',)),
+    ('business/index.html', render_business, ('content/business.md',)),
+    ('saturday/index.html', render_saturday, ('content/saturdays.md', 'saturday')),
+    ('saturday/rsvp/index.html', render_saturday_rsvp, ('saturday',)),
+]
+COMMON_INPUTS = ('build.py', 'templates/base.html', 'content/footer.md', 'images', 'assets', 'minify')
+
+
+def event_pages(index):
+    """PAGES-style entries for the event listings and detail pages, plus
+    the digest of each one's events, so a page re-renders only when the
+    events it shows change. Returns ([(path, renderer, inputs)], {input: digest})."""
+    pages = []
+    digests = {}
+    for kind, events in (('upcoming', index.upcoming), ('past', index.past)):
+        if kind == 'past' and not events:
+            continue
+        count = listing_page_count(events)
+        for number in range(1, count + 1):
+            name = f'events:{kind}:{number}'
+            digests[name] = value_digest({
+                'events': [event._asdict() for event in events[(number - 1) * EVENTS_PER_PAGE:number * EVENTS_PER_PAGE]],
+                'pages': count,
+                'archive': bool(index.past),
+            })
+            pages.append((listing_path(kind, number), functools.partial(render_event_listing, kind, number), (name,)))
+        for event in events:
+            name = f'event:{event.slug}'
+            digests[name] = value_digest({'event': event._asdict(), 'past': kind == 'past'})
+            pages.append((f'events/{event.slug}/index.html',
+                          functools.partial(render_event_detail, event.slug, kind == 'past'), (name,)))
+    return pages, digests
+
+
+def prune_event_outputs(filepaths):
+    """Delete files under site/events/ that are not in filepaths (pages and
+    calendars of events that left the feed, listing pages no longer
+    needed), with their precompressed siblings and emptied directories.
+    Returns [removed paths]."""
+    removed = []
+    root = os.path.join(SITE_DIR, 'events')
+    for dirpath, _, names in os.walk(root, topdown=False):
+        for name in names:
+            path = os.path.relpath(os.path.join(dirpath, name), SITE_DIR).replace(os.sep, '/')
+            if not name.endswith(COMPRESSED_SUFFIXES) and path not in filepaths:
+                for suffix in ('',) + COMPRESSED_SUFFIXES:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(os.path.join(dirpath, name + suffix))
+                removed.append(path)
+        if dirpath != root and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return removed
+
+
+# --- Event feeds ---
+# Calendar and feed files built from the same normalized events as the
+# pages, so subscribers poll the static site rather than the API.
+FEED_TITLE = 'Free State Party Events'
+ATOM_ENTRIES = 50
+
+
+def _ics_text(value):
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\n').replace('\n', '\\n'))
+
+
+def _ics_line(line):
+    """Fold a content line at 75 octets, never inside a UTF-8 sequence."""
+    data = line.encode('utf-8')
+    parts = []
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        while data[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode('utf-8'))
+        data = data[cut:]
+        limit = 74  # continuation lines start with a space
+    parts.append(data.decode('utf-8'))
+    return '\r\n '.join(parts)
+
+
+def _utc_stamp(dt):
+    return dt.astimezone(ZoneInfo('UTC')).strftime('%Y%m%dT%H%M%SZ')
+
+
+def render_ics(events):
+    """iCalendar (RFC 5545) document with one VEVENT per event."""
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Free State Party//Events//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_ics_text(FEED_TITLE)}',
+    ]
+    for event in events:
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:{event.slug}@{urllib.parse.urlsplit(BASE_URL).hostname}',
+            f'DTSTAMP:{_utc_stamp(event.updated_at or event.starts_at)}',
+            f'DTSTART:{_utc_stamp(event.starts_at)}',
+        ]
+        if event.ends_at:
+            lines.append(f'DTEND:{_utc_stamp(event.ends_at)}')
+        lines.append(f'SUMMARY:{_ics_text(event.title_raw)}')
+        if event.description_raw:
+            lines.append(f'DESCRIPTION:{_ics_text(event.description_raw)}')
+        if event.location_raw:
+            lines.append(f'LOCATION:{_ics_text(event.location_raw)}')
+        lines.append(f'URL:{BASE_URL}/events/{event.slug}/')
+        lines.append('END:VEVENT')
+    lines.append('END:VCALENDAR')
+    return ''.join(_ics_line(line) + '\r\n' for line in lines)
+
+
+def render_events_json(events):
+    """Compact JSON array of events for scripts and widgets."""
+    items = []
+    for event in events:
+        item = {
+            'slug': event.slug,
+            'title': event.title_raw,
+            'startsAt': event.starts_at_raw,
+            'endsAt': event.ends_at_raw or None,
+            'description': event.description_raw,
+            'location': event.location_raw,
+            'url': f'{BASE_URL}/events/{event.slug}/',
+            'rsvpUrl': event.rsvp_url_raw or None,
+            'image': f'{BASE_URL}/{event.poster_path}' if event.poster_path else event.poster_url_raw or None,
+        }
+        items.append(item)
+    return json.dumps(items, separators=(',', ':'), ensure_ascii=False) + '\n'
+
+
+def render_atom(events):
+    """Atom feed with an entry per event, linking the detail pages."""
+    def stamp(dt):
+        return dt.astimezone(ZoneInfo('UTC')).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    entries = []
+    for event in events:
+        url = f'{BASE_URL}/events/{event.slug}/'
+        summary = f'{event.date_str}, {event.time_str}' + (f' — {event.location_raw}' if event.location_raw else '')
+        content = f'<p>{escape(summary)}</p>' + ''.join(
+            f'<p>{escape(p.strip())}</p>' for p in re.split(r'\n\s*\n', event.description_raw) if p.strip())
+        entries.append(f'''  <entry>
+    <title>{escape(event.title_raw)}</title>
+    <link href="{url}"/>
+    <id>{url}</id>
+    <published>{stamp(event.starts_at)}</published>
+    <updated>{stamp(event.updated_at or event.starts_at)}</updated>
+    <summary>{escape(summary)}</summary>
+    <content type="html">{escape(content)}</content>
+  </entry>
+''')
+    updated = max((event.updated_at or event.starts_at for event in events), default=None)
+    return f'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>{FEED_TITLE}</title>
+  <link href="{BASE_URL}/events.atom" rel="self"/>
+  <link href="{BASE_URL}/events/"/>
+  <id>{BASE_URL}/events/</id>
+  <updated>{stamp(updated) if updated else '1970-01-01T00:00:00Z'}</updated>
+{''.join(entries)}</feed>
+'''
+
+
+def event_feeds(index):
+    """Every feed file as (path, renderer, events): the site-wide calendar,
+    JSON and Atom feeds (upcoming soonest first, then past most recent
+    first) and a single-event calendar beside each detail page."""
+    events = index.upcoming + index.past
+    feeds = [
+        ('events.ics', render_ics, events),
+        ('events.json', render_events_json, events),
+        ('events.atom', render_atom, events[:ATOM_ENTRIES]),
+    ]
+    feeds += [(f'events/{event.slug}.ics', render_ics, (event,)) for event in events]
+    return feeds
+
+
+def write_feeds(index, previous, build_digest):
+    """Write the feeds whose events (or build.py) changed since the previous
+    build's manifest entry; unchanged ones are not regenerated.
+    Returns ({path: manifest entry}, [changed output paths])."""
+    event_digests = {event.slug: value_digest(event._asdict()) for event in index.by_slug.values()}
+    entries = {}
+    changed = []
+    for path, render, events in event_feeds(index):
+        inputs_digest = value_digest([build_digest] + [event_digests[event.slug] for event in events])
+        entry = previous.get(path)
+        if (entry and entry.get('inputs') == inputs_digest
+                and entry.get('output') == file_digest(os.path.join(SITE_DIR, path))):
+            entries[path] = entry
+            continue
+        data = render(events).encode('utf-8')
+        entries[path] = {'inputs': inputs_digest, 'output': hashlib.sha256(data).hexdigest()}
+        if write_output(path, data):
+            changed.append(path)
+            print(f"  Wrote: site/{path}")
+    return entries, changed
+
+
+MANIFEST_NAME = '.build-manifest.json'
+MANIFEST_VERSION = 3
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                h.update(chunk)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
+def value_digest(value):
+    """SHA-256 of a JSON-serializable value in canonical form."""
+    data = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def load_manifest(section='pages'):
+    """Read one section ('pages', 'feeds' or 'compressed') of the previous build's
+    manifest. Returns {} if missing, unreadable or from another manifest
+    version."""
+    try:
+        with open(os.path.join(SITE_DIR, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    entries = manifest.get(section)
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_manifest(pages, feeds, compressed):
+    data = json.dumps({'version': MANIFEST_VERSION, 'pages': pages, 'feeds': feeds, 'compressed': compressed},
+                      indent=2, sort_keys=True) + '\n'
+    write_output(MANIFEST_NAME, data)
+
+
+def atomic_write(path, data):
+    """Write data (str or bytes) to a temp file beside path, then rename it
+    into place so readers never see a partial file."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_output(filepath, data):
+    """Write data (str or bytes) to site/<filepath> only if it differs from the
+    bytes already there, via atomic_write(); unchanged files keep their mtime.
+    Returns True if the file was written."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    full_path = os.path.join(SITE_DIR, filepath)
+    if file_digest(full_path) == hashlib.sha256(data).hexdigest():
+        return False
+    atomic_write(full_path, data)
+    return True
+
+
+CHANGED_NAME = '.changed'
+REMOVED_NAME = '.removed'
+
+
+def save_changed(paths):
+    """Record this build's changed outputs (relative to site/, one per line):
+    those still in site/ go to site/.changed for `rsync --files-from`, those
+    the build removed to site/.removed for the deploy to delete. Both are
+    empty when nothing changed."""
+    paths = sorted(set(paths))
+    kept = [p for p in paths if os.path.isfile(os.path.join(SITE_DIR, p))]
+    removed = [p for p in paths if not os.path.isfile(os.path.join(SITE_DIR, p))]
+    write_output(CHANGED_NAME, ''.join(f'{p}\n' for p in kept))
+    write_output(REMOVED_NAME, ''.join(f'{p}\n' for p in removed))
+
+
+# --- Event posters ---
+# Remote posters are mirrored into site/img/events/ so pages don't hotlink
+# the API host; responsive variants are then generated like any local image.
+POSTER_DIR = 'img/events'
+POSTER_FETCH_WORKERS = 4
+# HTTP cache directory for posters, apart from the API responses so entries
+# for posters the API no longer lists can be pruned
+POSTER_CACHE = 'posters'
+# {poster URL: mirrored path} as of the last build, so a poster that fails
+# to download keeps the file it was mirrored to
+POSTER_INDEX = f'{POSTER_DIR}/.index.json'
+_IMAGE_SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpg'),
+    (b'GIF8', 'gif'),
+]
+
+
+def sniff_image_ext(data):
+    """File extension for image bytes, by magic number. Raises ValueError
+    for anything that isn't a PNG, JPEG, GIF, WebP or AVIF image."""
+    for signature, ext in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return ext
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    if data[4:12] in (b'ftypavif', b'ftypavis'):
+        return 'avif'
+    raise ValueError('response is not a recognized image')
+
+
+def _fetch_poster(url):
+    data, _ = cached_fetch(url, validate=sniff_image_ext, cache=POSTER_CACHE)
+    return data
+
+
+def _load_poster_index():
+    try:
+        with open(os.path.join(SITE_DIR, POSTER_INDEX), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def mirror_posters(events, evict=True):
+    """Download each event's poster (conditionally, through the HTTP cache)
+    into site/img/events/<content hash>.<ext> and set poster_path on the event.
+    A poster that can't be fetched and was never cached keeps the file it was
+    last mirrored to, or failing that its remote URL.
+    With evict (events is the list the API just returned), mirrored files
+    and cache entries for posters it no longer lists are removed; nothing is
+    removed for a fallback or empty list.
+    Returns (events, [changed output paths])."""
+    urls = sorted({event.poster_url_raw for event in events if event.poster_url_raw})
+    previous = _load_poster_index()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=POSTER_FETCH_WORKERS) as pool:
+        futures = {url: pool.submit(_fetch_poster, url) for url in urls}
+
+    paths = {}
+    changed = []
+    for url in urls:
+        try:
+            data = futures[url].result()
+        except Exception as e:
+            path = previous.get(url)
+            if path and os.path.isfile(os.path.join(SITE_DIR, path)):
+                print(f"  WARNING: Could not mirror poster {url} ({e}); keeping site/{path}")
+                paths[url] = path
+            else:
+                print(f"  WARNING: Could not mirror poster {url}: {e}")
+            continue
+        path = f'{POSTER_DIR}/{hashlib.sha256(data).hexdigest()[:16]}.{sniff_image_ext(data)}'
+        if write_output(path, data):
+            changed.append(path)
+            print(f"  Mirrored poster: site/{path}")
+        paths[url] = path
+
+    poster_dir = os.path.join(SITE_DIR, POSTER_DIR)
+    if evict and events:
+        for name in os.listdir(poster_dir) if os.path.isdir(poster_dir) else ():
+            if not name.startswith('.') and f'{POSTER_DIR}/{name}' not in paths.values():
+                os.unlink(os.path.join(poster_dir, name))
+                changed.append(f'{POSTER_DIR}/{name}')
+        pruned = prune_http_cache(POSTER_CACHE, urls)
+        if pruned:
+            print(f"  Pruned {pruned} cached poster(s) no longer listed")
+        index = paths
+    else:
+        index = {**previous, **paths}
+    if index != previous:
+        write_output(POSTER_INDEX, json.dumps(index, indent=2, sort_keys=True) + '\n')
+    events = tuple(event._replace(poster_path=paths.get(event.poster_url_raw, '')) for event in events)
+    return events, changed
+
+
+# --- Responsive images ---
+# Raster images under these site/ directories get width-stepped AVIF/WebP
+# variants plus a recompressed fallback. Icons and og:images keep their
+# fixed URLs and sizes.
+RESPONSIVE_IMAGE_DIRS = ('img', POSTER_DIR)
+RESPONSIVE_IMAGE_SKIP = {'img/apple-touch-icon.png', 'img/og-default.png'}
+IMAGE_VARIANT_DIR = 'img/r'
+IMAGE_WIDTHS = (480, 960, 1440)
+IMAGE_QUALITY = {'avif': 50, 'webp': 75, 'jpeg': 80}
+IMAGE_MIME = {'avif': 'image/avif', 'webp': 'image/webp', 'jpeg': 'image/jpeg', 'png': 'image/png'}
+IMAGE_EXT = {'avif': 'avif', 'webp': 'webp', 'jpeg': 'jpg', 'png': 'png'}
+DEFAULT_IMAGE_SIZES = '(min-width: 768px) 720px, 100vw'
+
+
+class ImageSet(namedtuple('ImageSet', ['width', 'height', 'fallback', 'variants'])):
+    """Generated variants of one source image.
+
+    width / height: intrinsic size of the largest variant
+    fallback: format of the <img> fallback ('jpeg', or 'png' if the source has alpha)
+    variants: tuple of (format, width, site-relative path), narrowest first"""
+    __slots__ = ()
+
+    def srcset(self, fmt, base):
+        return ', '.join(f'{base}/{path} {w}w' for f, w, path in self.variants if f == fmt)
+
+    def largest(self, fmt):
+        return [path for f, _, path in self.variants if f == fmt][-1]
+
+
+def _image_formats():
+    formats = ['webp']
+    if pil_features.check('avif'):
+        formats.insert(0, 'avif')
+    return formats
+
+
+def _encode_image(img, fmt):
+    buf = io.BytesIO()
+    if fmt == 'jpeg':
+        img.convert('RGB').save(buf, 'JPEG', quality=IMAGE_QUALITY['jpeg'], optimize=True, progressive=True)
+    elif fmt == 'png':
+        img.save(buf, 'PNG', optimize=True)
+    elif fmt == 'webp':
+        img.save(buf, 'WEBP', quality=IMAGE_QUALITY['webp'], method=6)
+    else:
+        img.save(buf, 'AVIF', quality=IMAGE_QUALITY['avif'])
+    return buf.getvalue()
+
+
+def _generate_variants(data, cache_path):
+    """Resize and encode one source image into cache_path. Returns the meta dict."""
+    img = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+    has_alpha = img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+    img = img.convert('RGBA' if has_alpha else 'RGB')
+    if has_alpha and img.getchannel('A').getextrema()[0] == 255:
+        img, has_alpha = img.convert('RGB'), False
+    fallback = 'png' if has_alpha else 'jpeg'
+
+    widths = sorted({w for w in IMAGE_WIDTHS if w < img.width} | {min(img.width, IMAGE_WIDTHS[-1])})
+    variants = []
+    for width in widths:
+        height = round(img.height * width / img.width)
+        resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+        for fmt in _image_formats() + [fallback]:
+            name = f'{width}.{IMAGE_EXT[fmt]}'
+            atomic_write(os.path.join(cache_path, name), _encode_image(resized, fmt))
+            variants.append([fmt, width, name])
+    meta = {
+        'width': widths[-1],
+        'height': round(img.height * widths[-1] / img.width),
+        'fallback': fallback,
+        'variants': variants,
     }
+    atomic_write(os.path.join(cache_path, 'meta.json'), json.dumps(meta, indent=2) + '\n')
+    return meta
 
-    # --- /saturday/rsvp/ redirect (only if we have an RSVP URL) ---
-    if sat_rsvp_url:
-        rsvp_redirect_html = f'''<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<meta http-equiv="refresh" content="0; url={sat_rsvp_url}">
-<title>Redirecting...</title>
-</head>
-<body>
-</body>
-</html>'''
-        pages['saturday/rsvp/index.html'] = rsvp_redirect_html
 
-    for filepath, html in pages.items():
+def _load_variant_meta(cache_path):
+    try:
+        with open(os.path.join(cache_path, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if all(os.path.exists(os.path.join(cache_path, name)) for _, _, name in meta['variants']):
+        return meta
+    return None
+
+
+def process_images():
+    """Generate responsive variants for every raster image in
+    RESPONSIVE_IMAGE_DIRS and copy them into site/img/r/.
+
+    Work is cached under .cache/images/ by a hash of the source bytes and
+    encoder settings, so unchanged images are never re-encoded. Variants no
+    longer produced by any source are removed from site/img/r/.
+    Returns ({source path: ImageSet}, [changed output paths]). Without
+    Pillow installed, returns ({}, []) and images ship as-is."""
+    if Image is None:
+        print("  Pillow not installed; skipping responsive images")
+        return {}, []
+
+    settings = repr((IMAGE_WIDTHS, sorted(IMAGE_QUALITY.items()), _image_formats())).encode('utf-8')
+    image_sets = {}
+    changed = []
+    expected = set()
+    for directory in RESPONSIVE_IMAGE_DIRS:
+        try:
+            names = sorted(os.listdir(os.path.join(SITE_DIR, directory)))
+        except FileNotFoundError:
+            continue
+        for name in names:
+            relpath = f'{directory}/{name}'
+            if relpath in RESPONSIVE_IMAGE_SKIP or not name.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
+                continue
+            with open(os.path.join(SITE_DIR, relpath), 'rb') as f:
+                data = f.read()
+            key = hashlib.sha256(data + settings).hexdigest()[:16]
+            cache_path = os.path.join(CACHE_DIR, 'images', key)
+            meta = _load_variant_meta(cache_path)
+            if meta is None:
+                try:
+                    meta = _generate_variants(data, cache_path)
+                except Exception as e:
+                    print(f"  WARNING: Could not process image {relpath}: {e}")
+                    continue
+                print(f"  Processed image: site/{relpath}")
+
+            stem = os.path.splitext(name)[0]
+            variants = []
+            for fmt, width, cached_name in meta['variants']:
+                out_path = f'{IMAGE_VARIANT_DIR}/{stem}-{width}.{key[:10]}.{IMAGE_EXT[fmt]}'
+                expected.add(out_path)
+                with open(os.path.join(cache_path, cached_name), 'rb') as f:
+                    if write_output(out_path, f.read()):
+                        changed.append(out_path)
+                variants.append((fmt, width, out_path))
+            image_sets[relpath] = ImageSet(meta['width'], meta['height'], meta['fallback'], tuple(variants))
+
+    variant_dir = os.path.join(SITE_DIR, IMAGE_VARIANT_DIR)
+    if os.path.isdir(variant_dir):
+        for name in os.listdir(variant_dir):
+            if f'{IMAGE_VARIANT_DIR}/{name}' not in expected:
+                os.unlink(os.path.join(variant_dir, name))
+                changed.append(f'{IMAGE_VARIANT_DIR}/{name}')
+    return image_sets, changed
+
+
+_IMG_TAG_RE = re.compile(r'<img\b[^>]*>')
+_IMG_SRC_RE = re.compile(r'\ssrc="([^"]*)"')
+_IMG_SIZES_RE = re.compile(r'\ssizes="([^"]*)"')
+
+
+def relative_base(filepath):
+    """Relative path from a site/ output file back to the site root."""
+    depth = filepath.count('/')
+    return '/'.join(['..'] * depth) if depth else '.'
+
+
+def responsive_images(html, image_sets, base):
+    """Rewrite <img> tags whose src is a processed local image into <picture>
+    elements with AVIF/WebP sources, a srcset on the fallback, and intrinsic
+    width/height. sizes is taken from the tag, or DEFAULT_IMAGE_SIZES. Any
+    other <img> (a remote poster, or any image without Pillow) loses a sizes
+    attribute it has no srcset for."""
+    prefix = f'{base}/'
+
+    def rewrite(m):
+        tag = m.group(0)
+        src = _IMG_SRC_RE.search(tag)
+        image = None
+        if src and src.group(1).startswith(prefix):
+            image = image_sets.get(src.group(1)[len(prefix):])
+        if image is None:
+            return tag if ' srcset=' in tag else _IMG_SIZES_RE.sub('', tag)
+        sizes_match = _IMG_SIZES_RE.search(tag)
+        sizes = sizes_match.group(1) if sizes_match else DEFAULT_IMAGE_SIZES
+
+        attrs = f' srcset="{image.srcset(image.fallback, base)}"'
+        if not sizes_match:
+            attrs += f' sizes="{sizes}"'
+        if ' width=' not in tag:
+            attrs += f' width="{image.width}" height="{image.height}"'
+        img = tag[:src.start()] + f' src="{base}/{image.largest(image.fallback)}"' + attrs + tag[src.end():]
+        sources = ''.join(
+            f'<source type="{IMAGE_MIME[fmt]}" srcset="{image.srcset(fmt, base)}" sizes="{sizes}">'
+            for fmt in dict.fromkeys(f for f, _, _ in image.variants) if fmt != image.fallback
+        )
+        return f'<picture>{sources}{img}</picture>'
+
+    return _IMG_TAG_RE.sub(rewrite, html)
+
+
+# --- Asset fingerprinting ---
+# Files directly under these site/ directories are copied to
+# assets/<dir>/<name>.<content hash>.<ext>, and rendered pages link the
+# copies, so every asset URL can be cached forever. The originals keep their
+# URLs for outside links. Subdirectories (img/r, img/events) are already
+# content-addressed, and so are the responsive variants pages use in place of
+# a processed image, so those sources aren't copied.
+ASSET_DIRS = ('img',)
+ASSET_OUTPUT_DIR = 'assets'
+
+
+def fingerprint_assets(skip=()):
+    """Copy each static asset in ASSET_DIRS, other than the paths in skip,
+    to its fingerprinted path and remove copies no longer produced.
+    Returns ({original path: fingerprinted path}, [changed output paths])."""
+    assets = {}
+    changed = []
+    for directory in ASSET_DIRS:
+        try:
+            names = sorted(os.listdir(os.path.join(SITE_DIR, directory)))
+        except FileNotFoundError:
+            continue
+        for name in names:
+            path = f'{directory}/{name}'
+            if (name.startswith('.') or name.endswith(COMPRESSED_SUFFIXES) or path in skip
+                    or not os.path.isfile(os.path.join(SITE_DIR, path))):
+                continue
+            with open(os.path.join(SITE_DIR, path), 'rb') as f:
+                data = f.read()
+            stem, ext = os.path.splitext(name)
+            hashed = f'{ASSET_OUTPUT_DIR}/{directory}/{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+            if write_output(hashed, data):
+                changed.append(hashed)
+            assets[path] = hashed
+
+    expected = set(assets.values())
+    for root, _, names in os.walk(os.path.join(SITE_DIR, ASSET_OUTPUT_DIR)):
+        for name in names:
+            full_path = os.path.join(root, name)
+            # Precompressed siblings are cleaned up with their source
+            if name.endswith(COMPRESSED_SUFFIXES):
+                continue
+            path = os.path.relpath(full_path, SITE_DIR).replace(os.sep, '/')
+            if path not in expected:
+                os.unlink(full_path)
+                changed.append(path)
+    return assets, changed
+
+
+@functools.lru_cache(maxsize=16)
+def _asset_url_re(names, base):
+    prefixes = '|'.join(re.escape(prefix) for prefix in (f'{base}/', f'{BASE_URL}/'))
+    paths = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(f'({prefixes})({paths})(?=["\'\\s),?#]|$)')
+
+
+def fingerprint_urls(html, assets, base):
+    """Point every {base}/<asset> and absolute BASE_URL/<asset> reference in
+    html (attributes, inline scripts, og:image) at the fingerprinted copy."""
+    if not assets:
+        return html
+    return _asset_url_re(frozenset(assets), base).sub(lambda m: m.group(1) + assets[m.group(2)], html)
+
+
+# --- HTML minification ---
+# Opt-in (--minify). Drops comments and collapses whitespace between and
+# inside tags; <pre>, <textarea>, <style> and <script> bodies are copied
+# through untouched except JSON-LD, which is re-serialized compactly.
+_MINIFY_TOKEN_RE = re.compile(
+    r'(<!--.*?-->)'
+    r'|(<(pre|textarea|style|script)\b[^>]*>.*?</\3\s*>)'
+    r'|(<[a-zA-Z/!][^>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^>"\']*)*>)'
+    r'|[^<]+|<',
+    re.S | re.I,
+)
+_TAG_NAME_RE = re.compile(r'</?([a-zA-Z][\w-]*)')
+# Quoted attribute values are kept as-is; whitespace before the closing > or
+# /> is dropped, any other run becomes one space.
+_TAG_SPACE_RE = re.compile(r'("[^"]*"|\'[^\']*\')|(\s+(?=/?>\Z))|\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_JSON_LD_RE = re.compile(r'(<script\b[^>]*type="application/ld\+json"[^>]*>)(.*?)(</script\s*>)', re.S | re.I)
+# Whitespace next to these tags never renders, so it is dropped; anywhere
+# else (between inline elements) it collapses to a single space.
+BLOCK_TAGS = frozenset(
+    'html head body title meta link base script style noscript template header nav main footer '
+    'section article aside div p h1 h2 h3 h4 h5 h6 ul ol li dl dt dd table thead tbody tfoot tr th '
+    'td form fieldset legend figure figcaption blockquote hr br pre textarea source'.split())
+
+
+def _is_block(tag):
+    m = _TAG_NAME_RE.match(tag)
+    return m is not None and m.group(1).lower() in BLOCK_TAGS
+
+
+def _compact_json_ld(m):
+    try:
+        data = json.loads(m.group(2))
+    except ValueError:
+        return m.group(0)
+    return m.group(1) + json.dumps(data, separators=(',', ':'), ensure_ascii=False).replace('</', '<\\/') + m.group(3)
+
+
+def _collapse_tag_space(m):
+    quoted, closing = m.group(1, 2)
+    return quoted or ('' if closing else ' ')
+
+
+def _collapse_text(text, after_block, before_block):
+    text = _WHITESPACE_RE.sub(' ', text)
+    if after_block:
+        text = text.lstrip(' ')
+    if before_block:
+        text = text.rstrip(' ')
+    return text
+
+
+def minify_html(html):
+    """Minified copy of a rendered page, produced in one streaming pass.
+    Text is buffered only until the next tag decides whether its edge
+    whitespace can render."""
+    out = []
+    text = []
+    after_block = True
+    for m in _MINIFY_TOKEN_RE.finditer(html):
+        comment, raw, _, tag = m.groups()
+        if comment:
+            continue
+        if raw:
+            if raw[1:7].lower() == 'script':
+                raw = _JSON_LD_RE.sub(_compact_json_ld, raw, count=1)
+            tag = raw
+        elif tag:
+            tag = _TAG_SPACE_RE.sub(_collapse_tag_space, tag)
+        else:
+            text.append(m.group(0))
+            continue
+        block = _is_block(tag)
+        if text:
+            out.append(_collapse_text(''.join(text), after_block, block))
+            text = []
+        out.append(tag)
+        after_block = block
+    if text:
+        out.append(_collapse_text(''.join(text), after_block, True))
+    return ''.join(out)
+
+
+# --- Fonts ---
+# Playfair Display and Inter are self-hosted from the OFL variable fonts in
+# fonts/, subset to the characters the site actually renders and written to
+# site/fonts/<slug>.<content hash>.woff2. Without fontTools or the source
+# files, pages keep loading them from Google Fonts. The sources (with the
+# OFL.txt that must ship alongside them) aren't vendored yet, so the site
+# uses Google Fonts until they are committed.
+FONT_DIR = os.path.join(SCRIPT_DIR, 'fonts')
+FONT_OUTPUT_DIR = 'fonts'
+# (family, source file in FONT_DIR, weight range, preload)
+FONT_FACES = (
+    ('Playfair Display', 'PlayfairDisplay[wght].ttf', '400 900', True),
+    ('Inter', 'Inter[opsz,wght].ttf', '400 700', True),
+)
+# Always kept, so small copy edits don't fall back to the system font
+FONT_BASE_CHARS = frozenset(chr(c) for c in range(0x20, 0x7f))
+GOOGLE_FONTS_TAGS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">',
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>',
+    '<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;700;900'
+    '&family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">',
+)
+_TEXT_NODE_RE = re.compile(r'<(script|style)\b([^>]*)>(.*?)</\1>|<[^>]*>|([^<]+)', re.S)
+_ALT_ATTR_RE = re.compile(r'\s(?:alt|placeholder|value|aria-label)="([^"]*)"')
+
+
+class FontFace(namedtuple('FontFace', ['family', 'weight', 'path', 'preload'])):
+    """A self-hosted font subset: CSS family and weight range, site-relative
+    path of the WOFF2 file, and whether pages preload it."""
+    __slots__ = ()
+
+
+def page_chars(html):
+    """Characters a rendered page can display: text nodes, text-bearing
+    attributes, and string literals in inline scripts (the home page's
+    cycling words). JSON-LD and styles are never rendered."""
+    chars = set()
+    for m in _TEXT_NODE_RE.finditer(html):
+        if m.group(4) is not None:
+            chars.update(unescape(m.group(4)))
+        elif m.group(1) == 'script' and 'ld+json' not in m.group(2):
+            for quoted in _QUOTED_RE.finditer(m.group(3)):
+                chars.update(quoted.group(2))
+    for m in _ALT_ATTR_RE.finditer(html):
+        chars.update(unescape(m.group(1)))
+    return {c for c in chars if not c.isspace() or c == ' '}
+
+
+def _subset_font(source, text):
+    options = font_subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    font = font_subset.load_font(source, options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    buf = io.BytesIO()
+    font_subset.save_font(font, buf, options)
+    return buf.getvalue()
+
+
+def subset_fonts(chars):
+    """Subset every FONT_FACES source to chars (plus FONT_BASE_CHARS) into
+    site/fonts/, reusing cached subsets, and remove superseded files.
+    Returns ((FontFace, ...), [changed output paths]); no faces when the
+    sources or fontTools/Brotli are unavailable."""
+    sources = [os.path.join(FONT_DIR, filename) for _, filename, _, _ in FONT_FACES]
+    missing = [path for path in sources if not os.path.isfile(path)]
+    if len(missing) == len(sources) and not os.path.isdir(FONT_DIR):
+        return (), []
+    if missing:
+        print(f"  WARNING: Missing font sources, using Google Fonts: {', '.join(map(os.path.basename, missing))}")
+        return (), []
+    if font_subset is None or brotli is None:
+        print("  WARNING: fontTools and Brotli are needed to self-host fonts, using Google Fonts")
+        return (), []
+
+    text = ''.join(sorted(set(chars) | FONT_BASE_CHARS))
+    fonts = []
+    changed = []
+    for (family, _, weight, preload), source in zip(FONT_FACES, sources):
+        with open(source, 'rb') as f:
+            source_hash = hashlib.sha256(f.read()).hexdigest()
+        key = hashlib.sha256(f'{source_hash}\0{text}'.encode('utf-8')).hexdigest()[:16]
+        cache_path = os.path.join(CACHE_DIR, 'fonts', f'{key}.woff2')
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = _subset_font(source, text)
+            atomic_write(cache_path, data)
+        slug = re.sub(r'[^a-z0-9]+', '-', family.lower()).strip('-')
+        path = f'{FONT_OUTPUT_DIR}/{slug}.{hashlib.sha256(data).hexdigest()[:10]}.woff2'
+        if write_output(path, data):
+            changed.append(path)
+            print(f"  Subset font: site/{path} ({len(data) // 1024} KB)")
+        fonts.append(FontFace(family, weight, path, preload))
+
+    expected = {font.path for font in fonts}
+    font_dir = os.path.join(SITE_DIR, FONT_OUTPUT_DIR)
+    for name in os.listdir(font_dir):
+        if f'{FONT_OUTPUT_DIR}/{name}' not in expected:
+            os.unlink(os.path.join(font_dir, name))
+            changed.append(f'{FONT_OUTPUT_DIR}/{name}')
+    return tuple(fonts), changed
+
+
+def font_face_css(fonts, base):
+    """@font-face rules for fonts, with URLs relative to base."""
+    return ''.join(
+        f'@font-face{{font-family:"{font.family}";font-style:normal;font-weight:{font.weight};'
+        f'font-display:swap;src:url({base}/{font.path}) format("woff2")}}'
+        for font in fonts)
+
+
+# --- Stylesheet ---
+# Tailwind-compatible utility CSS, generated at build time for exactly the
+# classes the rendered pages use and appended to templates/base.css. Only the
+# part of Tailwind this site needs is implemented; classes the generator
+# doesn't know (component classes, JS hooks) produce no CSS.
+STYLESHEET_BASE = os.path.join(TEMPLATE_DIR, 'base.css')
+STYLESHEET_DIR = 'css'
+# Pages render before the stylesheet and fonts they link exist; the <head>
+# tags for them replace this once every page's classes and text are known.
+HEAD_ASSETS_PLACEHOLDER = '\x00head_assets\x00'
+# Pages whose above-the-fold CSS (everything up to the end of the first
+# <section>) is inlined, with the full stylesheet loaded without blocking.
+# Only rules that can apply to that markup before any interaction are
+# inlined: hover/focus states arrive with the full stylesheet.
+CRITICAL_CSS_PAGES = ('index.html',)
+_STATE_VARIANTS = frozenset(('disabled', 'focus-within', 'hover', 'focus', 'focus-visible', 'active'))
+_STATE_SELECTOR_RE = re.compile(r':(?:hover|focus|active|disabled|-moz-|:-webkit-|:placeholder)')
+_CSS_RULE_RE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+_CLASS_SELECTOR_RE = re.compile(r'\.([\w-]+)')
+_TYPE_SELECTOR_RE = re.compile(r'(?:^|[\s>+~])([a-z][a-z0-9]*)')
+
+COLOR_SCALES = {
+    'gold': ('#fefce8', '#fef9c3', '#fef08a', '#fde047', '#facc15',
+             '#d4a017', '#b8860b', '#92700c', '#6b5210', '#422d08'),
+    'dark': ('#f8f8f8', '#e0e0e0', '#b0b0b0', '#808080', '#505050',
+             '#2a2a2a', '#1f1f1f', '#181818', '#141414', '#0a0a0a'),
+}
+THEME_COLORS = {
+    'inherit': 'inherit',
+    'current': 'currentColor',
+    'transparent': 'transparent',
+    'black': '#000000',
+    'white': '#ffffff',
+    **{f'{name}-{step}': value
+       for name, scale in COLOR_SCALES.items()
+       for step, value in zip((50, 100, 200, 300, 400, 500, 600, 700, 800, 900), scale)},
+}
+FONT_FAMILIES = {
+    'display': '"Playfair Display", Georgia, serif',
+    'sans': 'Inter, system-ui, -apple-system, sans-serif',
+}
+FONT_SIZES = {
+    'xs': ('0.75rem', '1rem'), 'sm': ('0.875rem', '1.25rem'), 'base': ('1rem', '1.5rem'),
+    'lg': ('1.125rem', '1.75rem'), 'xl': ('1.25rem', '1.75rem'), '2xl': ('1.5rem', '2rem'),
+    '3xl': ('1.875rem', '2.25rem'), '4xl': ('2.25rem', '2.5rem'), '5xl': ('3rem', '1'),
+    '6xl': ('3.75rem', '1'), '7xl': ('4.5rem', '1'), '8xl': ('6rem', '1'), '9xl': ('8rem', '1'),
+}
+FONT_WEIGHTS = {
+    'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500',
+    'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900',
+}
+LINE_HEIGHTS = {'none': '1', 'tight': '1.25', 'snug': '1.375', 'normal': '1.5', 'relaxed': '1.625', 'loose': '2'}
+LETTER_SPACINGS = {
+    'tighter': '-0.05em', 'tight': '-0.025em', 'normal': '0em',
+    'wide': '0.025em', 'wider': '0.05em', 'widest': '0.1em',
+}
+MAX_WIDTHS = {
+    'none': 'none', 'xs': '20rem', 'sm': '24rem', 'md': '28rem', 'lg': '32rem', 'xl': '36rem',
+    '2xl': '42rem', '3xl': '48rem', '4xl': '56rem', '5xl': '64rem', '6xl': '72rem', '7xl': '80rem',
+    'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content', 'prose': '65ch',
+}
+SIZE_KEYWORDS = {'auto': 'auto', 'full': '100%', 'min': 'min-content', 'max': 'max-content', 'fit': 'fit-content'}
+BORDER_RADII = {
+    'none': '0px', 'sm': '0.125rem', '': '0.25rem', 'md': '0.375rem', 'lg': '0.5rem',
+    'xl': '0.75rem', '2xl': '1rem', '3xl': '1.5rem', 'full': '9999px',
+}
+SHADOWS = {
+    'sm': '0 1px 2px 0 rgb(0 0 0 / 0.05)',
+    '': '0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)',
+    'md': '0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)',
+    'lg': '0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)',
+    'xl': '0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)',
+    '2xl': '0 25px 50px -12px rgb(0 0 0 / 0.25)',
+    'inner': 'inset 0 2px 4px 0 rgb(0 0 0 / 0.05)',
+    'none': '0 0 #0000',
+}
+BLURS = {'none': '0', 'sm': '4px', '': '8px', 'md': '12px', 'lg': '16px', 'xl': '24px', '2xl': '40px', '3xl': '64px'}
+TRANSITION_PROPERTIES = {
+    '': 'color, background-color, border-color, text-decoration-color, fill, stroke, opacity, '
+        'box-shadow, transform, filter, backdrop-filter',
+    'all': 'all',
+    'colors': 'color, background-color, border-color, text-decoration-color, fill, stroke',
+    'opacity': 'opacity',
+    'shadow': 'box-shadow',
+    'transform': 'transform',
+}
+SCREENS = (('sm', '640px'), ('md', '768px'), ('lg', '1024px'), ('xl', '1280px'), ('2xl', '1536px'))
+# In Tailwind's order: later variants win over earlier ones.
+PSEUDO_VARIANTS = (
+    ('first', ':first-child'), ('last', ':last-child'), ('disabled', ':disabled'),
+    ('focus-within', ':focus-within'), ('hover', ':hover'), ('focus', ':focus'),
+    ('focus-visible', ':focus-visible'), ('active', ':active'),
+)
+_SCREEN_RANK = {name: rank for rank, (name, _) in enumerate(SCREENS, 1)}
+_PSEUDO_RANK = {name: (rank, pseudo) for rank, (name, pseudo) in enumerate(PSEUDO_VARIANTS)}
+
+_SIDES = {'': ('',), 'x': ('-left', '-right'), 'y': ('-top', '-bottom'),
+          't': ('-top',), 'r': ('-right',), 'b': ('-bottom',), 'l': ('-left',)}
+_INSETS = {'inset': ('top', 'right', 'bottom', 'left'), 'inset-x': ('left', 'right'),
+           'inset-y': ('top', 'bottom'), 'top': ('top',), 'right': ('right',),
+           'bottom': ('bottom',), 'left': ('left',)}
+_CORNERS = {'': ('',), 't': ('-top-left', '-top-right'), 'r': ('-top-right', '-bottom-right'),
+            'b': ('-bottom-right', '-bottom-left'), 'l': ('-top-left', '-bottom-left'),
+            'tl': ('-top-left',), 'tr': ('-top-right',), 'br': ('-bottom-right',), 'bl': ('-bottom-left',)}
+_FLEX_ALIGN = {'start': 'flex-start', 'end': 'flex-end', 'between': 'space-between',
+               'around': 'space-around', 'evenly': 'space-evenly'}
+_EASINGS = {'linear': 'linear', 'in': 'cubic-bezier(0.4, 0, 1, 1)', 'out': 'cubic-bezier(0, 0, 0.2, 1)',
+            'in-out': 'cubic-bezier(0.4, 0, 0.2, 1)'}
+
+
+def _arbitrary(value):
+    """'[3/4]' -> '3/4', with underscores as spaces; None for theme keys."""
+    if value.startswith('[') and value.endswith(']'):
+        return value[1:-1].replace('_', ' ')
+    return None
+
+
+def _length(value, negative='', keywords=None):
+    """A spacing-scale value (4 -> 1rem, 2.5 -> 0.625rem, px -> 1px), a
+    fraction, an arbitrary [value] or a keyword. None if unrecognized."""
+    result = _arbitrary(value)
+    if result is None and keywords:
+        result = keywords.get(value)
+    if result is None:
+        if value == '0':
+            result = '0px'
+        elif value == 'px':
+            result = '1px'
+        elif re.fullmatch(r'\d+(\.5)?', value):
+            result = f'{float(value) / 4:g}rem'
+        elif re.fullmatch(r'\d+/\d+', value):
+            numerator, denominator = value.split('/')
+            result = f'{int(numerator) / int(denominator) * 100:.6g}%'
+        else:
+            return None
+    if negative and result not in ('0px', 'auto'):
+        result = f'calc({result} * -1)' if result.startswith(('var(', 'calc(')) else f'-{result}'
+    return result
+
+
+def _color(value):
+    """A theme color or [arbitrary] color, with an optional /<opacity>."""
+    name, _, alpha = value.partition('/')
+    color = _arbitrary(name) or THEME_COLORS.get(name)
+    if color is None or not alpha:
+        return color
+    if not alpha.isdigit() or not re.fullmatch(r'#[0-9a-fA-F]{6}', color):
+        return None
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f'rgb({r} {g} {b} / {int(alpha) / 100:g})'
+
+
+def _decls(props, value):
+    return None if value is None else [f'{prop}:{value}' for prop in props]
+
+
+def _keyword(prop, table):
+    return lambda value: _decls([prop], _arbitrary(value) or table.get(value))
+
+
+def _space_between(axis, value):
+    length = _length(value)
+    if length is None:
+        return None
+    start, end = ('left', 'right') if axis == 'x' else ('top', 'bottom')
+    return [f'margin-{start}:{length}', f'margin-{end}:0px']
+
+
+def _font_size(value):
+    if value not in FONT_SIZES:
+        return None
+    size, line_height = FONT_SIZES[value]
+    return [f'font-size:{size}', f'line-height:{line_height}']
+
+
+def _shadow(value):
+    shadow = SHADOWS.get(value or '')
+    if shadow is None:
+        return None
+    return [f'--tw-shadow:{shadow}',
+            'box-shadow:var(--tw-ring-offset-shadow, 0 0 #0000), var(--tw-ring-shadow, 0 0 #0000), var(--tw-shadow)']
+
+
+def _ring(width):
+    return ['--tw-ring-offset-shadow:var(--tw-ring-inset,) 0 0 0 var(--tw-ring-offset-width, 0px) '
+            'var(--tw-ring-offset-color, #fff)',
+            f'--tw-ring-shadow:var(--tw-ring-inset,) 0 0 0 calc({width or 3}px + var(--tw-ring-offset-width, 0px)) '
+            'var(--tw-ring-color, rgb(59 130 246 / 0.5))',
+            'box-shadow:var(--tw-ring-offset-shadow), var(--tw-ring-shadow), var(--tw-shadow, 0 0 #0000)']
+
+
+def _transition(value):
+    properties = TRANSITION_PROPERTIES.get(value or '')
+    if value == 'none':
+        return ['transition-property:none']
+    if properties is None:
+        return None
+    return [f'transition-property:{properties}', f'transition-timing-function:{_EASINGS["in-out"]}',
+            'transition-duration:150ms']
+
+
+# (pattern, handler, selector suffix) in Tailwind's plugin order, which is
+# also the order the rules are emitted in. The handler receives the
+# pattern's groups and returns declarations, or None to try the next pattern.
+_UTILITIES = [
+    ('sr-only', lambda: ['position:absolute', 'width:1px', 'height:1px', 'padding:0', 'margin:-1px',
+                         'overflow:hidden', 'clip:rect(0, 0, 0, 0)', 'white-space:nowrap', 'border-width:0']),
+    ('not-sr-only', lambda: ['position:static', 'width:auto', 'height:auto', 'padding:0', 'margin:0',
+                             'overflow:visible', 'clip:auto', 'white-space:normal']),
+    ('(static|fixed|absolute|relative|sticky)', lambda v: [f'position:{v}']),
+    ('(-?)(inset|inset-x|inset-y|top|right|bottom|left)-(.+)',
+     lambda neg, side, v: _decls(_INSETS[side], _length(v, neg, SIZE_KEYWORDS))),
+    (r'z-(\d+|auto|\[.+\])', lambda v: [f'z-index:{_arbitrary(v) or v}']),
+    ('(-?)m([xytrbl]?)-(.+)',
+     lambda neg, side, v: _decls([f'margin{s}' for s in _SIDES[side]], _length(v, neg, {'auto': 'auto'}))),
+    (r'line-clamp-(\d+)', lambda n: ['overflow:hidden', 'display:-webkit-box', '-webkit-box-orient:vertical',
+                                     f'-webkit-line-clamp:{n}']),
+    ('(block|inline-block|inline|flex|inline-flex|table|grid|inline-grid|contents|list-item|hidden)',
+     lambda v: [f'display:{"none" if v == "hidden" else v}']),
+    ('aspect-(.+)', _keyword('aspect-ratio', {'auto': 'auto', 'square': '1 / 1', 'video': '16 / 9'})),
+    ('h-(.+)', lambda v: _decls(['height'], _length(v, '', {**SIZE_KEYWORDS, 'screen': '100vh'}))),
+    ('max-h-(.+)', lambda v: _decls(['max-height'], _length(v, '', {'none': 'none', 'full': '100%', 'screen': '100vh'}))),
+    ('min-h-(.+)', lambda v: _decls(['min-height'], _length(v, '', {**SIZE_KEYWORDS, 'screen': '100vh'}))),
+    ('w-(.+)', lambda v: _decls(['width'], _length(v, '', {**SIZE_KEYWORDS, 'screen': '100vw'}))),
+    ('min-w-(.+)', lambda v: _decls(['min-width'], _length(v, '', SIZE_KEYWORDS))),
+    ('max-w-(.+)', _keyword('max-width', MAX_WIDTHS)),
+    ('flex-(1|auto|initial|none)', _keyword('flex', {'1': '1 1 0%', 'auto': '1 1 auto', 'initial': '0 1 auto',
+                                                     'none': 'none'})),
+    ('(?:flex-)?shrink(-0)?', lambda zero: [f'flex-shrink:{0 if zero else 1}']),
+    ('(?:flex-)?grow(-0)?', lambda zero: [f'flex-grow:{0 if zero else 1}']),
+    ('cursor-([a-z-]+)', lambda v: [f'cursor:{v}']),
+    ('select-(none|text|all|auto)', lambda v: [f'-webkit-user-select:{v}', f'user-select:{v}']),
+    (r'grid-cols-(\d+|none)', lambda v: [f'grid-template-columns:{"none" if v == "none" else f"repeat({v}, minmax(0, 1fr))"}']),
+    ('flex-(row|row-reverse|col|col-reverse)', lambda v: [f'flex-direction:{v.replace("col", "column")}']),
+    ('flex-(wrap|wrap-reverse|nowrap)', lambda v: [f'flex-wrap:{v}']),
+    ('items-(start|end|center|baseline|stretch)', lambda v: [f'align-items:{_FLEX_ALIGN.get(v, v)}']),
+    ('justify-(start|end|center|between|around|evenly)', lambda v: [f'justify-content:{_FLEX_ALIGN.get(v, v)}']),
+    ('gap(-[xy])?-(.+)', lambda axis, v: _decls([{'-x': 'column-gap', '-y': 'row-gap'}.get(axis, 'gap')], _length(v))),
+    ('space-([xy])-(.+)', _space_between, ' > :not([hidden]) ~ :not([hidden])'),
+    ('overflow-(auto|hidden|clip|visible|scroll)', lambda v: [f'overflow:{v}']),
+    ('overflow-([xy])-(auto|hidden|clip|visible|scroll)', lambda axis, v: [f'overflow-{axis}:{v}']),
+    ('whitespace-(normal|nowrap|pre|pre-line|pre-wrap|break-spaces)', lambda v: [f'white-space:{v}']),
+    ('rounded(?:-(t|r|b|l|tl|tr|br|bl))?(?:-(none|sm|md|lg|xl|2xl|3xl|full))?',
+     lambda side, size: _decls([f'border{c}-radius' for c in _CORNERS[side or '']], BORDER_RADII[size or ''])),
+    (r'border(?:-([xytrbl]))?(?:-(\d+))?',
+     lambda side, width: _decls([f'border{s}-width' for s in _SIDES[side or '']], f'{width or 1}px')),
+    ('border-(solid|dashed|dotted|double|hidden|none)', lambda v: [f'border-style:{v}']),
+    ('border(?:-([xytrbl]))?-(.+)',
+     lambda side, v: _decls([f'border{s}-color' for s in _SIDES[side or '']], _color(v))),
+    ('bg-(.+)', lambda v: _decls(['background-color'], _color(v))),
+    ('fill-(.+)', lambda v: _decls(['fill'], _color(v))),
+    ('stroke-(.+)', lambda v: _decls(['stroke'], _color(v))),
+    ('object-(contain|cover|fill|none|scale-down)', lambda v: [f'object-fit:{v}']),
+    ('p([xytrbl]?)-(.+)', lambda side, v: _decls([f'padding{s}' for s in _SIDES[side]], _length(v))),
+    ('text-(left|center|right|justify|start|end)', lambda v: [f'text-align:{v}']),
+    ('font-(.+)', _keyword('font-family', FONT_FAMILIES)),
+    ('text-(.+)', _font_size),
+    ('font-(.+)', _keyword('font-weight', FONT_WEIGHTS)),
+    ('(uppercase|lowercase|capitalize)', lambda v: [f'text-transform:{v}']),
+    ('normal-case', lambda: ['text-transform:none']),
+    ('italic', lambda: ['font-style:italic']),
+    ('not-italic', lambda: ['font-style:normal']),
+    ('leading-(.+)', lambda v: _decls(['line-height'], LINE_HEIGHTS.get(v) or _length(v))),
+    ('tracking-(.+)', _keyword('letter-spacing', LETTER_SPACINGS)),
+    ('text-(.+)', lambda v: _decls(['color'], _color(v))),
+    ('(underline|overline|line-through)', lambda v: [f'text-decoration-line:{v}']),
+    ('no-underline', lambda: ['text-decoration-line:none']),
+    ('antialiased', lambda: ['-webkit-font-smoothing:antialiased', '-moz-osx-font-smoothing:grayscale']),
+    ('subpixel-antialiased', lambda: ['-webkit-font-smoothing:auto', '-moz-osx-font-smoothing:auto']),
+    (r'opacity-(\d+)', lambda v: [f'opacity:{int(v) / 100:g}']),
+    ('shadow(?:-(.+))?', _shadow),
+    ('outline-none', lambda: ['outline:2px solid transparent', 'outline-offset:2px']),
+    (r'ring(?:-(\d+))?', _ring),
+    ('ring-(.+)', lambda v: _decls(['--tw-ring-color'], _color(v))),
+    ('backdrop-blur(?:-(.+))?',
+     lambda v: _decls(['-webkit-backdrop-filter', 'backdrop-filter'],
+                      f'blur({BLURS[v or ""]})' if (v or '') in BLURS else None)),
+    ('transition(?:-(.+))?', _transition),
+    (r'duration-(\d+)', lambda v: [f'transition-duration:{v}ms']),
+    ('ease-(linear|in|out|in-out)', lambda v: [f'transition-timing-function:{_EASINGS[v]}']),
+]
+_UTILITIES = [(re.compile(entry[0]), entry[1], entry[2] if len(entry) > 2 else '') for entry in _UTILITIES]
+_VARIANT_SPLIT_RE = re.compile(r':(?![^\[]*\])')
+_CLASS_ATTR_RE = re.compile(r'\sclass="([^"]*)"')
+_SCRIPT_CLASS_RE = re.compile(r'classList\.(?:add|remove|toggle)\(([^)]*)\)|className\s*=\s*([\'"])(.*?)\2')
+_QUOTED_RE = re.compile(r'([\'"])(.*?)\1')
+
+
+def page_classes(html):
+    """Class names a rendered page uses: class attributes plus names set
+    from inline scripts via classList.add/remove/toggle or className."""
+    classes = set()
+    for m in _CLASS_ATTR_RE.finditer(html):
+        classes.update(m.group(1).split())
+    for m in _SCRIPT_CLASS_RE.finditer(html):
+        if m.group(1) is not None:
+            for quoted in _QUOTED_RE.finditer(m.group(1)):
+                classes.update(quoted.group(2).split())
+        else:
+            classes.update(m.group(3).split())
+    return classes
+
+
+def _css_escape(name):
+    escaped = re.sub(r'([^\w-])', r'\\\1', name)
+    if escaped[0].isdigit():
+        escaped = f'\\{ord(escaped[0]):x} {escaped[1:]}'
+    return escaped
+
+
+def utility_rule(name):
+    """CSS rule for one utility class as (sort key, rule), or None if the
+    class isn't a utility the generator knows. Variants: responsive
+    prefixes (sm:, md:, ...) and pseudo-classes (hover:, focus:, ...)."""
+    *variants, utility = _VARIANT_SPLIT_RE.split(name)
+    screen, pseudo_rank, pseudo = 0, -1, ''
+    for variant in variants:
+        if variant in _SCREEN_RANK and not screen:
+            screen = _SCREEN_RANK[variant]
+        elif variant in _PSEUDO_RANK:
+            rank, selector = _PSEUDO_RANK[variant]
+            pseudo_rank, pseudo = max(pseudo_rank, rank), pseudo + selector
+        else:
+            return None
+    for index, (pattern, handler, suffix) in enumerate(_UTILITIES):
+        m = pattern.fullmatch(utility)
+        if m:
+            decls = handler(*m.groups())
+            if decls is not None:
+                rule = f'.{_css_escape(name)}{pseudo}{suffix}{{{";".join(decls)}}}'
+                return (screen, pseudo_rank, index, name), rule
+    return None
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return re.sub(r'\{([^{}]*)\}',
+                  lambda m: '{' + re.sub(r'\s*:\s*', ':', m.group(1)).rstrip(';') + '}', css).strip()
+
+
+def generate_css(classes, fonts=(), base='..', base_css=None):
+    """@font-face rules for fonts (URLs relative to base), minified
+    templates/base.css (or base_css), then a rule for every known utility in
+    classes, ordered like Tailwind's output: plain rules, then pseudo-class
+    variants, then one media query per breakpoint."""
+    rules = sorted(filter(None, map(utility_rule, classes)))
+    by_screen = {}
+    for (screen, *_), rule in rules:
+        by_screen.setdefault(screen, []).append(rule)
+    if base_css is None:
+        base_css = minify_css(read_file(STYLESHEET_BASE))
+    parts = [font_face_css(fonts, base), base_css]
+    for screen, screen_rules in sorted(by_screen.items()):
+        body = ''.join(screen_rules)
+        parts.append(f'@media (min-width:{SCREENS[screen - 1][1]}){{{body}}}' if screen else body)
+    return ''.join(parts) + '\n'
+
+
+def write_stylesheet(classes, fonts=()):
+    """Write the stylesheet for classes and fonts to
+    site/css/site.<content hash>.css and remove superseded ones.
+    Returns (site-relative path, [changed output paths])."""
+    data = generate_css(classes, fonts).encode('utf-8')
+    path = f'{STYLESHEET_DIR}/site.{hashlib.sha256(data).hexdigest()[:10]}.css'
+    changed = [path] if write_output(path, data) else []
+    css_dir = os.path.join(SITE_DIR, STYLESHEET_DIR)
+    for name in os.listdir(css_dir):
+        if name.startswith('site.') and name.endswith('.css') and f'{STYLESHEET_DIR}/{name}' != path:
+            os.unlink(os.path.join(css_dir, name))
+            changed.append(f'{STYLESHEET_DIR}/{name}')
+    return path, changed
+
+
+def _selector_applies(selector, classes, tags):
+    if _STATE_SELECTOR_RE.search(selector):
+        return False
+    bare = re.sub(r'\[[^\]]*\]', '', selector)
+    return set(_CLASS_SELECTOR_RE.findall(bare)) <= classes and set(_TYPE_SELECTOR_RE.findall(bare)) <= tags
+
+
+def critical_rules(css, classes, tags):
+    """The rules of minified css whose selectors can match markup with only
+    these classes and tag names, outside any interaction state. Selectors
+    without a class or type (*, ::before) always apply."""
+    out = []
+    for m in _CSS_RULE_RE.finditer(css):
+        selectors = [s for s in m.group(1).split(',') if _selector_applies(s, classes, tags)]
+        if selectors:
+            out.append(f'{",".join(selectors)}{{{m.group(2)}}}')
+    return ''.join(out)
+
+
+def critical_css(html, fonts, base):
+    """Inline CSS for a page's above-the-fold markup: everything up to the
+    end of the first <section> inside <main>."""
+    main = html.find('<main')
+    end = html.find('</section>', main) if main != -1 else -1
+    fold = html[:end] if end != -1 else html
+    classes = {name for name in page_classes(fold)
+               if not _STATE_VARIANTS.intersection(_VARIANT_SPLIT_RE.split(name)[:-1])}
+    base_css = critical_rules(minify_css(read_file(STYLESHEET_BASE)), classes, {name.lower() for name in _TAG_NAME_RE.findall(fold)})
+    return generate_css(classes, fonts, base, base_css).rstrip('\n')
+
+
+def head_assets(filepath, html, stylesheet, fonts):
+    """<head> tags for fonts and styles: font preloads (or the Google Fonts
+    fallback) and the stylesheet, loaded without blocking behind inline
+    critical CSS on CRITICAL_CSS_PAGES."""
+    base = relative_base(filepath)
+    tags = [f'<link rel="preload" href="{base}/{font.path}" as="font" type="font/woff2" crossorigin>'
+            for font in fonts if font.preload]
+    if not fonts:
+        tags.extend(GOOGLE_FONTS_TAGS)
+    href = f'{base}/{stylesheet}'
+    if filepath in CRITICAL_CSS_PAGES:
+        tags.append(f'<style>{critical_css(html, fonts, base)}</style>')
+        tags.append(f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">')
+        tags.append(f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+    else:
+        tags.append(f'<link rel="stylesheet" href="{href}">')
+    return '\n    '.join(tags)
+
+
+# --- Precompression ---
+# Text outputs get .gz and .br siblings at maximum compression, which nginx
+# serves directly (gzip_static / brotli_static).
+COMPRESS_EXTENSIONS = ('.html', '.css', '.svg', '.json', '.ics', '.atom')
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+
+def _compress_file(full_path):
+    """Write full_path.gz, and full_path.br if Brotli is installed. Runs in a
+    worker process. Returns (size, gzip size, brotli size or None)."""
+    with open(full_path, 'rb') as f:
+        data = f.read()
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    atomic_write(full_path + '.gz', gz)
+    if brotli is None:
+        # A leftover .br would be served for the new content; the changed
+        # list records it as removed
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(full_path + '.br')
+        return len(data), len(gz), None
+    br = brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    atomic_write(full_path + '.br', br)
+    return len(data), len(gz), len(br)
+
+
+def precompress(previous, jobs=1):
+    """Compress every COMPRESS_EXTENSIONS file in site/ on up to jobs worker
+    processes.
+    Files whose digest matches their record in previous (the last build's
+    manifest) and whose siblings exist are reused, not recompressed; siblings
+    whose source is gone are removed.
+    Returns ({path: record}, [changed output paths])."""
+    records = {}
+    stale = {}
+    changed = []
+    for root, dirs, names in os.walk(SITE_DIR):
+        dirs.sort()
+        for name in sorted(names):
+            full_path = os.path.join(root, name)
+            if name.endswith(COMPRESSED_SUFFIXES):
+                if not os.path.exists(full_path[:-3]):
+                    os.unlink(full_path)
+                    changed.append(os.path.relpath(full_path, SITE_DIR).replace(os.sep, '/'))
+                continue
+            if name.startswith('.') or not name.endswith(COMPRESS_EXTENSIONS):
+                continue
+            path = os.path.relpath(full_path, SITE_DIR).replace(os.sep, '/')
+            digest = file_digest(full_path)
+            record = previous.get(path)
+            if (record and record.get('digest') == digest and os.path.exists(full_path + '.gz')
+                    and (brotli is None or os.path.exists(full_path + '.br'))):
+                records[path] = record
+            else:
+                stale[path] = digest
+
+    if not stale:
+        return records, changed
+    paths = sorted(stale)
+    results = run_tasks(_compress_file, [(os.path.join(SITE_DIR, path),) for path in paths], jobs)
+    for path, (size, gz_size, br_size) in zip(paths, results):
+        records[path] = {'digest': stale[path], 'size': size, 'gzip': gz_size, 'brotli': br_size}
+        # Without Brotli the .br is removed, and so listed too
+        changed += [f'{path}.gz', f'{path}.br']
+    print(f"  Precompressed {len(paths)} files ({'gzip + brotli' if brotli else 'gzip only'}), "
+          f"{len(records) - len(paths)} unchanged")
+    return records, changed
+
+
+def print_compression_report(records):
+    """Bytes saved per page by the smallest precompressed sibling."""
+    pages = sorted(path for path in records if path.endswith('.html'))
+    if not pages:
+        return
+    width = max(len(path) for path in pages + ['total'])
+    print(f"\n  {'page':<{width}}  {'bytes':>8}  {'gzip':>8}  {'brotli':>8}  {'saved':>8}")
+    totals = [0, 0, 0, 0]
+    for path in pages:
+        r = records[path]
+        smallest = min(r['gzip'], r['brotli'] or r['gzip'])
+        row = [r['size'], r['gzip'], r['brotli'] or 0, r['size'] - smallest]
+        totals = [t + v for t, v in zip(totals, row)]
+        print(f"  {path:<{width}}  {row[0]:>8}  {row[1]:>8}  {r['brotli'] or '-':>8}  "
+              f"{row[3]:>8} ({row[3] / row[0]:.0%})")
+    print(f"  {'total':<{width}}  {totals[0]:>8}  {totals[1]:>8}  {totals[2] or '-':>8}  "
+          f"{totals[3]:>8} ({totals[3] / totals[0]:.0%})")
+
+
+# --- Page tasks ---
+# A page renders as a task: a picklable renderer applied to the read-only
+# build context, so tasks can run in worker processes. Results (including
+# anything the renderer printed) come back to the parent, which logs and
+# writes them in PAGES order whichever worker finishes first.
+_task_context = None
+
+
+class PageResult(namedtuple('PageResult', ['filepath', 'html', 'classes', 'chars', 'log', 'wall', 'cpu'])):
+    """A rendered page (html None when the renderer skipped it), the classes
+    and characters it uses, its captured output and its render time."""
+    __slots__ = ()
+
+
+def _init_page_tasks(ctx, minify):
+    global _task_context
+    _task_context = (ctx, minify)
+
+
+def render_page_task(filepath, render):
+    """Render one page against the context set by _init_page_tasks(): the
+    renderer, then responsive images, fingerprinted asset URLs and (if
+    enabled) minification. Returns a PageResult."""
+    ctx, minify = _task_context
+    log = io.StringIO()
+    wall, cpu = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(log):
+        html = render(ctx)
+        if html is not None:
+            base = relative_base(filepath)
+            html = fingerprint_urls(responsive_images(html, ctx['images'], base), ctx['assets'], base)
+            if minify:
+                html = minify_html(html)
+    # The head assets that replace the placeholder render no text, so the
+    # page's characters are those of the page without it
+    classes, chars = ((page_classes(html), page_chars(html.replace(HEAD_ASSETS_PLACEHOLDER, '')))
+                      if html is not None else (set(), set()))
+    return PageResult(filepath, html, classes, chars, log.getvalue(),
+                      time.perf_counter() - wall, time.process_time() - cpu)
+
+
+def run_tasks(func, args, jobs, initializer=None, initargs=()):
+    """func(*a) for each a in args, on up to jobs worker processes (inline
+    when jobs is 1 or there is only one task). Results are in args order."""
+    if jobs <= 1 or len(args) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(*a) for a in args]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(args)), initializer=initializer,
+                                                initargs=initargs) as pool:
+        return list(pool.map(func, *zip(*args)))
+
+
+def render_pages(tasks, ctx, minify, jobs, timer):
+    """Run (filepath, renderer) tasks, replay their output in task order and
+    add their render times to timer. Returns [PageResult] in task order."""
+    results = run_tasks(render_page_task, tasks, jobs, _init_page_tasks, (ctx, minify))
+    for result in results:
+        sys.stdout.write(result.log)
+        timer.add(f'render {result.filepath}', result.wall, result.cpu)
+    return results
+
+
+STATS_NAME = '.build-stats.json'
+
+
+class PhaseTimer:
+    """Wall and CPU time per named build phase. Repeated phases accumulate."""
+
+    def __init__(self):
+        self.phases = {}
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def add(self, name, wall, cpu):
+        """Record wall / CPU seconds measured elsewhere (e.g. in a worker)."""
+        totals = self.phases.setdefault(name, [0.0, 0.0, 0])
+        totals[0] += wall
+        totals[1] += cpu
+        totals[2] += 1
+
+    def stats(self, **extra):
+        return {
+            'generated_at': datetime.now(EASTERN).isoformat(timespec='seconds'),
+            'total': {
+                'wall_ms': round((time.perf_counter() - self.started) * 1000, 3),
+                'cpu_ms': round((time.process_time() - self.started_cpu) * 1000, 3),
+            },
+            'phases': [
+                {'name': name, 'wall_ms': round(wall * 1000, 3), 'cpu_ms': round(cpu * 1000, 3), 'count': count}
+                for name, (wall, cpu, count) in self.phases.items()
+            ],
+            **extra,
+        }
+
+
+def print_stats(stats):
+    width = max([len(p['name']) for p in stats['phases']] + [5])
+    print(f"\n  {'phase':<{width}}  {'wall ms':>9}  {'cpu ms':>9}  {'calls':>5}")
+    for p in stats['phases']:
+        print(f"  {p['name']:<{width}}  {p['wall_ms']:>9.1f}  {p['cpu_ms']:>9.1f}  {p['count']:>5}")
+    total = stats['total']
+    print(f"  {'total':<{width}}  {total['wall_ms']:>9.1f}  {total['cpu_ms']:>9.1f}")
+
+
+def build(force=False, changed_sources=None, state=None, publish=None, profile=False, minify=False, jobs=1):
+    """Build the site. Pages whose input digests match the previous build's
+    manifest (and whose output on disk is untouched) are neither re-rendered
+    nor rewritten; force=True rebuilds everything.
+
+    For rebuilds within one process (watch mode), pass the state returned by
+    the previous build() and the set of source paths that changed since:
+    the normalized API events and mirrored posters are reused instead of re-fetched,
+    and only the changed files are re-hashed. publish, if given, is called
+    with (filepath, bytes) for each rendered page before it is written.
+    profile=True prints a per-phase timing table and per-page compression
+    savings, and writes both to site/.build-stats.json. minify=True passes
+    every page through minify_html(). jobs is the number of worker processes
+    that render and compress pages; output and logs are the same for any jobs.
+    Returns the state for the next call. Raises FetchError, before writing
+    anything, when the events API fails and nothing is cached."""
+    print("Building Free State Party site...")
+    timer = PhaseTimer()
+
+    incremental = state is not None and changed_sources is not None
+    if incremental:
+        events = state['events']
+        changed = []
+    else:
+        with timer.phase('fetch'):
+            events, source = fetch_api_events(timer)
+        with timer.phase('posters'):
+            # Only a list the API just gave us says which posters are gone
+            events, changed = mirror_posters(events, evict=source != 'stale')
+    today = datetime.now(EASTERN).date()
+    event_index = index_events(events, today)
+    saturday = saturday_details(event_index)
+    site_pages, event_digests = event_pages(event_index)
+    site_pages = PAGES + site_pages
+
+    with timer.phase('images'):
+        images, image_changed = process_images()
+        changed += image_changed
+
+    with timer.phase('assets'):
+        assets, asset_changed = fingerprint_assets(skip=images)
+        changed += asset_changed
+
+    with timer.phase('read'):
+        ctx = {
+            'template': load_template(os.path.join(TEMPLATE_DIR, 'base.html')),
+            'footer': load_content('footer.md').meta,
+            'events': events,
+            'event_index': event_index,
+            'saturday': saturday,
+            'images': images,
+            'assets': assets,
+        }
+        # Digests of every page input: source files by content, context values
+        # by their canonical JSON form.
+        digests = {
+            'saturday': value_digest(ctx['saturday']),
+            'images': value_digest({path: image._asdict() for path, image in images.items()}),
+            'assets': value_digest(assets),
+            'minify': value_digest(minify),
+            **event_digests,
+        }
+        if incremental:
+            stale = {os.path.relpath(os.path.abspath(p), SCRIPT_DIR) for p in changed_sources}
+            known = {name: digest for name, digest in state['digests'].items() if name not in stale}
+        else:
+            known = {}
+        for _, _, inputs in site_pages:
+            for name in COMMON_INPUTS + inputs:
+                if name not in digests:
+                    digests[name] = known[name] if name in known else file_digest(os.path.join(SCRIPT_DIR, name))
+        previous = {} if force else load_manifest()
+        previous_feeds = {} if force else load_manifest('feeds')
+        previous_compressed = {} if force else load_manifest('compressed')
+
+    manifest = {}
+    pages = {}
+    used_classes = set()
+    used_chars = set()
+    tasks = []
+    for filepath, render, inputs in site_pages:
+        inputs_digest = value_digest({name: digests[name] for name in COMMON_INPUTS + inputs})
         full_path = os.path.join(SITE_DIR, filepath)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        print(f"  Built: site/{filepath}")
+        entry = previous.get(filepath)
+        if (entry and entry.get('inputs') == inputs_digest
+                and entry.get('output') == file_digest(full_path)):
+            manifest[filepath] = entry
+            used_classes.update(entry['classes'])
+            used_chars.update(entry['chars'])
+            continue
+        tasks.append((filepath, render))
+        pages[filepath] = inputs_digest
+    for result in render_pages(tasks, ctx, minify, jobs, timer):
+        if result.html is None:
+            del pages[result.filepath]
+            continue
+        pages[result.filepath] = (result.html, pages[result.filepath], result.classes, result.chars)
+        used_classes.update(result.classes)
+        used_chars.update(result.chars)
+
+    with timer.phase('fonts'):
+        fonts, font_changed = subset_fonts(used_chars)
+        changed += font_changed
+    with timer.phase('css'):
+        stylesheet, css_changed = write_stylesheet(used_classes, fonts)
+        changed += css_changed
+    if stylesheet in css_changed:
+        print(f"  Wrote: site/{stylesheet}")
+    # Skipped pages still link the stylesheet (and so the fonts) they were
+    # built with.
+    stale = [(filepath, render) for filepath, render, _ in site_pages
+             if filepath in manifest and manifest[filepath]['stylesheet'] != stylesheet]
+    for result in render_pages(stale, ctx, minify, jobs, timer):
+        if result.html is not None:
+            pages[result.filepath] = (result.html, manifest[result.filepath]['inputs'], result.classes, result.chars)
+
+    outputs = []
+    for filepath, _, _ in site_pages:
+        if filepath not in pages:
+            continue
+        html, inputs_digest, classes, chars = pages[filepath]
+        with timer.phase('css'):
+            html = html.replace(HEAD_ASSETS_PLACEHOLDER, head_assets(filepath, html, stylesheet, fonts))
+        data = html.encode('utf-8')
+        if publish is not None:
+            publish(filepath, data)
+        manifest[filepath] = {
+            'inputs': inputs_digest,
+            'output': hashlib.sha256(data).hexdigest(),
+            'classes': sorted(classes),
+            'chars': ''.join(sorted(chars)),
+            'stylesheet': stylesheet,
+        }
+        outputs.append((filepath, data))
+    rendered = len(outputs)
+    with timer.phase('write'):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            written = list(pool.map(lambda output: write_output(*output), outputs))
+    for (filepath, _), was_written in zip(outputs, written):
+        if was_written:
+            changed.append(filepath)
+            print(f"  Built: site/{filepath}")
+
+    with timer.phase('feeds'):
+        feeds, feed_changed = write_feeds(event_index, previous_feeds, digests['build.py'])
+        changed += feed_changed
+
+    with timer.phase('write'):
+        for filepath in prune_event_outputs(manifest.keys() | feeds.keys()):
+            changed += [filepath] + [filepath + suffix for suffix in COMPRESSED_SUFFIXES]
+            print(f"  Removed: site/{filepath}")
 
     # --- Copy video if not already present ---
-    video_src = os.path.expanduser('~/Desktop/free-state-party-homepage-video.mp4')
-    video_dst = os.path.join(SITE_DIR, 'video', 'homepage.mp4')
-    if os.path.exists(video_src) and not os.path.exists(video_dst):
-        os.makedirs(os.path.join(SITE_DIR, 'video'), exist_ok=True)
-        shutil.copy2(video_src, video_dst)
-        print("  Copied: video/homepage.mp4")
-
-    # --- Write API hash from the same data used to build ---
-    if api_raw:
-        api_hash = hashlib.sha256(api_raw).hexdigest()
-        hash_path = os.path.join(SITE_DIR, 'events-hash.txt')
-        with open(hash_path, 'w') as f:
-            f.write(api_hash + '\n')
-        print(f"  Wrote: site/events-hash.txt ({api_hash[:12]}…)")
+    with timer.phase('copy'):
+        video_src = os.path.expanduser('~/Desktop/free-state-party-homepage-video.mp4')
+        video_dst = os.path.join(SITE_DIR, 'video', 'homepage.mp4')
+        if os.path.exists(video_src) and not os.path.exists(video_dst):
+            os.makedirs(os.path.join(SITE_DIR, 'video'), exist_ok=True)
+            shutil.copy2(video_src, video_dst)
+            print("  Copied: video/homepage.mp4")
+
+    with timer.phase('compress'):
+        compressed, compressed_changed = precompress(previous_compressed, jobs)
+        changed += compressed_changed
+
+    with timer.phase('write'):
+        save_manifest(manifest, feeds, compressed)
+
+        # --- Write API hash from the same data used to build ---
+        # What check-api.yml compares `build.py --fingerprint` against
+        fingerprint = events_fingerprint(events, today)
+        if write_output('events-hash.txt', fingerprint + '\n'):
+            changed.append('events-hash.txt')
+            print(f"  Wrote: site/events-hash.txt ({fingerprint[:12]}…)")
+
+        # When the output next changes with no API change; check-api.yml reads
+        # the deployed copy and rebuilds once it has passed
+        next_rebuild = next_rebuild_at(event_index).isoformat()
+        if write_output('next-rebuild.txt', next_rebuild + '\n'):
+            changed.append('next-rebuild.txt')
+        print(f"  Next rebuild due: {next_rebuild}")
+
+        save_changed(changed)
+
+    print(f"\nDone. {rendered} pages rendered, {len(changed)} files changed, "
+          f"{len(manifest) - rendered} pages skipped.")
+    if profile:
+        stats = timer.stats(
+            pages_rendered=rendered, files_changed=len(changed),
+            compression={path: {k: r[k] for k in ('size', 'gzip', 'brotli')} for path, r in compressed.items()},
+        )
+        print_stats(stats)
+        print_compression_report(compressed)
+        atomic_write(os.path.join(SITE_DIR, STATS_NAME), json.dumps(stats, indent=2) + '\n')
+    return {'events': events, 'digests': digests}
+
+
+# Seconds of quiet after the last filesystem event before a burst of editor
+# saves is rebuilt as one.
+WATCH_DEBOUNCE = 0.05
+WATCH_DIRS = [CONTENT_DIR, TEMPLATE_DIR]
+
+
+def _is_editor_noise(path):
+    """Swap, backup and probe files editors create next to the real file."""
+    name = os.path.basename(path)
+    return (name.startswith(('.', '#')) or name.endswith(('~', '.swp', '.swx', '.tmp'))
+            or name == '4913')
+
+
+class InotifyWatcher:
+    """Linux inotify via ctypes. wait() blocks without polling until files
+    change, then returns the set of changed paths once the burst settles."""
+
+    name = 'inotify'
+    _EVENT = struct.Struct('iIII')
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_ISDIR = 0x40000000
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, dirs):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        for d in dirs:
+            for root, _, _ in os.walk(d):
+                self._watch(root)
+
+    def _watch(self, path):
+        wd = self._add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {path}')
+        self.dirs[wd] = path
+
+    def _read(self, timeout):
+        """Changed paths from one read, or an empty set on timeout."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        paths = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if wd not in self.dirs or not name:
+                continue
+            path = os.path.join(self.dirs[wd], name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._watch(path)
+                continue
+            if not _is_editor_noise(path):
+                paths.add(path)
+        return paths
+
+    def wait(self):
+        changed = set()
+        while not changed:
+            changed = self._read(None)
+        while True:
+            more = self._read(WATCH_DEBOUNCE)
+            if not more:
+                return changed
+            changed |= more
 
-    print(f"\nDone. {len(pages)} pages built.")
-    print(f"Words: {words}")
 
+class PollingWatcher:
+    """Fallback for platforms without inotify: compares mtimes every interval."""
 
-def watch():
-    """Watch content/ and templates/ for changes, rebuild automatically."""
-    import time
+    name = 'polling'
 
-    watch_dirs = [CONTENT_DIR, TEMPLATE_DIR]
+    def __init__(self, dirs, interval=0.5):
+        self.dirs = dirs
+        self.interval = interval
+        self.last = self._mtimes()
 
-    def get_mtimes():
+    def _mtimes(self):
         mtimes = {}
-        for d in watch_dirs:
+        for d in self.dirs:
             for root, _, files in os.walk(d):
                 for f in files:
                     path = os.path.join(root, f)
-                    mtimes[path] = os.path.getmtime(path)
+                    if not _is_editor_noise(path):
+                        try:
+                            mtimes[path] = os.path.getmtime(path)
+                        except FileNotFoundError:
+                            pass
         return mtimes
 
-    print("Watching for changes... (Ctrl+C to stop)\n")
-    build()
-    last = get_mtimes()
+    def wait(self):
+        while True:
+            time.sleep(self.interval)
+            current = self._mtimes()
+            if current != self.last:
+                changed = {p for p in current.keys() | self.last.keys() if current.get(p) != self.last.get(p)}
+                self.last = current
+                return changed
+
+
+def make_watcher(dirs):
+    """inotify where available, polling otherwise."""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError) as e:
+            print(f"  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(dirs)
+
+
+def rebuild_on_change(watcher, state, publish=None, on_rebuilt=None, on_error=None):
+    """Block on watcher forever, rebuilding only what each burst of changes
+    affects. Reports save-to-rebuild latency for each rebuild. A rebuild
+    that raises is logged (and passed to on_error as text) and watching
+    goes on from the last good state."""
+    while True:
+        changed = watcher.wait()
+        saved_at = max((os.path.getmtime(p) for p in changed if os.path.exists(p)), default=time.time())
+        for p in sorted(changed):
+            print(f"  Changed: {os.path.relpath(p, SCRIPT_DIR)}")
+        print()
+        started = time.time()
+        try:
+            state = build(changed_sources=changed, state=state, publish=publish)
+        except Exception:
+            error = traceback.format_exc()
+            print(f"  ERROR: Rebuild failed, still watching:\n{error}", file=sys.stderr)
+            if on_error is not None:
+                on_error(error)
+            continue
+        if on_rebuilt is not None:
+            on_rebuilt()
+        done = time.time()
+        print(f"  Rebuilt in {(done - started) * 1000:.0f} ms, "
+              f"{(done - saved_at) * 1000:.0f} ms after save\n")
+
+
+def watch():
+    """Watch content/ and templates/ for changes and rebuild only the pages
+    whose sources changed."""
+    watcher = make_watcher(WATCH_DIRS)
+    print(f"Watching for changes via {watcher.name}... (Ctrl+C to stop)\n")
+    state = build()
 
     try:
-        while True:
-            time.sleep(0.5)
-            current = get_mtimes()
-            if current != last:
-                changed = [p for p in current if current.get(p) != last.get(p)]
-                for p in changed:
-                    print(f"  Changed: {os.path.relpath(p, SCRIPT_DIR)}")
-                print()
-                build()
-                print()
-                last = current
+        rebuild_on_change(watcher, state)
     except KeyboardInterrupt:
         print("\nStopped.")
 
 
+mimetypes.add_type('image/avif', '.avif')
+
+RELOAD_PATH = '/__reload'
+RELOAD_SNIPPET = (
+    "<script>{const reloads = new EventSource('" + RELOAD_PATH + "');"
+    "reloads.addEventListener('reload', () => location.reload());"
+    "reloads.addEventListener('build-error', e => console.error('Rebuild failed:\\n' + e.data));}</script>\n"
+)
+
+
+class DevServer:
+    """Local preview server for site/ (asyncio, stdlib only).
+
+    Pages rendered by a rebuild are published straight into memory, so they
+    are served without waiting on the disk write; everything else is read
+    from site/ once and cached by mtime. HTML responses get a small script
+    that listens on RELOAD_PATH (server-sent events), reloads the tab after
+    each rebuild and logs failed rebuilds to the console."""
+
+    def __init__(self, root):
+        self.root = root
+        self.published = {}
+        self.disk_cache = {}
+        self.clients = set()
+        self.loop = None
+
+    # Called from the rebuild thread
+    def publish(self, filepath, data):
+        self.published[filepath] = data
+
+    def notify_reload(self):
+        self.loop.call_soon_threadsafe(self._broadcast, 'reload', '')
+
+    def notify_error(self, error):
+        self.loop.call_soon_threadsafe(self._broadcast, 'build-error', error)
+
+    def _broadcast(self, event, data):
+        for queue in self.clients:
+            queue.put_nowait((event, data))
+
+    def _read(self, relpath):
+        if relpath in self.published:
+            return self.published[relpath]
+        full_path = os.path.join(self.root, relpath)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return None
+        if not os.path.isfile(full_path):
+            return None
+        cached = self.disk_cache.get(relpath)
+        if cached and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        self.disk_cache[relpath] = (st.st_mtime_ns, data)
+        return data
+
+    def resolve(self, url_path):
+        """Map a URL path to (status, headers, body)."""
+        path = posixpath.normpath(urllib.parse.unquote(url_path))
+        if path.startswith('..') or '/../' in path:
+            return 404, {}, b'Not found'
+        relpath = path.lstrip('/')
+        if relpath in ('', '.'):
+            relpath = 'index.html'
+        elif url_path.endswith('/'):
+            relpath = f'{relpath}/index.html'
+        elif self._read(f'{relpath}/index.html') is not None:
+            # Pages use relative links, so directories need their slash
+            return 301, {'Location': f'{url_path}/'}, b''
+
+        data = self._read(relpath)
+        if data is None:
+            return 404, {}, b'Not found'
+        content_type = mimetypes.guess_type(relpath)[0] or 'application/octet-stream'
+        if content_type == 'text/html':
+            content_type = 'text/html; charset=utf-8'
+            i = data.rfind(b'</body>')
+            if i != -1:
+                data = data[:i] + RELOAD_SNIPPET.encode('utf-8') + data[i:]
+        return 200, {'Content-Type': content_type, 'Cache-Control': 'no-store'}, data
+
+    async def handle(self, reader, writer):
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            if len(request_line) < 2 or request_line[0] not in ('GET', 'HEAD'):
+                await self._respond(writer, 405, {}, b'Method not allowed', False)
+                return
+            method, target = request_line[0], request_line[1]
+            url_path = urllib.parse.urlsplit(target).path
+            if url_path == RELOAD_PATH:
+                await self._stream_reloads(writer)
+                return
+            status, headers, body = self.resolve(url_path)
+            await self._respond(writer, status, headers, body, method == 'HEAD')
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # The server is shutting down with a reload stream still open
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, headers, body, head_only):
+        reason = {200: 'OK', 301: 'Moved Permanently', 404: 'Not Found', 405: 'Method Not Allowed'}[status]
+        lines = [f'HTTP/1.1 {status} {reason}', f'Content-Length: {len(body)}', 'Connection: close']
+        lines += [f'{k}: {v}' for k, v in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if not head_only:
+            writer.write(body)
+        await writer.drain()
+
+    async def _stream_reloads(self, writer):
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-store\r\nConnection: keep-alive\r\n\r\n')
+        await writer.drain()
+        queue = asyncio.Queue()
+        self.clients.add(queue)
+        try:
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=15)
+                    lines = ''.join(f'data: {line}\n' for line in data.split('\n'))
+                    writer.write(f'event: {event}\n{lines}\n'.encode('utf-8'))
+                except asyncio.TimeoutError:
+                    writer.write(b': keepalive\n\n')
+                await writer.drain()
+        finally:
+            self.clients.discard(queue)
+
+    async def serve_forever(self, host, port, ready=None):
+        """Serve until cancelled. ready() is called once the server is
+        listening and notify_*() can be called from other threads."""
+        self.loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self.handle, host, port)
+        if ready is not None:
+            ready()
+        async with server:
+            await server.serve_forever()
+
+
+def serve(host='127.0.0.1', port=8000):
+    """Build, then serve site/ with live reload while watching for changes."""
+    server = DevServer(SITE_DIR)
+    watcher = make_watcher(WATCH_DIRS)
+    state = build()
+    print(f"\nServing site/ at http://{host}:{port}/ "
+          f"(live reload, watching via {watcher.name}; Ctrl+C to stop)\n")
+
+    # Started only once the server's loop exists, which notify_*() need
+    rebuild_thread = threading.Thread(
+        target=rebuild_on_change,
+        args=(watcher, state),
+        kwargs={'publish': server.publish, 'on_rebuilt': server.notify_reload, 'on_error': server.notify_error},
+        daemon=True,
+    )
+    try:
+        asyncio.run(server.serve_forever(host, port, ready=rebuild_thread.start))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the Free State Party site into site/.')
+    parser.add_argument('-w', '--watch', action='store_true', help='rebuild when content/ or templates/ change')
+    parser.add_argument('--serve', action='store_true', help='serve site/ locally with live reload while watching')
+    parser.add_argument('--port', type=int, default=8000, help='port for --serve (default 8000)')
+    parser.add_argument('--force', action='store_true', help='re-render every page, ignoring the build manifest')
+    parser.add_argument('--profile', action='store_true',
+                        help=f'print per-phase timings and write them to site/{STATS_NAME}')
+    parser.add_argument('--cprofile', metavar='FILE', help='dump cProfile stats for the build to FILE')
+    parser.add_argument('--minify', action='store_true', help='minify page HTML (one-shot builds)')
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='worker processes for rendering and compressing pages (one-shot builds '
+                             'without --cprofile; default 1)')
+    parser.add_argument('--fingerprint', action='store_true',
+                        help='fetch the API events and print their fingerprint (as in site/events-hash.txt) without building')
+    parser.add_argument('--next-rebuild', action='store_true',
+                        help='fetch the API events and print the next time the site output changes on its own '
+                             '(as in site/next-rebuild.txt) without building')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.fingerprint or args.next_rebuild:
+            # Progress and warnings go to stderr; stdout is just the answer,
+            # and stays empty when there is none
+            with contextlib.redirect_stdout(sys.stderr):
+                events, _ = fetch_api_events()
+            today = datetime.now(EASTERN).date()
+            if args.fingerprint:
+                print(events_fingerprint(events, today))
+            if args.next_rebuild:
+                print(next_rebuild_at(index_events(events, today)).isoformat())
+        elif args.cprofile:
+            # cProfile only sees this process, so render everything in it
+            profiler = cProfile.Profile()
+            profiler.runcall(build, force=args.force, profile=args.profile, minify=args.minify, jobs=1)
+            profiler.dump_stats(args.cprofile)
+            print(f"  Wrote cProfile stats: {args.cprofile}")
+        elif args.serve:
+            serve(port=args.port)
+        elif args.watch:
+            watch()
+        else:
+            build(force=args.force, profile=args.profile, minify=args.minify, jobs=max(1, args.jobs))
+    except FetchError as e:
+        # Nothing has been printed or written; a failed job leaves the
+        # deployed site alone
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 if __name__ == '__main__':
-    import sys
-    if '--watch' in sys.argv or '-w' in sys.argv:
-        watch()
-    else:
-        build()
+    main()
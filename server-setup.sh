@@ -10,6 +10,24 @@ WEBROOT="/var/www/$DOMAIN"
 echo "==> Creating web root"
 mkdir -p "$WEBROOT"
 
+echo "==> Installing nginx brotli module"
+apt-get update -qq
+if apt-get install -y -qq libnginx-mod-http-brotli-static; then
+    BROTLI_STATIC="brotli_static on;"
+else
+    BROTLI_STATIC="# brotli_static unavailable (libnginx-mod-http-brotli-static not installed)"
+fi
+
+echo "==> Writing precompression snippet"
+mkdir -p /etc/nginx/snippets
+cat > /etc/nginx/snippets/precompressed.conf <<SNIPPET
+# build.py writes .gz and .br siblings next to every HTML/CSS/SVG/JSON file;
+# serve those instead of compressing on the fly
+gzip_static on;
+gzip_vary on;
+$BROTLI_STATIC
+SNIPPET
+
 echo "==> Writing nginx config"
 cat > /etc/nginx/sites-available/$DOMAIN <<'NGINX'
 server {
@@ -20,14 +38,56 @@ server {
     root /var/www/freestate.party;
     index index.html;
 
+    include snippets/precompressed.conf;
+
     location / {
         try_files $uri $uri/ =404;
     }
 
-    # Cache static assets
-    location ~* \.(css|js|jpg|jpeg|png|gif|ico|svg|woff2?|ttf|mp4|webm)$ {
+    # Content-hashed files (fingerprinted assets, stylesheets, fonts, image
+    # variants, mirrored posters) never change under the same URL. The one
+    # Cache-Control header comes from add_header; "expires" would add a
+    # second one.
+    location ~ ^/(assets|css|fonts|img/r|img/events)/ {
+        add_header Cache-Control "public, max-age=31536000, immutable";
+
+        location ~* \.avif$ {
+            types { }
+            default_type image/avif;
+            add_header Cache-Control "public, max-age=31536000, immutable";
+        }
+    }
+
+    # The home page video isn't fingerprinted (deploys skip video/) and is
+    # replaced rarely, so it keeps the week-long lifetime it always had
+    location ~* \.(mp4|webm)$ {
         expires 7d;
-        add_header Cache-Control "public, immutable";
+    }
+
+    # Unhashed originals keep stable URLs for outside links and og:image
+    # crawlers; pages link the hashed copies, so a short TTL is enough
+    location ~* \.(css|js|jpg|jpeg|png|gif|ico|svg|webp|woff2?|ttf)$ {
+        expires 1h;
+    }
+
+    # Event feeds follow the events, which the check-api workflow polls
+    # every five minutes; mime.types has no entry for .ics
+    location ~* \.(ics|atom|json)$ {
+        types {
+            text/calendar ics;
+            application/atom+xml atom;
+            application/json json;
+        }
+        charset utf-8;
+        charset_types text/calendar application/atom+xml application/json;
+        expires 5m;
+    }
+
+    # Older nginx mime.types lacks avif
+    location ~* \.avif$ {
+        types { }
+        default_type image/avif;
+        expires 1h;
     }
 }
 NGINX
@@ -43,7 +103,6 @@ echo "==> Reloading nginx"
 systemctl reload nginx
 
 echo "==> Installing certbot"
-apt-get update -qq
 apt-get install -y -qq certbot python3-certbot-nginx
 
 echo "==> Getting SSL certificate"
@@ -0,0 +1,43 @@
+"""A TestCase base for tests that point build.py at scratch directories or a
+stand-in API."""
+
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import build
+from tests.stand_in import StandInAPI
+
+
+class BuildTestCase(unittest.TestCase):
+    """Module globals of build set through patch() are restored, and
+    scratch directories removed, when the test ends."""
+
+    def patch(self, name, value):
+        """Set build.<name> to value for the rest of the test."""
+        self.addCleanup(setattr, build, name, getattr(build, name))
+        setattr(build, name, value)
+
+    def scratch_tree(self, *names):
+        """A fresh temporary directory; build.<name> for each of names
+        (SITE_DIR, CACHE_DIR, ...) is pointed at a subdirectory of it named
+        after the global ('site', 'cache', ...). Returns the directory."""
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        for name in names:
+            self.patch(name, os.path.join(root, name.lower().rsplit('_', 1)[0]))
+        return root
+
+    def quiet(self):
+        """Capture stdout for the rest of the test; returns the buffer."""
+        return self.enterContext(contextlib.redirect_stdout(io.StringIO()))
+
+    def stand_in(self, bodies=None, **kwargs):
+        """Start a StandInAPI for the rest of the test and point
+        build.API_BASE at it."""
+        api = self.enterContext(StandInAPI(bodies, **kwargs))
+        self.patch('API_BASE', api.base)
+        return api
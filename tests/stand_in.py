@@ -0,0 +1,87 @@
+"""A local stand-in for the events API host, as in bench.py's stand_in_api()."""
+
+import hashlib
+import http.server
+import threading
+import time
+
+LAST_MODIFIED = 'Thu, 01 Oct 2026 12:00:00 GMT'
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        api = self.server.api
+        path = self.path.split('?', 1)[0]
+        with api.lock:
+            api.requests.append((path, dict(self.headers)))
+            api.active += 1
+            api.max_active = max(api.max_active, api.active)
+        try:
+            time.sleep(api.delay)
+            self._respond(api, path)
+        finally:
+            with api.lock:
+                api.active -= 1
+
+    def _respond(self, api, path):
+        if path in api.failing or path not in api.bodies:
+            self.send_error(500 if path in api.failing else 404)
+            return
+        body = api.bodies[path]
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+        if self.headers.get('If-None-Match') == etag or (
+                api.last_modified_only and self.headers.get('If-Modified-Since') == LAST_MODIFIED):
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        if not api.last_modified_only:
+            self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInAPI:
+    """Serves bodies[path] on a free local port with ETag and Last-Modified
+    validators (only Last-Modified when last_modified_only), answering
+    conditional requests with 304. Paths in failing get a 500. Records each
+    request's path and headers, and the most requests in flight at once;
+    delay holds every response that many seconds."""
+
+    def __init__(self, bodies=None, delay=0.0, last_modified_only=False):
+        self.bodies = dict(bodies or {})
+        self.failing = set()
+        self.delay = delay
+        self.last_modified_only = last_modified_only
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.api = self
+        self.base = f'http://127.0.0.1:{self.server.server_address[1]}'
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stop(self):
+        """Shut the server down; later requests to it fail to connect."""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def url(self, path):
+        return self.base + path
+
+    def paths(self):
+        return [path for path, _ in self.requests]
@@ -0,0 +1,73 @@
+"""fingerprint_assets() and save_changed() in a scratch site/ tree."""
+
+import hashlib
+import os
+import unittest
+
+import build
+from tests.build_case import BuildTestCase
+
+
+def _hashed(path, data):
+    stem, ext = os.path.splitext(path)
+    return f'{build.ASSET_OUTPUT_DIR}/{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}'
+
+
+class FingerprintAssetsTest(BuildTestCase):
+    def setUp(self):
+        self.scratch_tree('SITE_DIR')
+        self.files = {'img/logo.svg': b'<svg/>', 'img/poster.png': b'\x89PNG poster'}
+        for path, data in self.files.items():
+            build.write_output(path, data)
+
+    def listing(self):
+        return sorted(os.path.relpath(os.path.join(directory, name), build.SITE_DIR)
+                      for directory, _, names in os.walk(os.path.join(build.SITE_DIR, build.ASSET_OUTPUT_DIR))
+                      for name in names)
+
+    def test_every_asset_is_copied(self):
+        assets, changed = build.fingerprint_assets()
+        self.assertEqual(assets, {path: _hashed(path, data) for path, data in self.files.items()})
+        self.assertEqual(sorted(changed), self.listing())
+
+    def test_images_with_variants_are_not_copied(self):
+        build.fingerprint_assets()
+        assets, changed = build.fingerprint_assets(skip={'img/poster.png': None})
+        self.assertEqual(assets, {'img/logo.svg': _hashed('img/logo.svg', b'<svg/>')})
+        # The copy made before the poster had variants is removed, and listed
+        # for the deploy to delete
+        self.assertEqual(self.listing(), [_hashed('img/logo.svg', b'<svg/>')])
+        self.assertEqual(changed, [_hashed('img/poster.png', b'\x89PNG poster')])
+        self.assertTrue(os.path.isfile(os.path.join(build.SITE_DIR, 'img/poster.png')))
+
+
+class SaveChangedTest(BuildTestCase):
+    def test_removed_outputs_are_listed_apart(self):
+        self.scratch_tree('SITE_DIR')
+        build.write_output('index.html', '<p>')
+        build.write_output('css/site.0123456789.css', 'p{}')
+        build.save_changed(['index.html', 'css/site.abcdef0123.css', 'css/site.0123456789.css', 'index.html'])
+        with open(os.path.join(build.SITE_DIR, build.CHANGED_NAME)) as f:
+            self.assertEqual(f.read(), 'css/site.0123456789.css\nindex.html\n')
+        with open(os.path.join(build.SITE_DIR, build.REMOVED_NAME)) as f:
+            self.assertEqual(f.read(), 'css/site.abcdef0123.css\n')
+
+
+class ResponsiveImagesTest(unittest.TestCase):
+    def test_sizes_without_srcset_is_dropped(self):
+        tag = '<img src="https://example.com/poster.png" alt="" sizes="100vw" class="w-full">'
+        for image_sets in ({}, {'img/other.png': None}):
+            self.assertEqual(build.responsive_images(tag, image_sets, '..'),
+                             '<img src="https://example.com/poster.png" alt="" class="w-full">')
+        tag = '<img src="x.png" srcset="x.png 1x" sizes="100vw">'
+        self.assertEqual(build.responsive_images(tag, {}, '..'), tag)
+
+    def test_processed_image_keeps_sizes(self):
+        image = build.ImageSet(960, 640, 'jpeg', (('webp', 960, 'img/r/a-960.webp'), ('jpeg', 960, 'img/r/a-960.jpg')))
+        html = build.responsive_images('<img src="../img/a.png" alt="" sizes="50vw">', {'img/a.png': image}, '..')
+        self.assertIn('<source type="image/webp" srcset="../img/r/a-960.webp 960w" sizes="50vw">', html)
+        self.assertIn(' sizes="50vw"', html[html.index('<img'):])
+
+
+if __name__ == '__main__':
+    unittest.main()
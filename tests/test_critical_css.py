@@ -0,0 +1,91 @@
+"""Inline critical CSS and the characters font subsets are cut to."""
+
+import contextlib
+import functools
+import io
+import os
+import time
+import unittest
+
+import build
+
+HERO = '''<body class="bg-dark-900 flex">
+    <header><nav class="px-4"><a href="./" class="font-display hover:text-gold-500">Free State</a></nav></header>
+    <main id="main">
+        <section class="min-h-screen">
+            <h1 class="gold-gradient cycle-word">patriot</h1>
+            <div class="video-container"><video></video></div>
+        </section>
+        <section class="py-24">
+            <form><input class="form-input w-full" placeholder="Name"></form>
+            <table class="divider"></table>
+        </section>
+    </main>
+</body>'''
+
+
+def _render_page(ctx):
+    template = build.load_template(os.path.join(build.TEMPLATE_DIR, 'base.html'))
+    return build.build_page(template, 'Free State Party', 'A private club.', 'Free State Party',
+                            '<section><h1>Free State</h1></section>', footer={'name': 'Free State Party'})
+
+
+def _render_slowly(n, ctx):
+    # Earlier tasks finish later
+    time.sleep(0.1 * (3 - n))
+    print(f'rendered {n}')
+    return '<p>x</p>'
+
+
+class CriticalRulesTest(unittest.TestCase):
+    def test_selectors_are_filtered_to_the_markup(self):
+        css = 'h1,h2,p{margin:0}table{border-collapse:collapse}.a .b,.c{color:red}*,::before{box-sizing:border-box}'
+        self.assertEqual(build.critical_rules(css, {'c'}, {'h1'}),
+                         'h1{margin:0}.c{color:red}*,::before{box-sizing:border-box}')
+
+    def test_interaction_states_are_left_out(self):
+        css = ('.a:hover{color:red}:focus-visible{outline:2px}input::placeholder{opacity:1}'
+               '::-webkit-search-decoration{-webkit-appearance:none}input:where([type=\'button\']){cursor:pointer}')
+        self.assertEqual(build.critical_rules(css, {'a'}, {'input'}), "input:where([type='button']){cursor:pointer}")
+
+
+class CriticalCSSTest(unittest.TestCase):
+    def setUp(self):
+        self.css = build.critical_css(HERO, (), '.')
+
+    def test_above_the_fold_rules_are_inlined(self):
+        for rule in ('.gold-gradient{', '.cycle-word{', '.video-container video{', '.min-h-screen{', 'h1{', 'a{'):
+            self.assertIn(rule, self.css)
+
+    def test_below_the_fold_rules_are_left_out(self):
+        for rule in ('.form-input', '.divider', '.py-24', '.w-full', 'table{', 'input', 'hover', 'focus'):
+            self.assertNotIn(rule, self.css)
+
+    def test_smaller_than_the_stylesheet(self):
+        self.assertLess(len(self.css), len(build.generate_css(build.page_classes(HERO))))
+
+
+class PageCharsTest(unittest.TestCase):
+    def test_head_assets_placeholder_is_not_page_text(self):
+        build._init_page_tasks({'images': {}, 'assets': {}}, True)
+        result = build.render_page_task('index.html', _render_page)
+        self.assertIn(build.HEAD_ASSETS_PLACEHOLDER, result.html)
+        self.assertNotIn('\x00', result.chars)
+        self.assertNotIn('_', result.chars)
+        self.assertLessEqual(set('Free State'), result.chars)
+
+
+class RenderPagesTest(unittest.TestCase):
+    def test_output_is_replayed_in_task_order(self):
+        tasks = [(f'{n}.html', functools.partial(_render_slowly, n)) for n in range(3)]
+        for jobs in (1, 3):
+            with self.subTest(jobs=jobs):
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out):
+                    results = build.render_pages(tasks, {'images': {}, 'assets': {}}, False, jobs, build.PhaseTimer())
+                self.assertEqual([result.filepath for result in results], ['0.html', '1.html', '2.html'])
+                self.assertEqual(out.getvalue(), 'rendered 0\nrendered 1\nrendered 2\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
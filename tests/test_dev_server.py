@@ -0,0 +1,118 @@
+"""The watch/serve rebuild loop and the dev server's reload events."""
+
+import asyncio
+import contextlib
+import io
+import socket
+import threading
+import time
+import unittest
+
+import build
+from tests.build_case import BuildTestCase
+
+
+class _Stop(Exception):
+    pass
+
+
+class _Watcher:
+    """Reports each burst of changed paths in turn, then stops the loop."""
+
+    def __init__(self, *bursts):
+        self.bursts = list(bursts)
+
+    def wait(self):
+        if not self.bursts:
+            raise _Stop
+        return self.bursts.pop(0)
+
+
+class RebuildOnChangeTest(BuildTestCase):
+    def setUp(self):
+        self.states = []
+        self.patch('build', self.fake_build)
+        self.quiet()
+        self.stderr = self.enterContext(contextlib.redirect_stderr(io.StringIO()))
+
+    def fake_build(self, changed_sources, state, publish):
+        if 'broken' in changed_sources:
+            raise ValueError('bad front matter')
+        self.states.append(state)
+        return state + 1
+
+    def test_failed_rebuild_keeps_watching(self):
+        errors, rebuilt = [], []
+        with self.assertRaises(_Stop):
+            build.rebuild_on_change(_Watcher({'a'}, {'broken'}, {'b'}), 0,
+                                    on_rebuilt=lambda: rebuilt.append(True), on_error=errors.append)
+        # The rebuild after the failure starts from the last good state
+        self.assertEqual(self.states, [0, 1])
+        self.assertEqual(len(rebuilt), 2)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('ValueError: bad front matter', errors[0])
+        self.assertIn('Rebuild failed', self.stderr.getvalue())
+
+
+class DevServerEventsTest(unittest.TestCase):
+    def setUp(self):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            self.port = s.getsockname()[1]
+        self.server = build.DevServer(build.SITE_DIR)
+        self.ready = threading.Event()
+        thread = threading.Thread(target=self._serve, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(self._stop)
+        self.assertTrue(self.ready.wait(5))
+
+    def _serve(self):
+        async def main():
+            self.task = asyncio.current_task()
+            await self.server.serve_forever('127.0.0.1', self.port, ready=self.ready.set)
+
+        with contextlib.suppress(asyncio.CancelledError):
+            asyncio.run(main())
+
+    def _stop(self):
+        # asyncio.run() then cancels the connection handlers itself
+        self.server.loop.call_soon_threadsafe(self.task.cancel)
+
+    def events(self, count):
+        """Subscribe to RELOAD_PATH, then yield the next count events as
+        (event, data) once the subscriber is registered."""
+        conn = socket.create_connection(('127.0.0.1', self.port), timeout=5)
+        self.addCleanup(conn.close)
+        conn.sendall(f'GET {build.RELOAD_PATH} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode())
+        f = conn.makefile('rb')
+        self.addCleanup(f.close)
+        while f.readline() not in (b'\r\n', b''):
+            pass
+        while not self.server.clients:
+            time.sleep(0.01)
+        yield None
+        for _ in range(count):
+            event, data = None, []
+            for line in iter(f.readline, b'\n'):
+                key, _, value = line.decode().rstrip('\n').partition(': ')
+                if key == 'event':
+                    event = value
+                elif key == 'data':
+                    data.append(value)
+            yield event, '\n'.join(data)
+
+    def test_loop_exists_when_ready(self):
+        self.assertIsNotNone(self.server.loop)
+
+    def test_reload_and_error_events(self):
+        events = self.events(2)
+        next(events)
+        self.server.notify_error('Traceback (most recent call last):\nValueError: boom')
+        self.server.notify_reload()
+        self.assertEqual(list(events), [('build-error', 'Traceback (most recent call last):\nValueError: boom'),
+                                        ('reload', '')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Structured data on the event listing and detail pages."""
+
+import json
+import os
+import re
+import unittest
+from datetime import date, datetime, timedelta
+
+import build
+
+_JSON_LD_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.S)
+TODAY = date(2026, 10, 18)
+
+
+def _events(count, first, step):
+    return build.normalize_events(
+        {'title': f'Dinner Talk {n}', 'location': '1 Elm Street, Keene, NH 03431',
+         'startsAt': (datetime(first.year, first.month, first.day, 23) + timedelta(days=step * n))
+         .strftime('%Y-%m-%dT%H:%M:%S.000Z')}
+        for n in range(count))
+
+
+def _json_ld(html, kind):
+    """The page's JSON-LD blocks of @type kind (every page also has the
+    site's Organization)."""
+    return [data for data in map(json.loads, _JSON_LD_RE.findall(html)) if data['@type'] == kind]
+
+
+class EventPagesTest(unittest.TestCase):
+    def setUp(self):
+        events = _events(2, TODAY + timedelta(days=7), 7) + _events(build.EVENTS_PER_PAGE + 1, TODAY, -7)[1:]
+        self.index = build.index_events(events, TODAY)
+        self.ctx = {
+            'template': build.load_template(os.path.join(build.TEMPLATE_DIR, 'base.html')),
+            'footer': build.load_content('footer.md').meta,
+            'event_index': self.index,
+        }
+
+    def item_list(self, kind, number):
+        scripts = _json_ld(build.render_event_listing(kind, number, self.ctx), 'ItemList')
+        self.assertEqual(len(scripts), 1)
+        return scripts[0]['itemListElement']
+
+    def test_listing_lists_its_events(self):
+        items = self.item_list('upcoming', 1)
+        self.assertEqual([item['position'] for item in items], [1, 2])
+        for item, event in zip(items, self.index.upcoming):
+            self.assertEqual(item['url'], f'{build.BASE_URL}/events/{event.slug}/')
+            self.assertEqual(item['item']['@type'], 'Event')
+            self.assertEqual(item['item']['name'], event.title)
+            self.assertEqual(item['item']['startDate'], event.starts_at_raw)
+
+    def test_positions_continue_across_pages(self):
+        self.assertEqual(len(self.index.past), build.EVENTS_PER_PAGE)
+        self.assertEqual(len(self.item_list('past', 1)), build.EVENTS_PER_PAGE)
+        self.index = self.ctx['event_index'] = self.index._replace(past=self.index.past + _events(1, TODAY, -700))
+        self.assertEqual([item['position'] for item in self.item_list('past', 2)], [build.EVENTS_PER_PAGE + 1])
+
+    def test_detail_page_has_the_event(self):
+        event = self.index.upcoming[0]
+        scripts = _json_ld(build.render_event_detail(event.slug, False, self.ctx), 'Event')
+        self.assertEqual([script['name'] for script in scripts], [event.title])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+"""cached_fetch() and streamed_fetch() against a local stand-in server."""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import unittest
+
+import build
+from tests.build_case import BuildTestCase
+from tests.stand_in import LAST_MODIFIED
+
+BODY = b'[{"title": "Free State Saturday", "startsAt": "2026-11-07T21:00:00.000Z"}]'
+
+
+def _read(f):
+    return f.read()
+
+
+def _json(body):
+    json.loads(body)
+
+
+class HTTPCacheTestCase(BuildTestCase):
+    def setUp(self):
+        self.scratch_tree('CACHE_DIR')
+        self.api = self.stand_in({'/api/public/events': BODY})
+        self.stdout = self.quiet()
+        self.url = self.api.url('/api/public/events')
+
+    def fetch(self, **kwargs):
+        return build.cached_fetch(self.url, validate=_json, **kwargs)
+
+    def stream(self, **kwargs):
+        result, digest, source = build.streamed_fetch(self.url, _read, **kwargs)
+        return result, source, digest
+
+
+class CachedFetchTest(HTTPCacheTestCase):
+    def test_200_then_304_with_etag(self):
+        self.assertEqual(self.fetch(), (BODY, 'network'))
+        self.assertEqual(self.fetch(), (BODY, 'not-modified'))
+        headers = self.api.requests[1][1]
+        self.assertIn('If-None-Match', headers)
+        self.assertEqual(headers['If-Modified-Since'], LAST_MODIFIED)
+
+    def test_304_with_last_modified_only(self):
+        self.api.last_modified_only = True
+        self.assertEqual(self.fetch(), (BODY, 'network'))
+        self.assertEqual(self.fetch(), (BODY, 'not-modified'))
+        self.assertNotIn('If-None-Match', self.api.requests[1][1])
+
+    def test_changed_body_replaces_cache(self):
+        self.fetch()
+        self.api.bodies['/api/public/events'] = b'[]'
+        self.assertEqual(self.fetch(), (b'[]', 'network'))
+        self.assertEqual(build.load_http_cache(self.url)[0], b'[]')
+
+    def test_network_failure_uses_cached_body(self):
+        self.fetch()
+        self.api.stop()
+        self.assertEqual(self.fetch(timeout=2), (BODY, 'stale'))
+
+    def test_server_error_and_invalid_body_use_cached_body(self):
+        self.fetch()
+        self.api.failing.add('/api/public/events')
+        self.assertEqual(self.fetch(), (BODY, 'stale'))
+        self.api.failing.clear()
+        self.api.bodies['/api/public/events'] = b'<html>maintenance</html>'
+        self.assertEqual(self.fetch(), (BODY, 'stale'))
+        # The garbage never replaced the good copy
+        self.assertEqual(build.load_http_cache(self.url)[0], BODY)
+
+    def test_failure_without_cache_raises(self):
+        self.api.stop()
+        with self.assertRaises(OSError):
+            self.fetch(timeout=2)
+
+    def test_corrupt_cache_entry_is_ignored(self):
+        self.fetch()
+        body_path, meta_path = build._http_cache_paths(self.url)
+        with open(meta_path, 'w') as f:
+            f.write('{not json')
+        self.assertEqual(build.load_http_cache(self.url), (None, {}))
+        # No validators are sent for an unreadable entry, and it is rewritten
+        self.assertEqual(self.fetch(), (BODY, 'network'))
+        self.assertNotIn('If-None-Match', self.api.requests[-1][1])
+        self.assertEqual(build.load_http_cache(self.url)[0], BODY)
+
+    def test_cache_entry_for_another_url_is_ignored(self):
+        self.fetch()
+        _, meta_path = build._http_cache_paths(self.url)
+        with open(meta_path) as f:
+            meta = json.load(f)
+        meta['url'] = 'https://example.com/other'
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+        self.api.stop()
+        with self.assertRaises(OSError):
+            self.fetch(timeout=2)
+
+
+class StreamedFetchTest(HTTPCacheTestCase):
+    def test_200_then_304(self):
+        self.assertEqual(self.stream(), (BODY, 'network', hashlib.sha256(BODY).hexdigest()))
+        self.assertEqual(self.stream(), (BODY, 'not-modified', hashlib.sha256(BODY).hexdigest()))
+        self.assertIn('If-None-Match', self.api.requests[1][1])
+
+    def test_network_failure_uses_cached_body(self):
+        self.stream()
+        self.api.stop()
+        self.assertEqual(self.stream(timeout=2)[:2], (BODY, 'stale'))
+
+    def test_rejected_body_keeps_cached_copy(self):
+        self.stream()
+        self.api.bodies['/api/public/events'] = b'{"error": true}'
+
+        def expect_list(f):
+            data = json.load(f)
+            if not isinstance(data, list):
+                raise ValueError('not a list')
+            return data
+
+        result, _, source = build.streamed_fetch(self.url, expect_list)
+        self.assertEqual((result, source), (json.loads(BODY), 'stale'))
+        body_path, _ = build._http_cache_paths(self.url)
+        with open(body_path, 'rb') as f:
+            self.assertEqual(f.read(), BODY)
+        self.assertEqual([name for name in os.listdir(os.path.dirname(body_path)) if name.startswith('.tmp-')], [])
+
+    def test_oversized_body_uses_cached_body(self):
+        self.stream()
+        self.api.bodies['/api/public/events'] = BODY + b' ' * 100
+        self.assertEqual(self.stream(max_bytes=len(BODY) + 10)[:2], (BODY, 'stale'))
+
+    def test_corrupt_cache_entry_is_ignored(self):
+        self.stream()
+        body_path, meta_path = build._http_cache_paths(self.url)
+        with open(meta_path, 'w') as f:
+            f.write('[]')
+        self.assertEqual(self.stream()[:2], (BODY, 'network'))
+        self.assertNotIn('If-None-Match', self.api.requests[-1][1])
+        # A missing body invalidates the entry too
+        os.unlink(body_path)
+        self.api.stop()
+        with self.assertRaises(OSError):
+            self.stream(timeout=2)
+
+
+class FetchAPIEventsTest(HTTPCacheTestCase):
+    def test_normalize_is_timed_as_its_own_phase(self):
+        timer = build.PhaseTimer()
+        events, source = build.fetch_api_events(timer)
+        self.assertEqual(source, 'network')
+        self.assertEqual([event.title_raw for event in events], ['Free State Saturday'])
+        self.assertEqual(timer.phases['normalize'][2], 1)
+
+    def test_stale_copy_when_api_is_down(self):
+        self.assertEqual(build.fetch_api_events()[1], 'network')
+        self.api.stop()
+        events, source = build.fetch_api_events()
+        self.assertEqual((len(events), source), (1, 'stale'))
+
+    def test_failure_with_empty_cache_raises(self):
+        self.api.failing.add('/api/public/events')
+        with self.assertRaises(build.FetchError):
+            build.fetch_api_events()
+        self.api.stop()
+        with self.assertRaises(build.FetchError):
+            build.fetch_api_events()
+
+    def test_build_fails_before_writing_the_site(self):
+        self.scratch_tree('SITE_DIR')
+        self.api.stop()
+        stderr = self.enterContext(contextlib.redirect_stderr(io.StringIO()))
+        with self.assertRaises(SystemExit) as cm:
+            build.main(['--jobs', '1'])
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn('ERROR: Failed to fetch events', stderr.getvalue())
+        self.assertFalse(os.path.exists(build.SITE_DIR))
+
+    def test_fingerprint(self):
+        self.enterContext(contextlib.redirect_stderr(io.StringIO()))
+        build.main(['--fingerprint'])
+        self.assertRegex(self.stdout.getvalue(), r'\A[0-9a-f]{64}\n\Z')
+        # A cached copy still answers when the API is down
+        self.api.stop()
+        build.main(['--fingerprint'])
+        self.assertEqual(len(set(self.stdout.getvalue().split())), 1)
+
+    def test_fingerprint_fails_with_empty_cache(self):
+        self.api.stop()
+        stderr = self.enterContext(contextlib.redirect_stderr(io.StringIO()))
+        for flag in ('--fingerprint', '--next-rebuild'):
+            with self.assertRaises(SystemExit) as cm:
+                build.main([flag])
+            self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(self.stdout.getvalue(), '')
+        self.assertIn('ERROR: Failed to fetch events', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
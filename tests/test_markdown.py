@@ -0,0 +1,97 @@
+"""The single-scan markdown converter against the regex converter it replaced."""
+
+import re
+import unittest
+
+import build
+
+CONTENT_FILES = ('about.md', 'business.md', 'saturdays.md')
+
+
+def regex_paragraphs_to_html(text):
+    """_paragraphs_to_html() before the single-scan tokenizer."""
+    html_parts = []
+    for p in re.split(r'\n\s*\n', text.strip()):
+        p = p.strip()
+        if not p:
+            continue
+        p = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2" class="text-gold-500 hover:text-gold-400 transition-colors">\1</a>', p)
+        p = re.sub(r'\*\*(.+?)\*\*', r'<strong class="text-dark-50">\1</strong>', p)
+        p = re.sub(r'\*(.+?)\*', r'<em>\1</em>', p)
+        p = p.replace(' — ', ' &mdash; ')
+        p = p.replace('— ', '&mdash; ')
+        html_parts.append(f'<p>{p}</p>')
+    return '\n                '.join(html_parts)
+
+
+def regex_sections(text):
+    """parse_sections() before content documents: (title, body html) per H2."""
+    sections = []
+    current_title = None
+    current_lines = []
+    for line in text.strip().split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('## '):
+            if current_title is not None:
+                sections.append((current_title, regex_paragraphs_to_html('\n'.join(current_lines))))
+            current_title = stripped[3:].strip()
+            current_lines = []
+        elif current_title is not None and not stripped.startswith('# '):
+            current_lines.append(line)
+    if current_title is not None:
+        sections.append((current_title, regex_paragraphs_to_html('\n'.join(current_lines))))
+    return sections
+
+
+def regex_md_to_html(text):
+    """md_to_html() before content documents: (h2_title, body_html)."""
+    h2_title = ''
+    body_lines = []
+    skip_blank = False
+    for line in text.strip().split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('# ') and not stripped.startswith('## '):
+            skip_blank = True
+            continue
+        if stripped.startswith('## '):
+            h2_title = stripped[3:].strip()
+            skip_blank = True
+            continue
+        if skip_blank and stripped == '':
+            skip_blank = False
+            continue
+        skip_blank = False
+        body_lines.append(line)
+    filtered = []
+    for p in re.split(r'\n\s*\n', '\n'.join(body_lines).strip()):
+        if not all(re.match(r'^[a-z_]+:', line) for line in p.split('\n') if line.strip()):
+            filtered.append(p)
+    return h2_title, regex_paragraphs_to_html('\n\n'.join(filtered))
+
+
+class MarkdownTest(unittest.TestCase):
+    def test_content_files_match_regex_converter(self):
+        for name in CONTENT_FILES:
+            with self.subTest(file=name):
+                text = build.read_file(f'{build.CONTENT_DIR}/{name}')
+                doc = build.parse_content(text)
+                self.assertEqual(list(doc.sections), regex_sections(text))
+                self.assertEqual((doc.h2_title, doc.body_html), regex_md_to_html(text))
+
+    def test_inline(self):
+        cases = [
+            ('**bold** and *em* — [link](https://x.com/a)',
+             '<p><strong class="text-dark-50">bold</strong> and <em>em</em> &mdash; '
+             f'<a href="https://x.com/a" class="{build.LINK_CLASS}">link</a></p>'),
+            ('***both***', '<p><strong class="text-dark-50"><em>both</em></strong></p>'),
+            ('**a *b* c**', '<p><strong class="text-dark-50">a <em>b</em> c</strong></p>'),
+            (r'\*literal\* 2 * 3', '<p>*literal* 2 * 3</p>'),
+            ('one\n\n\n  \ntwo', '<p>one</p>\n                <p>two</p>'),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(build._paragraphs_to_html(text), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""minify_html(): golden cases, and minified pages that parse the same as the originals."""
+
+import json
+import os
+import unittest
+from html.parser import HTMLParser
+
+import build
+from tests.build_case import BuildTestCase
+
+GOLDEN = [
+    # <pre> keeps its whitespace; the indentation around it goes
+    ('<div>\n  <pre>  line 1\n    line 2  </pre>\n</div>',
+     '<div><pre>  line 1\n    line 2  </pre></div>'),
+    # Inline script bodies are copied through untouched
+    ('<body>\n  <script>\n  if (a < b &&  c > d) {  x("  "); }\n  </script>\n</body>',
+     '<body><script>\n  if (a < b &&  c > d) {  x("  "); }\n  </script></body>'),
+    # JSON-LD is re-serialized compactly, with </ still escaped
+    ('<head>\n<script type="application/ld+json">\n{\n    "@context": "https://schema.org",\n'
+     '    "name": "A </b> & B"\n}\n</script>\n</head>',
+     '<head><script type="application/ld+json">{"@context":"https://schema.org","name":"A <\\/b> & B"}'
+     '</script></head>'),
+    # Quoted attribute values are never rewritten, even when they hold > or />
+    ('<a  title="a >b"\n   href="/x" >go</a> <img alt="x />y" src="i.png" />',
+     '<a title="a >b" href="/x">go</a> <img alt="x />y" src="i.png"/>'),
+    ("<p data-x='q  > r' >x</p>", "<p data-x='q  > r'>x</p>"),
+    # Whitespace between inline elements collapses to one space; next to
+    # block tags it goes
+    ('<p>\n    Hello   <strong>big</strong>  <em>world</em>,\n    <a href="/">home</a>\n</p>\n<p>  next  </p>',
+     '<p>Hello <strong>big</strong> <em>world</em>, <a href="/">home</a></p><p>next</p>'),
+    ('<span>a</span><span>b</span> <span>c</span>', '<span>a</span><span>b</span> <span>c</span>'),
+    ('<div>\n  <!-- gone -->\n  <span>a</span>\n</div>', '<div><span>a</span></div>'),
+]
+
+# One upcoming and one past event, so every kind of page is built
+EVENTS = [
+    {'title': 'Free State Saturday', 'description': 'Dinner **and** a talk.\n\nBring a friend.',
+     'startsAt': '2099-11-07T21:00:00.000Z', 'endsAt': '2099-11-08T00:00:00.000Z',
+     'location': '1 Elm Street, Keene NH', 'rsvpUrl': '/rsvp/saturday'},
+    {'title': 'Book Club', 'startsAt': '2020-09-07T21:00:00.000Z'},
+]
+
+
+class _Outline(HTMLParser):
+    """What a page renders as: tags with attributes, text with whitespace
+    runs collapsed (verbatim inside <pre> and <script>), JSON-LD as data."""
+
+    VERBATIM = ('pre', 'script', 'style', 'textarea')
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=True)
+        self.items = []
+        self.verbatim = []
+        self.feed(html)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        self.items.append(('start', tag, attrs))
+        if tag in self.VERBATIM:
+            self.verbatim.append((tag, dict(attrs).get('type')))
+
+    def handle_startendtag(self, tag, attrs):
+        self.items.append(('start', tag, attrs))
+
+    def handle_endtag(self, tag):
+        self.items.append(('end', tag))
+        if self.verbatim and self.verbatim[-1][0] == tag:
+            self.verbatim.pop()
+
+    def handle_data(self, data):
+        if self.verbatim and self.verbatim[-1][1] == 'application/ld+json':
+            self.items.append(('json', json.loads(data)))
+        elif self.verbatim:
+            self.items.append(('raw', data))
+        elif data.split():
+            self.items.append(('text', ' '.join(data.split())))
+
+
+class MinifyTest(unittest.TestCase):
+    def test_golden(self):
+        for html, expected in GOLDEN:
+            with self.subTest(html=html):
+                self.assertEqual(build.minify_html(html), expected)
+                self.assertEqual(_Outline(expected).items, _Outline(html).items)
+
+    def test_idempotent(self):
+        for html, expected in GOLDEN:
+            with self.subTest(html=html):
+                self.assertEqual(build.minify_html(expected), expected)
+
+
+class SitePagesTest(BuildTestCase):
+    def test_built_pages_render_the_same(self):
+        self.scratch_tree('SITE_DIR', 'CACHE_DIR')
+        self.stand_in({'/api/public/events': json.dumps(EVENTS).encode()})
+        self.quiet()
+        build.build()
+        pages = [os.path.join(directory, name) for directory, _, names in os.walk(build.SITE_DIR)
+                 for name in names if name.endswith('.html')]
+        self.assertGreater(len(pages), 5)
+        for path in pages:
+            with self.subTest(page=os.path.relpath(path, build.SITE_DIR)):
+                html = build.read_file(path)
+                minified = build.minify_html(html)
+                self.assertLess(len(minified), len(html))
+                self.assertEqual(_Outline(minified).items, _Outline(html).items)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""mirror_posters() against a local stand-in server."""
+
+import hashlib
+import os
+import shutil
+import unittest
+
+import build
+from tests.build_case import BuildTestCase
+
+
+def _poster(n):
+    # sniff_image_ext() only looks at the signature
+    return b'\x89PNG\r\n\x1a\n' + f'poster {n}'.encode() * 10
+
+
+def _events(*numbers):
+    return build.normalize_events(
+        {'title': f'Event {n}', 'startsAt': f'2026-11-{n + 1:02d}T21:00:00.000Z',
+         'posterUrl': f'/api/uploads/posters/{n}.png'}
+        for n in numbers)
+
+
+class MirrorPostersTest(BuildTestCase):
+    def setUp(self):
+        self.scratch_tree('SITE_DIR', 'CACHE_DIR')
+        self.api = self.stand_in({f'/api/uploads/posters/{n}.png': _poster(n) for n in range(10)})
+        self.quiet()
+
+    def mirror(self, *numbers, evict=True):
+        return build.mirror_posters(_events(*numbers), evict=evict)
+
+    def poster_files(self):
+        return sorted(name for name in os.listdir(os.path.join(build.SITE_DIR, build.POSTER_DIR))
+                      if not name.startswith('.'))
+
+    def cache_entries(self):
+        return sorted(os.listdir(os.path.join(build.CACHE_DIR, build.POSTER_CACHE)))
+
+    def test_content_hashed_path(self):
+        events, changed = self.mirror(0)
+        path = f'{build.POSTER_DIR}/{hashlib.sha256(_poster(0)).hexdigest()[:16]}.png'
+        self.assertEqual(events[0].poster_path, path)
+        self.assertEqual(changed, [path])
+        with open(os.path.join(build.SITE_DIR, path), 'rb') as f:
+            self.assertEqual(f.read(), _poster(0))
+
+    def test_shared_poster_fetched_once(self):
+        events = build.normalize_events(
+            {'title': title, 'startsAt': '2026-11-07T21:00:00.000Z', 'posterUrl': '/api/uploads/posters/0.png'}
+            for title in ('A', 'B'))
+        events, _ = build.mirror_posters(events)
+        self.assertEqual(events[0].poster_path, events[1].poster_path)
+        self.assertEqual(len(self.api.requests), 1)
+
+    def test_concurrency_is_bounded(self):
+        self.api.delay = 0.1
+        self.mirror(*range(10))
+        self.assertGreater(self.api.max_active, 1)
+        self.assertLessEqual(self.api.max_active, build.POSTER_FETCH_WORKERS)
+
+    def test_304_reuses_existing_file(self):
+        first, _ = self.mirror(0, 1)
+        path = os.path.join(build.SITE_DIR, first[0].poster_path)
+        mtime = os.stat(path).st_mtime_ns
+        events, changed = self.mirror(0, 1)
+        self.assertEqual(changed, [])
+        self.assertTrue(all(event.poster_path for event in events))
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+        self.assertTrue(all('If-None-Match' in headers for _, headers in self.api.requests[-2:]))
+
+    def test_dropped_posters_are_evicted(self):
+        first, _ = self.mirror(0, 1, 2)
+        self.assertEqual(len(self.poster_files()), 3)
+        self.assertEqual(len(self.cache_entries()), 6)
+        events, changed = self.mirror(1)
+        self.assertEqual(self.poster_files(), [os.path.basename(events[0].poster_path)])
+        # Evicted posters are listed so the deploy deletes them too
+        self.assertEqual(sorted(changed), sorted(first[i].poster_path for i in (0, 2)))
+        key = os.path.basename(build._http_cache_paths(events[0].poster_url_raw, build.POSTER_CACHE)[0])[:-5]
+        self.assertEqual(self.cache_entries(), [f'{key}.body', f'{key}.json'])
+
+    def test_fallback_or_empty_list_evicts_nothing(self):
+        self.mirror(0, 1)
+        files, entries = self.poster_files(), self.cache_entries()
+        # A stale list from the cache, and an empty one, say nothing about
+        # which posters are gone
+        self.mirror(1, evict=False)
+        self.mirror()
+        self.assertEqual((self.poster_files(), self.cache_entries()), (files, entries))
+        # Posters kept through a fallback are still evicted once the API
+        # really drops them
+        self.mirror(1)
+        self.assertEqual(len(self.poster_files()), 1)
+
+    def test_failed_poster_keeps_its_mirrored_file(self):
+        first, _ = self.mirror(0, 1)
+        # No cached copy to fall back on, only the mirrored file
+        shutil.rmtree(os.path.join(build.CACHE_DIR, build.POSTER_CACHE))
+        self.api.failing.add('/api/uploads/posters/0.png')
+        events, changed = self.mirror(0, 1)
+        self.assertEqual([event.poster_path for event in events], [event.poster_path for event in first])
+        self.assertEqual(changed, [])
+        self.assertEqual(len(self.poster_files()), 2)
+
+    def test_unreachable_poster_keeps_remote_url(self):
+        self.api.failing.add('/api/uploads/posters/3.png')
+        events, _ = self.mirror(3)
+        self.assertEqual(events[0].poster_path, '')
+        self.assertEqual(events[0].poster_url_raw, self.api.url('/api/uploads/posters/3.png'))
+
+    def test_cached_poster_survives_outage(self):
+        first, _ = self.mirror(0)
+        self.api.stop()
+        events, changed = self.mirror(0)
+        self.assertEqual((events[0].poster_path, changed), (first[0].poster_path, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Saturday selection from the event index, against a frozen build date."""
+
+import contextlib
+import io
+import unittest
+from datetime import date
+
+import build
+
+
+def _events(*items):
+    return build.normalize_events({'title': title, 'startsAt': starts_at} for title, starts_at in items)
+
+
+def _details(index):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return build.saturday_details(index)
+
+
+EVENTS = _events(
+    ('Free State Saturday — September', '2026-09-05T21:00:00.000Z'),
+    ('Dinner Talk', '2026-10-21T01:30:00.000Z'),
+    ('Free State SATURDAY — November', '2026-11-07T21:00:00.000Z'),
+    # 10:00 AM Eastern on the frozen date
+    ('Free State Saturday — Brunch', '2026-10-17T14:00:00.000Z'),
+    ('Free State Saturday — December', '2026-12-05T21:00:00.000Z'),
+)
+
+
+class NextFirstSaturdayTest(unittest.TestCase):
+    def test_first_saturday_itself(self):
+        self.assertEqual(build.next_first_saturday(date(2026, 11, 7)), date(2026, 11, 7))
+
+    def test_day_after_first_saturday(self):
+        self.assertEqual(build.next_first_saturday(date(2026, 11, 8)), date(2026, 12, 5))
+
+    def test_month_starting_on_saturday(self):
+        self.assertEqual(build.next_first_saturday(date(2026, 7, 5)), date(2026, 8, 1))
+        self.assertEqual(build.next_first_saturday(date(2026, 8, 1)), date(2026, 8, 1))
+        self.assertEqual(build.next_first_saturday(date(2026, 8, 2)), date(2026, 9, 5))
+
+    def test_december_rolls_over_to_january(self):
+        self.assertEqual(build.next_first_saturday(date(2026, 12, 6)), date(2027, 1, 2))
+
+    def test_first_saturdays(self):
+        saturdays = build.first_saturdays(date(2026, 12, 6))
+        self.assertEqual([next(saturdays) for _ in range(3)], [date(2027, 1, 2), date(2027, 2, 6), date(2027, 3, 6)])
+
+
+class SeriesIndexTest(unittest.TestCase):
+    def test_split_at_build_date(self):
+        index = build.index_events(EVENTS, date(2026, 10, 17))
+        self.assertEqual(index.today, date(2026, 10, 17))
+        # An event earlier on the build date still counts as upcoming
+        self.assertEqual(index.upcoming[0].title_raw, 'Free State Saturday — Brunch')
+        self.assertEqual([event.title_raw for event in index.past], ['Free State Saturday — September'])
+
+    def test_series_events(self):
+        index = build.index_events(EVENTS, date(2026, 10, 17))
+        self.assertEqual([event.title_raw for event in build.series_events(index, 'saturday', 2)],
+                         ['Free State Saturday — Brunch', 'Free State SATURDAY — November'])
+        self.assertEqual(len(build.series_events(index, 'saturday')), 3)
+        self.assertEqual([event.title_raw for event in build.series_events(index, 'saturday', after=date(2026, 11, 8))],
+                         ['Free State Saturday — December'])
+        self.assertEqual(build.series_events(index, 'saturday', after=date(2027, 1, 1)), ())
+
+    def test_past_saturday_never_wins(self):
+        # The September event is listed first but is already past
+        index = build.index_events(EVENTS, date(2026, 9, 6))
+        self.assertEqual(build.next_in_series(index, 'saturday').title_raw, 'Free State Saturday — Brunch')
+
+
+class SaturdayDetailsTest(unittest.TestCase):
+    def test_api_saturday_wins_over_fallback(self):
+        # The fallback would be Saturday, November 7; the API event is sooner
+        details = _details(build.index_events(EVENTS, date(2026, 10, 18)))
+        self.assertEqual(details['date_str'], 'Saturday, November 7, 2026')
+        details = _details(build.index_events(EVENTS, date(2026, 10, 17)))
+        self.assertEqual(details['date_str'], 'Saturday, October 17, 2026')
+
+    def test_fallback_when_no_saturday_is_upcoming(self):
+        details = _details(build.index_events(EVENTS, date(2026, 12, 6)))
+        self.assertEqual(details, {'date_str': 'Saturday, January 2, 2027', 'rsvp_url': '', 'address': '',
+                                   'poster_url': '', 'poster_path': ''})
+
+    def test_fallback_without_events(self):
+        details = _details(build.index_events((), date(2026, 8, 1)))
+        self.assertEqual(details['date_str'], 'Saturday, August 1, 2026')
+
+
+if __name__ == '__main__':
+    unittest.main()
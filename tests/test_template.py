@@ -0,0 +1,88 @@
+"""The compiled Template against the chained str.replace rendering it replaced."""
+
+import os
+import unittest
+
+import build
+
+BASE_HTML = os.path.join(build.TEMPLATE_DIR, 'base.html')
+
+
+def replace_render(base, page_title, page_description, og_title, page_content,
+                   page_scripts='', active_nav=None, is_subdir=False, base_path=None,
+                   og_url='', og_image='', noindex=False, footer=None):
+    """build_page() as it was before templates were compiled: one full
+    str.replace pass per placeholder (plus head_assets, added since)."""
+    html = base
+    html = html.replace('{{page_title}}', page_title)
+    html = html.replace('{{page_description}}', page_description)
+    noindex_tag = '\n    <meta name="robots" content="noindex, nofollow">' if noindex else ''
+    html = html.replace('\n    {{noindex_tag}}', noindex_tag)
+    html = html.replace('{{og_title}}', og_title)
+    html = html.replace('{{og_url}}', og_url or build.BASE_URL)
+    html = html.replace('{{canonical_url}}', og_url or build.BASE_URL)
+    og_image_tag = f'<meta property="og:image" content="{build.BASE_URL}{og_image or "/img/og-default.png"}">'
+    html = html.replace('{{og_image_tag}}', og_image_tag)
+    html = html.replace('{{head_assets}}', build.HEAD_ASSETS_PLACEHOLDER)
+    html = html.replace('{{page_content}}', page_content)
+    html = html.replace('{{page_scripts}}', page_scripts)
+    html = html.replace('{{base}}', base_path if base_path is not None else ('..' if is_subdir else '.'))
+    for nav in ['about', 'events']:
+        html = html.replace(f'{{{{nav_{nav}_class}}}}', 'nav-active' if active_nav == nav else 'text-dark-200')
+    if footer:
+        html = html.replace('{{footer_name}}', footer.get('name', 'Free State Party'))
+        html = html.replace('{{footer_location}}', footer.get('location', 'New Hampshire'))
+    return html
+
+
+CONTENT = '''<section class="px-6 py-24">
+        <h1 class="font-display text-4xl">About</h1>
+        <p>Not a nonprofit. Not a political party.</p>
+    </section>'''
+FOOTER = {'name': 'Free State Party', 'location': 'Manchester, New Hampshire'}
+
+# Arguments like the ones the page renderers pass
+PAGES = [
+    dict(page_title='Free State Party', page_description='A private club.', og_title='Free State Party',
+         page_content=CONTENT, page_scripts='<script>cycle();</script>', base_path='.', footer=FOOTER),
+    dict(page_title='About — Free State Party', page_description='Not a nonprofit.', og_title='About',
+         page_content=CONTENT, active_nav='about', is_subdir=True, og_url='https://freestate.party/about/',
+         footer=FOOTER),
+    dict(page_title='Events', page_description='Upcoming events.', og_title='Events', page_content=CONTENT,
+         active_nav='events', base_path='../..', og_url='https://freestate.party/events/page/2/',
+         og_image='/img/events/abc.png', footer=FOOTER),
+    dict(page_title='Business', page_description='Business information.', og_title='Business',
+         page_content=CONTENT, is_subdir=True, noindex=True, footer=FOOTER),
+    dict(page_title='RSVP', page_description='', og_title='RSVP', page_content='', base_path='../..',
+         noindex=True, footer=FOOTER),
+]
+
+
+class TemplateTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.source = build.read_file(BASE_HTML)
+        cls.template = build.load_template(BASE_HTML)
+
+    def test_matches_replace_rendering(self):
+        for kwargs in PAGES:
+            with self.subTest(page=kwargs['page_title']):
+                self.assertEqual(build.build_page(self.template, **kwargs), replace_render(self.source, **kwargs))
+
+    def test_injected_content_is_not_rescanned(self):
+        html = build.build_page(self.template, 'T', 'D', 'O', '<p>{{base}} {{page_title}}</p>', is_subdir=True)
+        self.assertIn('<p>{{base}} {{page_title}}</p>', html)
+
+    def test_metadata_is_escaped(self):
+        html = build.build_page(self.template, 'Q&A <live>', 'Say "hi"', 'O', '<p>x</p>')
+        self.assertIn('<title>Q&amp;A &lt;live&gt;</title>', html)
+        self.assertIn('content="Say &quot;hi&quot;"', html)
+        self.assertIn('<p>x</p>', html)
+
+    def test_missing_slot_raises(self):
+        with self.assertRaises(KeyError):
+            build.Template('{{a}}{{b}}').render({'a': ''})
+
+
+if __name__ == '__main__':
+    unittest.main()